@@ -11,30 +11,210 @@ All rights reserved.
 원본 출처: https://github.com/Gaon/portfolio-code-analyzer
 """
 import click
+import os
 import sys
-import io
+import time
+from itertools import chain, islice
 from pathlib import Path
-from code_analyzer import CodeAnalyzer
-from reporter import ReportGenerator
-from colorama import init, Fore, Style
+from typing import TYPE_CHECKING
+from cli_options import CACHE_OPTIONS, FILE_SELECTION_OPTIONS, apply_options
+from code_analyzer import ANALYZER_VERSION, CodeAnalyzer
+from console import configure_console_encoding
+from formatters import WRITERS, StreamWriter
+from profiling import Profiler
+from result_cache import default_cache_dir
 
-# Windows에서 인코딩 및 colorama 초기화
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-init(autoreset=True)
+if TYPE_CHECKING:
+    from watcher import Watcher
+
+# Windows에서 인코딩 초기화
+configure_console_encoding()
+
+
+class _NoColor:
+    """터미널이 아닐 때 colorama의 Fore/Style 대신 쓰는 빈 색상 코드"""
+    
+    def __getattr__(self, name: str) -> str:
+        return ''
+
+
+Fore = Style = _NoColor()
+
+
+def init_colors():
+    """터미널 출력일 때만 colorama를 불러와 초기화"""
+    global Fore, Style
+    if not sys.stdout.isatty():
+        return
+    from colorama import init, Fore as ColorFore, Style as ColorStyle
+    init(autoreset=True)
+    Fore, Style = ColorFore, ColorStyle
+
+
+def run_analysis(analyzer: CodeAnalyzer, writer: StreamWriter = None,
+                 file_results: list = None) -> dict:
+    """분석을 실행하며 터미널이면 진행 상황 표시
+    
+    writer가 있으면 파일별 결과를 바로 기록하고 이슈 목록은 메모리에 쌓지 않습니다.
+    file_results가 있으면 파일별 결과를 모읍니다 (감시 모드).
+    """
+    show_progress = sys.stderr.isatty()
+    done = 0
+    last_update = 0.0
+    if writer:
+        writer.begin()
+    for kind, payload in analyzer.analyze_iter(retain_issues=writer is None):
+        if kind == 'summary':
+            if show_progress and done:
+                print(file=sys.stderr)
+            if writer:
+                writer.end(payload)
+            return payload
+        
+        done += 1
+        if writer:
+            writer.write_file(payload)
+        if file_results is not None:
+            file_results.append(payload)
+        now = time.monotonic()
+        if show_progress and now - last_update >= 0.1:
+            last_update = now
+            total = analyzer.analysis_results['files_analyzed']
+            print(f"\r  진행: {done}/{total} {payload['file'][-50:]:<50}",
+                  end='', file=sys.stderr, flush=True)
+
+
+def write_report(results: dict, file_results: list, output_format: str, output: str,
+                 page_size: int = 0, split_by_directory: bool = False):
+    """전체 결과로 리포트를 다시 기록 (스트리밍 형식은 임시 파일에 쓴 뒤 교체)"""
+    if output_format == 'html':
+        from reporter import ReportGenerator
+        
+        ReportGenerator(results).generate_html(output, page_size=page_size,
+                                               split_by_directory=split_by_directory)
+        return
+    
+    temp_output = f'{output}.tmp'
+    with open(temp_output, 'w', encoding='utf-8') as stream:
+        writer = WRITERS[output_format](stream, ANALYZER_VERSION)
+        writer.begin()
+        for file_result in file_results:
+            writer.write_file(file_result)
+        writer.end(results)
+    os.replace(temp_output, output)
+
+
+def watch_changes(watcher: 'Watcher', output_format: str, output: str,
+                  page_size: int, split_by_directory: bool):
+    """파일이 바뀔 때마다 다시 분석하고 리포트를 갱신 (Ctrl+C로 종료)"""
+    print(f"{Fore.YELLOW}파일 변경 감시 중... (종료: Ctrl+C){Style.RESET_ALL}")
+    
+    def on_update(results, changed, deleted):
+        started = time.perf_counter()
+        write_report(results, watcher.file_results, output_format, output,
+                     page_size, split_by_directory)
+        elapsed = (time.perf_counter() - started) * 1000
+        names = [path.name for path in changed] + [f'-{path.name}' for path in deleted]
+        shown = ', '.join(names[:3]) + (f' 외 {len(names) - 3}개' if len(names) > 3 else '')
+        print(f"[{time.strftime('%H:%M:%S')}] {shown} → "
+              f"점수 {results.get('overall_score', 0)}점 ({results.get('grade', 'F')}), "
+              f"이슈 {sum(results['issue_counts'].values())}개 "
+              f"(분석 {watcher.last_refresh * 1000:.0f}ms, 리포트 {elapsed:.0f}ms)")
+    
+    try:
+        watcher.watch(on_update)
+    except KeyboardInterrupt:
+        print(f"\n{Fore.GREEN}감시를 종료합니다.{Style.RESET_ALL}")
+
+
+def print_hotspots(hotspots: dict):
+    """가장 먼저 살펴볼 파일과 함수 출력 (전체 순위는 리포트에 있음)
+    
+    파일은 변경 빈도 가중 점수 순위를, git 기록이 없으면 복잡도 순위를 출력합니다.
+    """
+    if not hotspots.get('top'):
+        return
+    files = hotspots['files']
+    if files['churn']:
+        print(f"\n{Fore.CYAN}핫스팟 파일 (복잡도 × 최근 커밋 수):{Style.RESET_ALL}")
+        for item in files['churn']:
+            print(f"  {item['score']:>8,}  {item['file']} "
+                  f"(복잡도 {item['complexity']}, 커밋 {item['commits']}회)")
+    elif files['complexity']:
+        print(f"\n{Fore.CYAN}핫스팟 파일 (복잡도):{Style.RESET_ALL}")
+        for item in files['complexity']:
+            print(f"  {item['score']:>8,}  {item['file']} ({item['lines']:,}줄)")
+    functions = hotspots['functions']['complexity']
+    if functions:
+        print(f"\n{Fore.CYAN}복잡한 함수:{Style.RESET_ALL}")
+        for item in functions:
+            print(f"  {item['score']:>8,}  {item['name']} ({item['file']}:{item['line']}, "
+                  f"{item['length']}줄)")
+
+
+def _format_megabytes(size: int) -> str:
+    if size < 1024 * 1024:
+        return f"{size / 1024:,.1f}KB"
+    return f"{size / (1024 * 1024):,.1f}MB"
 
 
 @click.command()
 @click.argument('target_path', type=click.Path(exists=True))
-@click.option('-o', '--output', default='report.html', help='리포트 출력 파일명')
+@click.option('-o', '--output', default=None,
+              help='리포트 출력 파일명 (기본: report.html 또는 report.<형식>)')
+@click.option('-f', '--format', 'output_format', default='html', show_default=True,
+              type=click.Choice(['html', *WRITERS]),
+              help='리포트 형식 (ndjson/json/sarif는 분석하면서 바로 기록)')
+@click.option('--page-size', default=0, type=click.IntRange(min=0), show_default=True,
+              help='HTML 리포트의 이슈를 이 개수씩 별도 페이지로 분할 (0이면 한 페이지)')
+@click.option('--split-by-directory', is_flag=True,
+              help='HTML 리포트의 이슈를 디렉토리별 페이지로 분할')
 @click.option('--detailed', is_flag=True, help='상세 분석 모드')
-def main(target_path, output, detailed):
+@apply_options(FILE_SELECTION_OPTIONS)
+@click.option('-j', '--jobs', default=1, type=click.IntRange(min=0), show_default=True,
+              help='병렬 분석 프로세스 수 (0이면 CPU 코어 수)')
+@apply_options(CACHE_OPTIONS)
+@click.option('--since', metavar='REF', default=None,
+              help='REF 커밋 이후 바뀐 파일만 다시 분석 (나머지는 저장된 결과 사용)')
+@click.option('--rev', 'revision', metavar='REV', default=None,
+              help='작업 트리 대신 git 커밋 REV의 파일을 체크아웃 없이 분석')
+@click.option('--profile', is_flag=True, help='단계별 시간과 가장 느린 파일 출력')
+@click.option('--profile-top', default=10, type=click.IntRange(min=1), show_default=True,
+              help='--profile에서 출력할 느린 파일 수')
+@click.option('--profile-output', type=click.Path(dir_okay=False), default=None,
+              help='cProfile 결과 저장 경로 (--profile과 함께 사용, 메인 프로세스만 측정)')
+@click.option('--low-memory', is_flag=True,
+              help='저메모리 모드 (이슈를 임시 파일로 내보내고 작업자 결과를 조금씩만 받음)')
+@click.option('--max-memory', metavar='MB', default=None, type=click.IntRange(min=1),
+              help='메인 프로세스 메모리 상한 (MB, 넘으면 이슈와 중복 색인을 줄임, --low-memory 포함)')
+@click.option('--trace-memory', metavar='N', default=0, type=click.IntRange(min=0),
+              help='tracemalloc으로 메모리를 가장 많이 할당한 위치 N개 출력 (느려짐)')
+@click.option('--hotspots', default=10, type=click.IntRange(min=0), show_default=True,
+              help='복잡도, 길이, 이슈 밀도, 변경 빈도별로 보고할 상위 파일/함수 수 (0이면 생략)')
+@click.option('--watch', is_flag=True,
+              help='파일이 바뀔 때마다 바뀐 파일만 다시 분석하고 리포트를 갱신 (Ctrl+C로 종료)')
+@click.option('--watch-interval', default=1.0, type=click.FloatRange(min=0.05), show_default=True,
+              help='--watch에서 파일 변경을 확인하는 간격 (초)')
+def main(target_path, output, output_format, page_size, split_by_directory, detailed,
+         ignore_patterns, no_gitignore, jobs,
+         cache_dir, cache_size, no_cache, since, revision, max_file_size,
+         profile, profile_top, profile_output, low_memory, max_memory, trace_memory,
+         hotspots, watch, watch_interval):
     """
     포트폴리오 코드 품질 검증기
     
     TARGET_PATH: 분석할 코드 경로 (파일 또는 디렉토리)
     """
+    # 옵션 조합은 분석기를 만들고 프로파일러를 시작하기 전에 확인
+    if revision and (since or watch):
+        raise click.UsageError('--rev는 --since, --watch와 함께 사용할 수 없습니다.')
+    if watch:
+        from archive_source import is_archive
+        
+        if is_archive(Path(target_path)):
+            raise click.UsageError('압축 파일은 감시할 수 없습니다.')
+    
+    init_colors()
     print(f"\n{Fore.CYAN}{'='*60}")
     print(f"{Fore.CYAN}포트폴리오 코드 품질 검증기")
     print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
@@ -42,10 +222,38 @@ def main(target_path, output, detailed):
     try:
         # 분석 시작
         print(f"{Fore.YELLOW}분석 중...{Style.RESET_ALL}")
-        print(f"대상: {target_path}\n")
+        print(f"대상: {target_path}" + (f" (커밋 {revision})" if revision else "") + "\n")
         
-        analyzer = CodeAnalyzer(target_path)
-        results = analyzer.analyze()
+        profiler = Profiler(profile_top, profile_output) if profile else None
+        analyzer = CodeAnalyzer(target_path, ignore_patterns=list(ignore_patterns),
+                                use_gitignore=not no_gitignore, jobs=jobs,
+                                cache_dir=None if no_cache else str(cache_dir or default_cache_dir()),
+                                cache_max_bytes=cache_size * 1024 * 1024, since=since,
+                                max_file_size=max_file_size * 1024, profiler=profiler,
+                                low_memory=low_memory,
+                                memory_limit=max_memory * 1024 * 1024 if max_memory else None,
+                                trace_allocations=trace_memory, revision=revision,
+                                hotspots=hotspots)
+        analyzer.profiler.start()
+        watcher = None
+        if watch:
+            from watcher import Watcher
+            
+            watcher = Watcher(analyzer, watch_interval,
+                              retain_issues=output_format == 'html')
+        file_results = [] if watcher else None
+        if output_format == 'html':
+            output = output or 'report.html'
+            results = run_analysis(analyzer, file_results=file_results)
+        else:
+            writer_class = WRITERS[output_format]
+            output = output or f'report{writer_class.extension}'
+            with open(output, 'w', encoding='utf-8') as stream:
+                results = run_analysis(analyzer, writer_class(stream, ANALYZER_VERSION),
+                                       file_results)
+        if watcher:
+            watcher.track(file_results)
+            del file_results
         
         # 결과 출력
         print(f"\n{Fore.GREEN}✓ 분석 완료!{Style.RESET_ALL}\n")
@@ -54,6 +262,44 @@ def main(target_path, output, detailed):
         print(f"  • 총 코드 라인: {results['total_lines']:,}줄")
         print(f"  • 사용된 언어: {', '.join(results['languages'].keys()) or '없음'}")
         print(f"  • 평균 복잡도: {results['complexity']['avg']:.1f}")
+        function_complexity = results['metrics'].get('function_complexity', {})
+        if function_complexity.get('count'):
+            print(f"  • 함수 복잡도: 중앙값 {function_complexity['p50']:.0f}, "
+                  f"상위 10% {function_complexity['p90']:.0f}, 상위 1% {function_complexity['p99']:.0f} "
+                  f"({function_complexity['count']:,}개 함수)")
+        if results['skipped_files']:
+            print(f"  • 분석 제외 파일: {len(results['skipped_files'])}개 "
+                  f"(바이너리, 압축, 자동 생성, 크기 초과 - 줄 수만 집계)")
+        duplicates = results['duplicates']
+        if duplicates['blocks']:
+            print(f"  • 중복 코드: {duplicates['blocks']}개 블록, {duplicates['duplicated_lines']:,}줄")
+        if results['identical_files']:
+            print(f"  • 동일한 파일: {results['identical_files']}개 (한 번만 분석하고 결과 공유)")
+        if results['vendored']:
+            print(f"  {Fore.YELLOW}• 복사된 것으로 보이는 디렉토리 (--ignore로 제외 가능):{Style.RESET_ALL}")
+            for vendored in results['vendored']:
+                print(f"      {vendored['directory']}/ ≈ {vendored['original']}/ "
+                      f"(유사도 {vendored['similarity']:.0%}, {vendored['files']}개 파일)")
+        
+        memory = results['memory']
+        if memory['peak_rss']:
+            line = f"  • 최대 메모리: {_format_megabytes(memory['peak_rss'])}"
+            if memory['children_peak_rss']:
+                line += f" (자식 프로세스 최대 {_format_megabytes(memory['children_peak_rss'])})"
+            if memory['limit']:
+                line += f", 상한 {_format_megabytes(memory['limit'])}"
+            print(line)
+        if memory['spilled_issues']:
+            print(f"  • 임시 파일로 내보낸 이슈: {memory['spilled_issues']:,}개")
+        
+        incremental = results.get('incremental')
+        if incremental:
+            if incremental['base_found']:
+                print(f"  • 증분 분석: {incremental['reanalyzed']}개 재분석, "
+                      f"{incremental['reused']}개 재사용 (기준 {incremental['base'][:10]})")
+            else:
+                print(f"  {Fore.YELLOW}• 기준 커밋 {incremental['base'][:10]}의 저장된 결과가 없어 "
+                      f"전체를 분석했습니다.{Style.RESET_ALL}")
         
         # 점수 출력
         score = results.get('overall_score', 0)
@@ -72,16 +318,18 @@ def main(target_path, output, detailed):
         print(f"  {score_color}점수: {score}점{Style.RESET_ALL}")
         print(f"  {score_color}등급: {grade}{Style.RESET_ALL}\n")
         
-        # 이슈 요약
-        all_issues = []
-        all_issues.extend(results.get('issues', []))
-        all_issues.extend(results.get('readability', {}).get('issues', []))
-        all_issues.extend(results.get('structure', {}).get('issues', []))
+        # 이슈 요약 (저메모리 모드의 이슈 목록은 임시 파일에 있으므로 복사하지 않고 순회)
+        issue_lists = [results.get('issues', []),
+                       results.get('readability', {}).get('issues', []),
+                       results.get('structure', {}).get('issues', []),
+                       results.get('duplicates', {}).get('issues', [])]
+        total_issues = sum(len(issues) for issues in issue_lists)
         
-        if all_issues:
-            high_count = sum(1 for i in all_issues if i.get('severity') == 'high')
-            medium_count = sum(1 for i in all_issues if i.get('severity') == 'medium')
-            low_count = sum(1 for i in all_issues if i.get('severity') == 'low')
+        issue_counts = results['issue_counts']
+        if total_issues or any(issue_counts.values()):
+            high_count = issue_counts['high']
+            medium_count = issue_counts['medium']
+            low_count = issue_counts['low']
             
             print(f"{Fore.CYAN}발견된 이슈:{Style.RESET_ALL}")
             if high_count > 0:
@@ -93,19 +341,29 @@ def main(target_path, output, detailed):
         else:
             print(f"{Fore.GREEN}발견된 이슈 없음!{Style.RESET_ALL}")
         
-        # 리포트 생성
-        print(f"\n{Fore.YELLOW}리포트 생성 중...{Style.RESET_ALL}")
-        reporter = ReportGenerator(results)
-        report_path = reporter.generate_html(output)
+        print_hotspots(results['hotspots'])
+        
+        # 리포트 생성 (스트리밍 형식은 분석하면서 이미 기록됨)
+        if output_format == 'html':
+            from reporter import ReportGenerator
+            
+            print(f"\n{Fore.YELLOW}리포트 생성 중...{Style.RESET_ALL}")
+            with analyzer.profiler.phase('report'):
+                reporter = ReportGenerator(results)
+                report_path = reporter.generate_html(output, page_size=page_size,
+                                                     split_by_directory=split_by_directory)
+        else:
+            report_path = str(Path(output).absolute())
+        analyzer.profiler.stop()
         
         print(f"\n{Fore.GREEN}✓ 리포트 생성 완료!{Style.RESET_ALL}")
         print(f"{Fore.CYAN}리포트 위치: {report_path}{Style.RESET_ALL}\n")
         
         # 상세 모드
-        if detailed and all_issues:
+        if detailed and total_issues:
             print(f"\n{Fore.CYAN}상세 이슈 목록:{Style.RESET_ALL}")
             print("-" * 60)
-            for issue in all_issues[:20]:  # 최대 20개만 표시
+            for issue in islice(chain.from_iterable(issue_lists), 20):  # 최대 20개만 표시
                 severity = issue.get('severity', 'low')
                 if severity == 'high':
                     severity_color = Fore.RED
@@ -116,13 +374,32 @@ def main(target_path, output, detailed):
                 
                 print(f"\n{severity_color}[{severity.upper()}]{Style.RESET_ALL} {issue.get('file', 'Unknown')}")
                 print(f"  {issue.get('message', 'No message')}")
-            if len(all_issues) > 20:
-                print(f"\n{Fore.YELLOW}... 외 {len(all_issues) - 20}개 이슈 더 있음{Style.RESET_ALL}")
+            if total_issues > 20:
+                print(f"\n{Fore.YELLOW}... 외 {total_issues - 20}개 이슈 더 있음{Style.RESET_ALL}")
+        
+        # 메모리를 가장 많이 할당한 위치
+        top_allocations = results['memory'].get('top_allocations')
+        if top_allocations:
+            print(f"\n{Fore.CYAN}메모리 할당 상위 위치 (메인 프로세스):{Style.RESET_ALL}")
+            for allocation in top_allocations:
+                print(f"  {_format_megabytes(allocation['size']):>10}  "
+                      f"{allocation['count']:>8,}개  {allocation['location']}")
+        
+        # 프로파일 결과
+        if profiler:
+            print(f"\n{Fore.CYAN}프로파일:{Style.RESET_ALL}")
+            for line in profiler.report_lines():
+                print(f"  {line}")
+            if profile_output:
+                print(f"  cProfile 결과: {Path(profile_output).absolute()}")
         
         print(f"\n{Fore.GREEN}{'='*60}")
         print(f"{Fore.GREEN}분석 완료!")
         print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}\n")
         
+        if watcher:
+            watch_changes(watcher, output_format, output, page_size, split_by_directory)
+        
     except Exception as e:
         print(f"\n{Fore.RED}오류 발생: {str(e)}{Style.RESET_ALL}")
         sys.exit(1)
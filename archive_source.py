@@ -0,0 +1,184 @@
+"""
+압축 파일 분석 소스
+zip/tar 압축 파일을 디스크에 풀지 않고 멤버를 스트림으로 읽습니다.
+디렉토리와 같은 기준(확장자, 숨김/제외 디렉토리, --ignore, .gitignore)으로
+분석할 파일을 고릅니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import posixpath
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional, Tuple
+
+from file_walker import LANGUAGE_EXTENSIONS, IgnoreRules, is_excluded_name, walk_order
+
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path: Path) -> bool:
+    """압축 파일 분석 대상인지 확인 (확장자 기준)"""
+    return path.is_file() and path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _normalize(name: str) -> str:
+    """멤버 이름을 './'와 앞쪽 '/'가 없는 POSIX 상대 경로로 변환 (밖을 가리키면 빈 문자열)"""
+    name = posixpath.normpath(name.replace('\\', '/')).lstrip('/')
+    if name in ('', '.') or name == '..' or name.startswith('../'):
+        return ''
+    return name
+
+
+class ArchiveMember:
+    """분석할 압축 파일 멤버 하나"""
+
+    __slots__ = ('name', 'size', '_source', '_info')
+
+    def __init__(self, source: 'ArchiveSource', name: str, size: int, info):
+        self.name = name
+        self.size = size
+        self._source = source
+        self._info = info
+
+    def open(self) -> IO[bytes]:
+        """멤버 내용을 읽는 바이너리 스트림"""
+        return self._source._open_member(self._info)
+
+    @property
+    def content_id(self) -> Optional[str]:
+        """내용을 읽지 않고 알 수 있는 내용 식별자 (git blob ID 등, 없으면 None)"""
+        return self._source._content_id(self._info)
+
+
+class ArchiveSource:
+    """zip/tar 압축 파일
+
+    디렉토리를 분석한 결과와 파일 순서(중복 코드의 원본 위치 등)가 같도록
+    멤버를 FileWalker 순서로 돌려줍니다. 압축된 tar는 뒤로 되돌아가 읽을 때마다
+    처음부터 다시 풀어야 하므로, 한 번 푼 내용을 임시 파일에 두고 읽습니다.
+    """
+
+    def __init__(self, path: Path):
+        # 압축 파일을 분석할 때만 불러옴 (git 커밋 분석 소스도 이 클래스를 상속)
+        import tarfile
+        import zipfile
+        
+        self.path = Path(path)
+        self._zip = self._tar = self._spool = None
+        if zipfile.is_zipfile(self.path):
+            self._zip = zipfile.ZipFile(self.path)
+            return
+        try:
+            self._tar = tarfile.open(self.path, mode='r:')
+        except tarfile.ReadError:
+            self._tar = self._open_compressed_tar(tarfile)
+
+    def _open_compressed_tar(self, tarfile):
+        """압축을 풀어 임시 파일에 둔 tar (멤버를 임의 순서로 읽을 수 있도록)"""
+        import shutil
+        import tempfile
+
+        try:
+            with tarfile.open(self.path, mode='r:*') as tar:
+                self._spool = tempfile.TemporaryFile(prefix='analyzer-tar-')
+                tar.fileobj.seek(0)
+                shutil.copyfileobj(tar.fileobj, self._spool)
+            self._spool.seek(0)
+            return tarfile.open(fileobj=self._spool, mode='r:')
+        except (tarfile.TarError, EOFError, OSError):
+            self.close()
+            raise ValueError(f"zip 또는 tar 형식의 압축 파일이 아닙니다: {self.path}")
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def __enter__(self) -> 'ArchiveSource':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open_member(self, info) -> IO[bytes]:
+        if self._zip is not None:
+            return self._zip.open(info)
+        return self._tar.extractfile(info)
+
+    def _content_id(self, info) -> Optional[str]:
+        return None
+
+    def _scan(self) -> Tuple[List[Tuple[str, int, object]], Dict[str, List[str]]]:
+        """(이름, 크기, 멤버 정보) 목록과 디렉토리별 .gitignore 내용 수집"""
+        files = []
+        gitignores = {}
+        if self._zip is not None:
+            members = ((info.filename, info.file_size, info) for info in self._zip.infolist()
+                       if not info.is_dir())
+        else:
+            members = ((info.name, info.size, info) for info in self._tar if info.isfile())
+
+        for raw_name, size, info in members:
+            name = _normalize(raw_name)
+            if not name:
+                continue
+            if posixpath.basename(name) == '.gitignore':
+                with self._open_member(info) as f:
+                    content = f.read().decode('utf-8', errors='ignore')
+                gitignores[posixpath.dirname(name)] = content.splitlines()
+            else:
+                files.append((name, size, info))
+
+        files.sort(key=lambda item: walk_order(item[0]))
+        return files, gitignores
+
+    def walk(self, ignore_patterns: Optional[Iterable[str]] = None,
+             use_gitignore: bool = True) -> List[Tuple[ArchiveMember, str]]:
+        """분석할 (멤버, 언어) 목록 (FileWalker와 같은 제외 기준)"""
+        files, gitignores = self._scan()
+        base_rules = IgnoreRules().extend(ignore_patterns or [])
+        if not use_gitignore:
+            gitignores = {}
+
+        # 디렉토리별 적용 규칙과 제외 여부 (상위 디렉토리부터 계산해 재사용)
+        rules_cache = {'': base_rules.extend(gitignores.get('', []))}
+        excluded_cache = {'': False}
+
+        def directory_state(rel_dir: str) -> Tuple[IgnoreRules, bool]:
+            if rel_dir in rules_cache:
+                return rules_cache[rel_dir], excluded_cache[rel_dir]
+            parent = posixpath.dirname(rel_dir)
+            parent_rules, parent_excluded = directory_state(parent)
+            excluded = (parent_excluded or is_excluded_name(posixpath.basename(rel_dir))
+                        or parent_rules.is_ignored(rel_dir, is_dir=True))
+            rules = parent_rules
+            if not excluded and rel_dir in gitignores:
+                rules = parent_rules.extend(gitignores[rel_dir], rel_dir)
+            rules_cache[rel_dir] = rules
+            excluded_cache[rel_dir] = excluded
+            return rules, excluded
+
+        selected = []
+        for name, size, info in files:
+            file_name = posixpath.basename(name)
+            if is_excluded_name(file_name):
+                continue
+            language = LANGUAGE_EXTENSIONS.get(posixpath.splitext(file_name)[1])
+            if not language:
+                continue
+            rules, excluded = directory_state(posixpath.dirname(name))
+            if excluded or rules.is_ignored(name):
+                continue
+            selected.append((ArchiveMember(self, name, size, info), language))
+        return selected
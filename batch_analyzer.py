@@ -0,0 +1,237 @@
+"""
+포트폴리오 코드 품질 검증기 - 일괄 분석 스크립트
+매니페스트에 나열된 여러 저장소를 한 프로세스에서 분석하고 저장소별
+점수를 요약표(CSV)로 저장합니다.
+
+    python batch_analyzer.py candidates.txt -o summary.csv -j 4 --reports-dir reports
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import csv
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import click
+
+from cli_options import CACHE_OPTIONS, FILE_SELECTION_OPTIONS, apply_options
+from code_analyzer import ANALYZER_VERSION, DEFAULT_MAX_FILE_SIZE, CodeAnalyzer, create_process_pool
+from console import configure_console_encoding
+from formatters import WRITERS
+from result_cache import DEFAULT_MAX_BYTES, default_cache_dir
+
+# Windows에서 인코딩 초기화
+configure_console_encoding()
+
+
+# 요약표 열 순서
+SUMMARY_COLUMNS = ('name', 'path', 'score', 'grade', 'files', 'lines', 'languages',
+                   'high', 'medium', 'low', 'skipped', 'seconds', 'error')
+
+
+def read_manifest(manifest_path: str) -> List[Tuple[str, Path]]:
+    """매니페스트에서 (이름, 경로) 목록 읽기
+
+    한 줄에 경로 하나를 적고, `이름 = 경로` 형식으로 이름을 붙일 수 있습니다.
+    빈 줄과 #으로 시작하는 줄은 무시하며, 상대 경로는 매니페스트 파일 기준입니다.
+    """
+    manifest = Path(manifest_path)
+    targets = []
+    used_names = set()
+    for line in manifest.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        name, separator, path = line.partition(' = ')
+        if not separator:
+            name, path = '', line
+        target = Path(path.strip()).expanduser()
+        if not target.is_absolute():
+            target = manifest.parent / target
+        name = name.strip() or target.resolve().name or 'root'
+
+        # 리포트 파일명이 겹치지 않도록 같은 이름에 번호를 붙임
+        unique = name
+        counter = 2
+        while unique in used_names:
+            unique = f'{name}-{counter}'
+            counter += 1
+        used_names.add(unique)
+        targets.append((unique, target))
+    return targets
+
+
+def _report_file_name(name: str, extension: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', name) + extension
+
+
+class BatchAnalyzer:
+    """여러 저장소를 작업자 풀 하나로 분석
+
+    작업자 프로세스와 결과 캐시를 모든 저장소가 공유하므로 저장소마다
+    인터프리터를 새로 띄우는 비용이 없습니다.
+    """
+
+    def __init__(self, targets: List[Tuple[str, Path]], jobs: int = 1,
+                 ignore_patterns: Optional[List[str]] = None, use_gitignore: bool = True,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 reports_dir: Optional[str] = None, report_format: str = 'html'):
+        self.targets = targets
+        self.reports_dir = Path(reports_dir) if reports_dir else None
+        self.report_format = report_format
+        self.analyzer_options = {
+            'ignore_patterns': list(ignore_patterns or []),
+            'use_gitignore': use_gitignore,
+            'jobs': jobs if jobs > 0 else (os.cpu_count() or 1),
+            'cache_dir': cache_dir,
+            'cache_max_bytes': cache_max_bytes,
+            'max_file_size': max_file_size
+        }
+
+    def run(self) -> Iterator[Dict]:
+        """저장소마다 분석이 끝나는 즉시 요약 행 생성"""
+        if self.reports_dir:
+            self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+        jobs = self.analyzer_options['jobs']
+        if jobs <= 1:
+            for name, path in self.targets:
+                yield self._analyze_target(name, path, None)
+            return
+
+        # 작업자의 파일 분석은 대상 경로와 무관하므로 설정만 같으면 됨
+        options = CodeAnalyzer('.', **self.analyzer_options)._worker_options()
+        with create_process_pool(jobs, options) as executor:
+            for name, path in self.targets:
+                yield self._analyze_target(name, path, executor)
+
+    def _analyze_target(self, name: str, path: Path, executor) -> Dict:
+        """저장소 하나를 분석해 요약 행 반환 (실패해도 다음 저장소는 계속 분석)"""
+        row = {column: '' for column in SUMMARY_COLUMNS}
+        row.update(name=name, path=str(path))
+        start = time.perf_counter()
+        try:
+            analyzer = CodeAnalyzer(str(path), executor=executor, **self.analyzer_options)
+            results = self._analyze(analyzer, name)
+        except Exception as e:
+            row['error'] = str(e)
+        else:
+            row.update(summary_row(results))
+        row['seconds'] = round(time.perf_counter() - start, 2)
+        return row
+
+    def _analyze(self, analyzer: CodeAnalyzer, name: str) -> Dict:
+        """분석하며 필요하면 저장소별 리포트 작성"""
+        if not self.reports_dir:
+            # 요약표에는 이슈 개수만 필요하므로 이슈 목록을 쌓지 않음
+            for kind, payload in analyzer.analyze_iter(retain_issues=False):
+                if kind == 'summary':
+                    return payload
+
+        if self.report_format == 'html':
+            from reporter import ReportGenerator
+
+            results = analyzer.analyze()
+            output = self.reports_dir / _report_file_name(name, '.html')
+            ReportGenerator(results).generate_html(str(output))
+            return results
+
+        writer_class = WRITERS[self.report_format]
+        output = self.reports_dir / _report_file_name(name, writer_class.extension)
+        try:
+            with open(output, 'w', encoding='utf-8') as stream:
+                writer = writer_class(stream, ANALYZER_VERSION)
+                writer.begin()
+                for kind, payload in analyzer.analyze_iter(retain_issues=False):
+                    if kind == 'summary':
+                        writer.end(payload)
+                        return payload
+                    writer.write_file(payload)
+        except Exception:
+            # 분석에 실패한 저장소의 불완전한 리포트는 남기지 않음
+            output.unlink(missing_ok=True)
+            raise
+
+
+def summary_row(results: Dict) -> Dict:
+    """전체 분석 결과에서 요약표 한 행의 값"""
+    languages = sorted(results['languages'].items(), key=lambda item: (-item[1], item[0]))
+    return {
+        'score': results.get('overall_score', 0),
+        'grade': results.get('grade', 'F'),
+        'files': results['files_analyzed'],
+        'lines': results['total_lines'],
+        'languages': ';'.join(f'{language}:{count}' for language, count in languages),
+        'high': results['issue_counts']['high'],
+        'medium': results['issue_counts']['medium'],
+        'low': results['issue_counts']['low'],
+        'skipped': len(results['skipped_files'])
+    }
+
+
+@click.command()
+@click.argument('manifest', type=click.Path(exists=True, dir_okay=False))
+@click.option('-o', '--output', default='summary.csv', show_default=True,
+              help='요약표(CSV) 저장 경로')
+@click.option('--reports-dir', type=click.Path(file_okay=False), default=None,
+              help='저장소별 리포트를 저장할 디렉토리 (지정하지 않으면 요약표만 작성)')
+@click.option('-f', '--format', 'report_format', default='html', show_default=True,
+              type=click.Choice(['html', *WRITERS]), help='저장소별 리포트 형식')
+@apply_options(FILE_SELECTION_OPTIONS)
+@click.option('-j', '--jobs', default=0, type=click.IntRange(min=0), show_default=True,
+              help='공유 작업자 프로세스 수 (0이면 CPU 코어 수)')
+@apply_options(CACHE_OPTIONS)
+def main(manifest, output, reports_dir, report_format, ignore_patterns, no_gitignore, jobs,
+         cache_dir, cache_size, no_cache, max_file_size):
+    """
+    여러 저장소 일괄 분석
+
+    MANIFEST: 분석할 경로 목록 파일 (한 줄에 하나, `이름 = 경로` 형식 가능)
+    """
+    targets = read_manifest(manifest)
+    if not targets:
+        print("매니페스트에 분석할 경로가 없습니다.")
+        sys.exit(1)
+
+    batch = BatchAnalyzer(targets, jobs=jobs, ignore_patterns=list(ignore_patterns),
+                          use_gitignore=not no_gitignore,
+                          cache_dir=None if no_cache else str(cache_dir or default_cache_dir()),
+                          cache_max_bytes=cache_size * 1024 * 1024,
+                          max_file_size=max_file_size * 1024,
+                          reports_dir=reports_dir, report_format=report_format)
+
+    failed = 0
+    with open(output, 'w', encoding='utf-8', newline='') as stream:
+        writer = csv.DictWriter(stream, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        for index, row in enumerate(batch.run(), 1):
+            writer.writerow(row)
+            stream.flush()
+            if row['error']:
+                failed += 1
+                print(f"[{index}/{len(targets)}] {row['name']}: 실패 - {row['error']}")
+            else:
+                print(f"[{index}/{len(targets)}] {row['name']}: {row['score']}점 ({row['grade']}), "
+                      f"{row['files']}개 파일, {row['seconds']}초")
+
+    print(f"\n요약표: {Path(output).absolute()}")
+    if reports_dir:
+        print(f"저장소별 리포트: {Path(reports_dir).absolute()}")
+    if failed:
+        print(f"분석 실패: {failed}개 저장소")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
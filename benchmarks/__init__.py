@@ -0,0 +1,13 @@
+"""
+성능 벤치마크
+분석기의 시작 시간과 단계별 처리 속도를 측정합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
@@ -0,0 +1,18 @@
+"""
+벤치마크 실행 진입점 (python -m benchmarks 는 단계별 벤치마크 실행)
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import sys
+
+from benchmarks.bench_phases import main
+
+
+sys.exit(main())
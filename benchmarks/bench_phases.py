@@ -0,0 +1,149 @@
+"""
+단계별 분석 벤치마크
+합성 저장소를 만들고 파일 수집, 읽기, ast.parse, 가독성 검사, 전체 분석,
+점수 계산, HTML 리포트 생성 시간을 각각 측정합니다.
+
+    python -m benchmarks.bench_phases --files 2000 --json head.json
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import argparse
+import ast
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.results import make_document, save_document, summarize_timings, time_phase
+from benchmarks.synthetic import SyntheticRepoConfig, generate_repository
+
+from code_analyzer import CodeAnalyzer
+from file_walker import LANGUAGE_EXTENSIONS
+from line_scanner import scan_text
+
+
+PHASES = ('collect', 'read', 'parse', 'readability', 'analyze', 'score', 'report')
+
+# 한 번 실행이 너무 짧아 반복해서 재는 단계의 반복 횟수
+SCORE_REPEAT = 1000
+
+
+def run_phases(root: Path, runs: int, phases=PHASES) -> Dict[str, Dict]:
+    """root 저장소에 대해 단계별 시간 측정"""
+    results = {}
+    analyzer = CodeAnalyzer(str(root))
+
+    files = analyzer._collect_code_files()
+    if 'collect' in phases:
+        results['collect'] = summarize_timings(
+            time_phase(analyzer._collect_code_files, runs), items=len(files))
+
+    def read_all() -> List[bytes]:
+        contents = []
+        for path in files:
+            with open(path, 'rb') as f:
+                contents.append(f.read())
+        return contents
+
+    contents = read_all()
+    if 'read' in phases:
+        results['read'] = summarize_timings(
+            time_phase(read_all, runs), items=len(files), bytes=sum(map(len, contents)))
+
+    texts = [(path, data.decode('utf-8', errors='ignore')) for path, data in zip(files, contents)]
+    python_sources = [text for path, text in texts if path.suffix == '.py']
+    if 'parse' in phases:
+        results['parse'] = summarize_timings(
+            time_phase(lambda: [ast.parse(text) for text in python_sources], runs),
+            items=len(python_sources))
+
+    if 'readability' in phases:
+        def check_readability():
+            for path, text in texts:
+                file_result = analyzer._new_file_result(path)
+                analyzer._check_readability(path, scan_text(text),
+                                            LANGUAGE_EXTENSIONS[path.suffix], file_result)
+        results['readability'] = summarize_timings(
+            time_phase(check_readability, runs), items=len(texts))
+
+    # 점수 계산과 리포트는 전체 분석 결과가 필요하므로 마지막 분석기를 사용
+    analyzed = {}
+
+    def analyze():
+        analyzed['analyzer'] = CodeAnalyzer(str(root))
+        analyzed['analyzer'].analyze()
+
+    if 'analyze' in phases:
+        results['analyze'] = summarize_timings(time_phase(analyze, runs), items=len(files))
+    if not analyzed and ('score' in phases or 'report' in phases):
+        analyze()
+    final = analyzed.get('analyzer')
+
+    if 'score' in phases:
+        def score():
+            for _ in range(SCORE_REPEAT):
+                final._calculate_overall_score()
+        results['score'] = summarize_timings(time_phase(score, runs), repeat=SCORE_REPEAT)
+
+    if 'report' in phases:
+        from reporter import ReportGenerator
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = str(Path(output_dir) / 'report.html')
+            report = ReportGenerator(final.analysis_results)
+            results['report'] = summarize_timings(
+                time_phase(lambda: report.generate_html(output_path), runs),
+                items=len(final.analysis_results['issues']) +
+                len(final.analysis_results['readability']['issues']) +
+                len(final.analysis_results['structure']['issues']))
+
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='단계별 분석 벤치마크')
+    parser.add_argument('--files', type=int, default=500, help='합성 저장소의 코드 파일 수')
+    parser.add_argument('--lines', type=int, default=120, help='파일당 평균 줄 수')
+    parser.add_argument('--depth', type=int, default=3, help='최대 디렉토리 깊이')
+    parser.add_argument('--noise-files', type=int, default=200, help='제외 디렉토리 파일 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--runs', type=int, default=5, help='단계별 측정 반복 횟수')
+    parser.add_argument('--phase', dest='phases', action='append', choices=PHASES,
+                        help='측정할 단계 (여러 번 지정 가능, 기본값: 전체)')
+    parser.add_argument('--repo', default=None,
+                        help='합성 저장소 대신 측정할 기존 디렉토리')
+    parser.add_argument('--json', dest='json_path', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    config = SyntheticRepoConfig(files=args.files, lines_per_file=args.lines,
+                                 depth=args.depth, noise_files=args.noise_files,
+                                 seed=args.seed)
+    phases = tuple(args.phases or PHASES)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if args.repo:
+            root = Path(args.repo)
+            document_config = {'repo': str(root.resolve()), 'runs': args.runs}
+        else:
+            root = Path(work_dir) / 'repo'
+            generate_repository(root, config)
+            document_config = {**config.to_dict(), 'runs': args.runs}
+        results = run_phases(root, args.runs, phases)
+
+    for name, phase in results.items():
+        print(f"{name:<12} 중앙값 {phase['median_ms']:>10.2f}ms  "
+              f"(최소 {phase['min_ms']:.2f}ms, {phase['runs']}회)")
+
+    if args.json_path:
+        save_document(make_document('phases', results, document_config), args.json_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
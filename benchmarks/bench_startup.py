@@ -0,0 +1,109 @@
+"""
+CLI 시작 시간 벤치마크
+analyzer.py를 불러오는 데 걸리는 시간을 재고, 무거운 모듈이 필요할 때만
+로드되는지 확인합니다. 기준을 넘으면 종료 코드 1을 반환하므로 CI에서
+회귀 방지용으로 사용할 수 있습니다.
+
+    python -m benchmarks.bench_startup --max-import-ms 120
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.results import REPO_ROOT, make_document, save_document, summarize_timings
+
+# `import analyzer`만으로는 로드되면 안 되는 모듈
+LAZY_MODULES = (
+    'jinja2',
+    'colorama',
+    'reporter',
+    'multiprocessing',
+    'concurrent.futures.process',
+    'tarfile',
+    'zipfile',
+    'watcher'
+)
+
+
+def _time_command(args: List[str], runs: int) -> List[float]:
+    """명령을 runs번 실행한 벽시계 시간 (ms)"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=str(REPO_ROOT), check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def find_eager_modules() -> List[str]:
+    """`import analyzer` 후 이미 로드된 지연 로딩 대상 모듈"""
+    code = ('import json, sys, analyzer; '
+            f'print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))')
+    completed = subprocess.run([sys.executable, '-c', code], cwd=str(REPO_ROOT),
+                               check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout)
+
+
+def measure(runs: int = 10) -> Dict:
+    """인터프리터 단독 실행 대비 analyzer 로딩 시간 측정"""
+    interpreter = _time_command([sys.executable, '-c', 'pass'], runs)
+    import_only = _time_command([sys.executable, '-c', 'import analyzer'], runs)
+    help_run = _time_command([sys.executable, 'analyzer.py', '--help'], runs)
+
+    interpreter_ms = statistics.median(interpreter)
+    return {
+        'runs': runs,
+        'interpreter_ms': round(interpreter_ms, 2),
+        'import_ms': round(statistics.median(import_only) - interpreter_ms, 2),
+        'help_ms': round(statistics.median(help_run) - interpreter_ms, 2),
+        'eager_modules': find_eager_modules()
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='analyzer.py 시작 시간 벤치마크')
+    parser.add_argument('--runs', type=int, default=10, help='측정 반복 횟수')
+    parser.add_argument('--max-import-ms', type=float, default=None,
+                        help='인터프리터 시작을 뺀 import 시간 상한 (ms)')
+    parser.add_argument('--json', dest='json_path', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs)
+    print(f"인터프리터 시작: {result['interpreter_ms']:.1f}ms")
+    print(f"import analyzer: +{result['import_ms']:.1f}ms")
+    print(f"analyzer.py --help: +{result['help_ms']:.1f}ms")
+
+    failed = False
+    if result['eager_modules']:
+        print(f"실패: 필요하기 전에 로드된 모듈 - {', '.join(result['eager_modules'])}")
+        failed = True
+    if args.max_import_ms is not None and result['import_ms'] > args.max_import_ms:
+        print(f"실패: import 시간이 상한 {args.max_import_ms:.1f}ms를 넘었습니다.")
+        failed = True
+
+    if args.json_path:
+        phases = {
+            'import': summarize_timings([result['import_ms']]),
+            'help': summarize_timings([result['help_ms']])
+        }
+        config = {'runs': args.runs, 'eager_modules': result['eager_modules']}
+        save_document(make_document('startup', phases, config), args.json_path)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
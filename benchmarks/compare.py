@@ -0,0 +1,58 @@
+"""
+벤치마크 결과 비교
+두 결과 JSON의 단계별 중앙값을 비교합니다. 기준보다 느려진 단계가 있으면
+종료 코드 1을 반환합니다.
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import argparse
+import sys
+from typing import List
+
+from benchmarks.results import compare_documents, load_document
+
+
+def _describe(document) -> str:
+    commit = (document.get('commit') or 'unknown')[:10]
+    return f"{commit}{' (수정됨)' if document.get('dirty') else ''}"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='벤치마크 결과 비교')
+    parser.add_argument('base', help='기준 결과 JSON')
+    parser.add_argument('head', help='비교할 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='이 비율(%%)보다 느려진 단계가 있으면 실패')
+    args = parser.parse_args(argv)
+
+    base = load_document(args.base)
+    head = load_document(args.head)
+    if base['config'] != head['config']:
+        print("주의: 두 결과의 측정 설정이 다릅니다.")
+
+    print(f"기준: {_describe(base)}  비교: {_describe(head)}")
+    print(f"{'단계':<14}{'기준(ms)':>12}{'비교(ms)':>12}{'변화':>10}")
+    regressions = []
+    for row in compare_documents(base, head):
+        print(f"{row['phase']:<14}{row['base_ms']:>12.2f}{row['head_ms']:>12.2f}"
+              f"{row['change_pct']:>+9.1f}%")
+        if args.threshold is not None and row['change_pct'] > args.threshold:
+            regressions.append(row['phase'])
+
+    if regressions:
+        print(f"실패: {args.threshold:.1f}% 넘게 느려진 단계 - {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
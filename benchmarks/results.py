@@ -0,0 +1,115 @@
+"""
+벤치마크 결과 형식
+모든 벤치마크가 같은 JSON 문서 형식으로 결과를 저장하고, 두 결과
+(예: 이전 커밋과 현재 커밋)를 단계별로 비교합니다.
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+SCHEMA = 'portfolio-code-analyzer-bench/1'
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _git_revision() -> Dict:
+    """측정한 코드의 커밋과 수정 여부 (git이 없으면 빈 값)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=str(REPO_ROOT),
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                cwd=str(REPO_ROOT), capture_output=True, text=True,
+                                check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+    return {'commit': commit, 'dirty': bool(status.strip())}
+
+
+def summarize_timings(timings: List[float], **extra) -> Dict:
+    """반복 측정값(ms) 요약 (비교에는 median_ms 사용)"""
+    summary = {
+        'runs': len(timings),
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'max_ms': round(max(timings), 3)
+    }
+    summary.update(extra)
+    return summary
+
+
+def time_phase(func: Callable[[], object], runs: int, setup: Optional[Callable] = None) -> List[float]:
+    """func를 runs번 실행한 시간 (ms, setup 시간은 제외)"""
+    timings = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def make_document(suite: str, phases: Dict[str, Dict], config: Optional[Dict] = None) -> Dict:
+    """결과 문서 생성
+
+    phases는 {단계 이름: summarize_timings() 결과} 형식입니다.
+    """
+    document = {
+        'schema': SCHEMA,
+        'suite': suite,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': config or {},
+        'phases': phases
+    }
+    document.update(_git_revision())
+    return document
+
+
+def save_document(document: Dict, path: str):
+    Path(path).write_text(json.dumps(document, ensure_ascii=False, indent=2) + '\n',
+                          encoding='utf-8')
+
+
+def load_document(path: str) -> Dict:
+    document = json.loads(Path(path).read_text(encoding='utf-8'))
+    if document.get('schema') != SCHEMA:
+        raise ValueError(f"벤치마크 결과 형식이 아닙니다: {path}")
+    return document
+
+
+def compare_documents(base: Dict, head: Dict) -> List[Dict]:
+    """두 결과에 공통으로 있는 단계의 중앙값 비교 (change_pct > 0이면 느려짐)"""
+    rows = []
+    for name, base_phase in base['phases'].items():
+        head_phase = head['phases'].get(name)
+        if head_phase is None:
+            continue
+        base_ms = base_phase['median_ms']
+        head_ms = head_phase['median_ms']
+        change = (head_ms - base_ms) / base_ms * 100 if base_ms else 0.0
+        rows.append({
+            'phase': name,
+            'base_ms': base_ms,
+            'head_ms': head_ms,
+            'change_pct': round(change, 1)
+        })
+    return rows
@@ -0,0 +1,217 @@
+"""
+합성 저장소 생성기
+벤치마크용으로 재현 가능한 가짜 코드 저장소를 만듭니다.
+
+    python -m benchmarks.synthetic /tmp/synthetic-repo --files 2000 --seed 1
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import argparse
+import random
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# 언어별 확장자 (file_walker.LANGUAGE_EXTENSIONS와 같은 확장자 사용)
+LANGUAGE_SUFFIXES = {
+    'Python': '.py',
+    'JavaScript': '.js',
+    'TypeScript': '.ts',
+    'Java': '.java',
+    'Go': '.go',
+    'C': '.c'
+}
+
+DEFAULT_LANGUAGE_MIX = {'Python': 0.5, 'JavaScript': 0.2, 'TypeScript': 0.1,
+                        'Java': 0.1, 'Go': 0.05, 'C': 0.05}
+
+# 생성기가 만든 디렉토리 표시 (이 파일이 있는 디렉토리만 지우고 다시 생성)
+MARKER_FILE = '.synthetic-repo'
+
+# 분석에서 제외되어야 하는 디렉토리 (순회 비용 측정용)
+NOISE_DIRS = ('node_modules', 'venv', '.git')
+
+_WORDS = ('user', 'order', 'item', 'price', 'count', 'total', 'name', 'value',
+          'result', 'config', 'cache', 'index', 'buffer', 'token', 'node', 'state')
+
+
+class SyntheticRepoConfig:
+    """합성 저장소 설정"""
+
+    def __init__(self, files: int = 500, language_mix: Optional[Dict[str, float]] = None,
+                 lines_per_file: int = 120, depth: int = 3, noise_files: int = 200,
+                 seed: int = 0):
+        self.files = files
+        self.language_mix = language_mix or dict(DEFAULT_LANGUAGE_MIX)
+        unknown = [language for language in self.language_mix
+                   if language not in LANGUAGE_SUFFIXES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 언어: {', '.join(unknown)} "
+                             f"(사용 가능: {', '.join(LANGUAGE_SUFFIXES)})")
+        self.lines_per_file = lines_per_file
+        self.depth = depth
+        self.noise_files = noise_files
+        self.seed = seed
+
+    def to_dict(self) -> Dict:
+        return {
+            'files': self.files,
+            'language_mix': self.language_mix,
+            'lines_per_file': self.lines_per_file,
+            'depth': self.depth,
+            'noise_files': self.noise_files,
+            'seed': self.seed
+        }
+
+
+def _name(rng: random.Random) -> str:
+    return f'{rng.choice(_WORDS)}_{rng.choice(_WORDS)}'
+
+
+def _python_function(rng: random.Random) -> List[str]:
+    name = _name(rng)
+    lines = [f'def {name}(data, limit=10):', f'    """{name} 처리"""', '    result = 0']
+    for _ in range(rng.randint(1, 6)):
+        var = rng.choice(_WORDS)
+        kind = rng.random()
+        if kind < 0.4:
+            lines += [f'    if data.get("{var}") and limit > {rng.randint(0, 9)}:',
+                      f'        result += len(data["{var}"])']
+        elif kind < 0.7:
+            lines += [f'    for {var} in data:', f'        result += hash({var}) % {rng.randint(2, 99)}']
+        else:
+            lines += [f'    # {var} 값 보정', f'    result = max(result, {rng.randint(0, 999)})']
+    lines += ['    return result', '']
+    return lines
+
+
+def _c_family_function(rng: random.Random, language: str) -> List[str]:
+    name = _name(rng).replace('_', '')
+    header = {
+        'JavaScript': f'function {name}(data, limit) {{',
+        'TypeScript': f'export function {name}(data: any[], limit: number): number {{',
+        'Java': f'    public int {name}(int[] data, int limit) {{',
+        'Go': f'func {name}(data []int, limit int) int {{',
+        'C': f'int {name}(int *data, int limit) {{'
+    }[language]
+    lines = [f'// {name} 처리', header, '    int result = 0;' if language in ('Java', 'C')
+             else '    let result = 0;' if language != 'Go' else '    result := 0']
+    for _ in range(rng.randint(1, 6)):
+        value = rng.randint(0, 99)
+        if rng.random() < 0.5:
+            lines += [f'    if (limit > {value} && result < {value * 3}) {{',
+                      f'        result += {value};', '    }']
+        else:
+            lines += [f'    // 누적 ({value})', f'    result = result * 31 + {value};']
+    lines += ['    return result;' if language != 'Go' else '    return result', '}', '']
+    return lines
+
+
+def generate_file(rng: random.Random, language: str, target_lines: int) -> str:
+    """목표 줄 수 이상이 될 때까지 함수를 이어 붙인 소스 코드"""
+    if language == 'Python':
+        lines = ['"""합성 모듈"""', 'import os', '']
+    elif language == 'Java':
+        lines = [f'public class {_name(rng).title().replace("_", "")} {{', '']
+    elif language == 'Go':
+        lines = ['package synthetic', '']
+    else:
+        lines = ['/* 합성 모듈 */', '']
+
+    while len(lines) < target_lines:
+        if language == 'Python':
+            lines += _python_function(rng)
+        else:
+            lines += _c_family_function(rng, language)
+    if language == 'Java':
+        lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def _random_dir(rng: random.Random, depth: int) -> Path:
+    parts = [f'pkg_{rng.randint(0, 7)}' for _ in range(rng.randint(0, depth))]
+    return Path(*parts) if parts else Path('.')
+
+
+def generate_repository(root: Path, config: SyntheticRepoConfig) -> Dict[str, int]:
+    """config에 따라 root 아래에 저장소 생성 (같은 seed면 같은 내용), 언어별 파일 수 반환
+
+    root가 이미 있으면 생성기가 만든 디렉토리(MARKER_FILE이 있음)이거나 빈 디렉토리일
+    때만 지우고 다시 만듭니다. 그 밖의 경로는 사용자 데이터일 수 있으므로 ValueError를
+    발생시킵니다.
+    """
+    root = Path(root)
+    if root.exists():
+        if not root.is_dir():
+            raise ValueError(f"디렉토리가 아닌 경로가 이미 있습니다: {root}")
+        if not (root / MARKER_FILE).is_file() and any(root.iterdir()):
+            raise ValueError(f"합성 저장소가 아닌 비어 있지 않은 디렉토리입니다: {root} "
+                             f"(생성기가 만든 디렉토리만 덮어씀)")
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+    (root / MARKER_FILE).write_text('benchmarks.synthetic\n', encoding='utf-8')
+
+    rng = random.Random(config.seed)
+    languages = list(config.language_mix)
+    weights = [config.language_mix[language] for language in languages]
+    counts = {language: 0 for language in languages}
+
+    for index in range(config.files):
+        language = rng.choices(languages, weights)[0]
+        counts[language] += 1
+        directory = root / _random_dir(rng, config.depth)
+        directory.mkdir(parents=True, exist_ok=True)
+        target_lines = max(5, int(rng.gauss(config.lines_per_file, config.lines_per_file / 4)))
+        path = directory / f'module_{index:06d}{LANGUAGE_SUFFIXES[language]}'
+        path.write_text(generate_file(rng, language, target_lines), encoding='utf-8')
+
+    # 순회에서 제외되어야 하는 잡음 디렉토리
+    for index in range(config.noise_files):
+        noise_dir = root / rng.choice(NOISE_DIRS) / _random_dir(rng, config.depth)
+        noise_dir.mkdir(parents=True, exist_ok=True)
+        (noise_dir / f'vendor_{index:06d}.js').write_text(
+            generate_file(rng, 'JavaScript', 30), encoding='utf-8')
+
+    return counts
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description='벤치마크용 합성 저장소 생성')
+    parser.add_argument('root', help='생성할 디렉토리 (이전에 생성한 디렉토리면 지우고 다시 생성)')
+    parser.add_argument('--files', type=int, default=500, help='코드 파일 수')
+    parser.add_argument('--lines', type=int, default=120, help='파일당 평균 줄 수')
+    parser.add_argument('--depth', type=int, default=3, help='최대 디렉토리 깊이')
+    parser.add_argument('--noise-files', type=int, default=200,
+                        help='node_modules/venv/.git 아래에 만들 파일 수')
+    parser.add_argument('--mix', default=None,
+                        help='언어 비율 (예: Python=0.7,JavaScript=0.3)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args(argv)
+
+    mix = None
+    if args.mix:
+        try:
+            mix = {name.strip(): float(weight) for name, weight in
+                   (item.split('=') for item in args.mix.split(','))}
+        except ValueError:
+            parser.error(f'--mix 형식이 잘못되었습니다 (예: Python=0.7,JavaScript=0.3): {args.mix}')
+    try:
+        config = SyntheticRepoConfig(files=args.files, language_mix=mix,
+                                     lines_per_file=args.lines, depth=args.depth,
+                                     noise_files=args.noise_files, seed=args.seed)
+        counts = generate_repository(Path(args.root), config)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"{args.root}: " + ', '.join(f'{lang} {count}개' for lang, count in counts.items()))
+
+
+if __name__ == '__main__':
+    main()
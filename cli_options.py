@@ -0,0 +1,44 @@
+"""
+공통 명령줄 옵션
+명령줄 진입점(analyzer, batch_analyzer, server)이 같은 이름과 기본값으로
+받는 click 옵션 묶음입니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+from typing import Callable, List
+
+import click
+
+# 분석할 파일 고르기 (ignore_patterns, no_gitignore)
+FILE_SELECTION_OPTIONS = [
+    click.option('--ignore', 'ignore_patterns', multiple=True,
+                 help='제외할 경로 패턴 (.gitignore 문법, 여러 번 지정 가능)'),
+    click.option('--no-gitignore', is_flag=True, help='.gitignore 규칙을 적용하지 않음'),
+]
+
+# 결과 캐시와 파일 크기 제한 (cache_dir, cache_size, no_cache, max_file_size)
+CACHE_OPTIONS = [
+    click.option('--cache-dir', type=click.Path(file_okay=False), default=None,
+                 help='분석 결과 캐시 디렉토리 (기본: ~/.cache/portfolio-code-analyzer)'),
+    click.option('--cache-size', default=256, type=click.IntRange(min=1), show_default=True,
+                 help='캐시 최대 크기 (MB)'),
+    click.option('--no-cache', is_flag=True, help='분석 결과 캐시를 사용하지 않음'),
+    click.option('--max-file-size', default=1024, type=click.IntRange(min=0), show_default=True,
+                 help='이보다 큰 파일(KB)은 줄 수만 셈 (0이면 제한 없음)'),
+]
+
+
+def apply_options(options: List[Callable]) -> Callable:
+    """옵션 목록을 적힌 순서대로 도움말에 나오도록 명령에 붙이는 데코레이터"""
+    def decorator(command: Callable) -> Callable:
+        for option in reversed(options):
+            command = option(command)
+        return command
+    return decorator
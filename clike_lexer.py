@@ -0,0 +1,338 @@
+"""
+C 계열 언어 렉서
+JavaScript/TypeScript, Java, Kotlin, C/C++, C#, Go, Rust 소스를 한 번만 훑어
+주석 줄, 함수와 클래스 수, 함수 범위, 분기 기반 복잡도를 계산합니다.
+문자열과 주석 안의 내용은 코드로 보지 않습니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import re
+from typing import Dict, Optional, Pattern
+
+
+# 확장자 → 방언
+CLIKE_DIALECTS = {
+    '.js': 'javascript',
+    '.ts': 'javascript',
+    '.java': 'java',
+    '.kt': 'kotlin',
+    '.kts': 'kotlin',
+    '.c': 'c',
+    '.cpp': 'c',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.rs': 'rust'
+}
+
+# 분기로 세는 키워드 (else if는 if로 한 번만 셈)
+_BRANCH_KEYWORDS = frozenset({'if', 'for', 'while', 'case', 'catch', 'foreach'})
+
+# 뒤따르는 괄호가 함수 정의가 아닌 키워드
+_CONTROL_KEYWORDS = frozenset({
+    'if', 'for', 'while', 'switch', 'catch', 'foreach', 'using', 'lock', 'synchronized',
+    'return', 'sizeof', 'typeof', 'when', 'match', 'else', 'do', 'try', 'await', 'async',
+    'throw', 'case', 'in', 'of', 'new', 'delete', 'yield', 'defer', 'go', 'assert'
+})
+
+# 이름 없이 함수를 시작하는 키워드
+_FUNCTION_KEYWORDS = frozenset({'function', 'func', 'fn', 'fun'})
+
+# 다음 식별자가 클래스(형) 이름인 키워드
+_CLASS_KEYWORDS = frozenset({'class', 'interface', 'struct', 'enum', 'trait', 'record', 'object'})
+
+# JavaScript에서 '/' 앞에 오면 나눗셈이 아니라 정규식 리터럴로 보는 토큰
+_REGEX_PREFIX_OPS = frozenset({'(', ',', '=', ':', '[', '!', '&&', '||', '?', '{', '}', ';',
+                               '=>', '==', '===', '!=', '!==', '&', '|', '<', '>'})
+_REGEX_PREFIX_WORDS = frozenset({'return', 'typeof', 'case', 'do', 'else', 'in', 'of',
+                                 'void', 'yield', 'await', 'delete', 'throw', 'new'})
+
+_DOUBLE_QUOTED = r'"(?:[^"\\\n]|\\[\s\S])*"?'
+_CHAR_LITERAL = r"'(?:\\[^\n]{1,10}?|[^'\\\n])'"
+
+# 방언별 문자열 리터럴 (긴 형식을 먼저 시도)
+_STRING_PATTERNS = {
+    'javascript': [r'`(?:[^`\\]|\\[\s\S])*`?', _DOUBLE_QUOTED, r"'(?:[^'\\\n]|\\[\s\S])*'?"],
+    'java': [r'"""[\s\S]*?(?:"""|\Z)', _DOUBLE_QUOTED, _CHAR_LITERAL],
+    'kotlin': [r'"""[\s\S]*?(?:"""|\Z)', _DOUBLE_QUOTED, _CHAR_LITERAL],
+    'c': [r'R"(?P<delim>[^()\\\s]{0,16})\([\s\S]*?\)(?P=delim)"', _DOUBLE_QUOTED, _CHAR_LITERAL],
+    'csharp': [r'"""[\s\S]*?(?:"""|\Z)', r'@"(?:[^"]|"")*"?', _DOUBLE_QUOTED, _CHAR_LITERAL],
+    'go': [r'`[^`]*`?', _DOUBLE_QUOTED, _CHAR_LITERAL],
+    'rust': [r'r(?P<hashes>#*)"[\s\S]*?"(?P=hashes)', _DOUBLE_QUOTED, _CHAR_LITERAL]
+}
+
+_token_patterns: Dict[str, Pattern] = {}
+
+
+def _token_pattern(dialect: str) -> Pattern:
+    """방언별 토큰 정규식 (처음 사용할 때 컴파일)"""
+    pattern = _token_patterns.get(dialect)
+    if pattern is None:
+        skip = []
+        if dialect in ('c', 'csharp'):
+            # 전처리 지시문 (매크로 안의 괄호는 코드 구조가 아님)
+            skip.append(r'^[ \t]*\#[^\n]*(?:\\\n[^\n]*)*')
+        if dialect == 'rust':
+            skip.append(r"'[A-Za-z_]\w*(?!')")  # 수명 매개변수
+        ident = r'[A-Za-z_$][\w$]*' if dialect == 'javascript' else r'[A-Za-z_]\w*'
+        parts = [
+            r'(?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))',
+            f"(?P<string>{'|'.join(_STRING_PATTERNS[dialect])})",
+        ]
+        if skip:
+            parts.append(f"(?P<skip>{'|'.join(skip)})")
+        parts += [
+            f'(?P<ident>{ident})',
+            r'(?P<op>===|!==|==|!=|<=|>=|&&|\|\||=>|->|[{}()\[\];=/<>,:?!&|])'
+        ]
+        pattern = _token_patterns[dialect] = re.compile('|'.join(parts), re.MULTILINE)
+    return pattern
+
+
+def _is_ternary(content: str, start: int, dialect: str, prev_value: Optional[str]) -> bool:
+    """start의 '?'가 삼항 연산자인지 (방언마다 '?'의 다른 쓰임은 제외)
+
+    ?. ?? ?[ 는 null 처리 연산자, JavaScript/TypeScript의 x?: x?) x?( 등은 선택적
+    매개변수/멤버, Java의 <? ,? 는 와일드카드, C#에서 붙여 쓴 T? 는 nullable 형식입니다.
+    Kotlin, Go, Rust에는 삼항 연산자가 없습니다 ('?'는 null 안전/오류 전파 연산자).
+    """
+    if dialect in ('kotlin', 'go', 'rust'):
+        return False
+    following = content[start + 1:start + 2]
+    if following in ('.', '?', '[') or content[start - 1:start] == '?':
+        return False
+    if dialect == 'javascript':
+        return following not in (':', ')', ',', '=', '(', ';')
+    if dialect == 'java':
+        return prev_value not in ('<', ',')
+    if dialect == 'csharp':
+        return content[start - 1:start] in (' ', '\t', '\n')
+    return True
+
+
+def _skip_regex_literal(content: str, pos: int) -> Optional[int]:
+    """pos의 '/' 다음부터 정규식 리터럴이 끝나는 위치 (한 줄 안에서 닫히지 않으면 None)"""
+    in_class = False
+    i = pos + 1
+    n = len(content)
+    while i < n:
+        c = content[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            return None
+        if in_class:
+            if c == ']':
+                in_class = False
+        elif c == '[':
+            in_class = True
+        elif c == '/':
+            return i + 1
+        i += 1
+    return None
+
+
+class CLikeMetrics:
+    """C 계열 소스 한 파일의 지표"""
+
+    __slots__ = ('comment_lines', 'class_count', 'functions', 'complexity')
+
+    def __init__(self):
+        self.comment_lines = 0
+        self.class_count = 0
+        self.functions = []  # 함수별 이름, 위치, 길이, 복잡도 (Python 분석과 같은 형식)
+        self.complexity = 1  # 파일 전체 복잡도
+
+    @property
+    def function_count(self) -> int:
+        return len(self.functions)
+
+
+def scan_clike(content: str, dialect: str) -> CLikeMetrics:
+    """소스를 한 번 토큰화하며 지표 계산
+
+    함수는 `이름(...) ... {` 형태의 본문과 본문이 있는 화살표 함수/람다를,
+    복잡도는 분기 키워드와 &&, ||, 삼항 연산자 수(Rust는 match 갈래 포함)를 셉니다.
+    """
+    metrics = CLikeMetrics()
+    search = _token_pattern(dialect).search
+    is_javascript = dialect == 'javascript'
+    # 조건식에 괄호가 없는 언어는 선언 키워드가 있어야 함수
+    needs_keyword = dialect in ('go', 'rust')
+    arrow_op = {'javascript': '=>', 'java': '->'}.get(dialect)
+
+    comment_lines = set()
+    line = 1
+    last_pos = 0
+
+    # 직전 두 토큰
+    prev_kind = prev_value = prev2_value = None
+
+    paren_stack = []  # (괄호 앞 토큰 종류, 값, 그 앞 토큰 값, 줄) - 중괄호마다 새로 시작
+    brace_stack = []  # (이 중괄호가 시작한 함수 또는 None, 바깥 paren_stack)
+    function_stack = []
+
+    candidate = None  # 다음 '{'가 본문이면 시작될 함수 (이름, 줄, ')'의 줄)
+    candidate_locked = False  # 시그니처 뒤 ':' 이후로는 이름을 바꾸지 않음 (C++ 초기화 목록)
+    decl_name = None  # fn/fun/function 바로 뒤의 이름
+    generic_owner = None  # 'name<'의 name
+    assign_name = None  # 'name ='의 name (화살표 함수 이름)
+    arrow = None  # 본문이 올 수 있는 화살표 함수/람다 (이름, 줄)
+    in_case = False  # case 절 안 (Java의 'case X ->'는 람다가 아님)
+    class_keyword = False  # 직전 토큰이 클래스 키워드
+    pending_class = False  # C/C++: 'struct 이름' 뒤에 '{'나 ':'가 와야 정의
+    after_receiver = False  # Go: 직전 토큰이 'func (수신자)'의 ')'
+
+    def add_complexity(amount: int = 1):
+        metrics.complexity += amount
+        if function_stack:
+            function_stack[-1]['complexity'] += amount
+
+    pos = 0
+    while True:
+        match = search(content, pos)
+        if match is None:
+            break
+        start = match.start()
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group()
+        line += content.count('\n', last_pos, start)
+        last_pos = start
+
+        if kind == 'comment':
+            comment_lines.update(range(line, line + value.count('\n') + 1))
+            continue
+        if kind == 'skip':
+            continue
+
+        if pending_class:
+            if value in ('{', ':'):
+                metrics.class_count += 1
+            pending_class = False
+
+        if kind == 'string':
+            arrow = None
+            class_keyword = False
+            prev_kind, prev2_value, prev_value = kind, prev_value, None
+            continue
+
+        if kind == 'ident':
+            arrow = None
+            if dialect == 'go' and value in ('struct', 'interface') and prev2_value == 'type':
+                metrics.class_count += 1
+            elif value in _CLASS_KEYWORDS:
+                # Foo.class 같은 참조는 제외
+                class_keyword = class_keyword or content[start - 1:start] != '.'
+            else:
+                if class_keyword:
+                    if dialect == 'c':
+                        pending_class = True
+                    else:
+                        metrics.class_count += 1
+                class_keyword = False
+
+            if value in _BRANCH_KEYWORDS:
+                add_complexity()
+            if value in ('case', 'default'):
+                in_case = True
+            if value in _CONTROL_KEYWORDS or value in _CLASS_KEYWORDS:
+                candidate = None
+            if (prev_kind == 'ident' and prev_value in _FUNCTION_KEYWORDS) or after_receiver:
+                decl_name = value
+            after_receiver = False
+        else:
+            class_keyword = after_receiver = False
+            if value == '/' and is_javascript and (
+                    prev_kind is None or (prev_kind == 'op' and prev_value in _REGEX_PREFIX_OPS)
+                    or (prev_kind == 'ident' and prev_value in _REGEX_PREFIX_WORDS)):
+                end = _skip_regex_literal(content, start)
+                if end is not None:
+                    pos = end
+                    prev_kind, prev2_value, prev_value = 'string', prev_value, None
+                    continue
+
+            if value == '{':
+                function = None
+                if arrow is not None and prev_value == arrow_op:
+                    function = {'name': arrow[0], 'line': arrow[1], 'length': 0, 'complexity': 1}
+                elif candidate is not None and not paren_stack and \
+                        (dialect != 'go' or candidate[2] == line):
+                    function = {'name': candidate[0], 'line': candidate[1], 'length': 0,
+                                'complexity': 1}
+                if function is not None:
+                    function_stack.append(function)
+                brace_stack.append((function, paren_stack))
+                paren_stack = []
+                candidate = decl_name = arrow = None
+                candidate_locked = in_case = False
+            elif value == '}':
+                if brace_stack:
+                    function, paren_stack = brace_stack.pop()
+                    if function is not None:
+                        function['length'] = line - function['line']
+                        function_stack.pop()
+                        metrics.functions.append(function)
+                candidate = decl_name = arrow = None
+                candidate_locked = in_case = False
+            elif value == '(':
+                if prev_kind == 'op' and prev_value == '>' and generic_owner:
+                    paren_stack.append(('ident', generic_owner, None, line))
+                else:
+                    paren_stack.append((prev_kind, prev_value, prev2_value, line))
+            elif value == ')':
+                if paren_stack:
+                    open_kind, open_value, open_prev, open_line = paren_stack.pop()
+                    if not paren_stack and open_kind == 'ident':
+                        if open_value in _FUNCTION_KEYWORDS:
+                            candidate = (decl_name or '<anonymous>', open_line, line)
+                            after_receiver = dialect == 'go' and decl_name is None
+                        elif open_prev in _FUNCTION_KEYWORDS:
+                            candidate = (open_value, open_line, line)
+                        elif open_value in _CONTROL_KEYWORDS or open_prev in _CLASS_KEYWORDS \
+                                or open_prev == 'new':
+                            candidate = None
+                        elif needs_keyword and decl_name is None:
+                            candidate = None
+                        elif not candidate_locked:
+                            candidate = (decl_name or open_value, open_line, line)
+                        elif candidate is not None:
+                            candidate = (candidate[0], candidate[1], line)
+            elif value == ';':
+                candidate = decl_name = assign_name = arrow = None
+                candidate_locked = in_case = False
+            elif value == '=':
+                if prev_kind == 'ident':
+                    assign_name = prev_value
+                candidate = None
+                candidate_locked = False
+            elif value == ':':
+                if candidate is not None and not paren_stack:
+                    candidate_locked = True
+            elif value in ('&&', '||'):
+                add_complexity()
+            elif value == '?':
+                if _is_ternary(content, start, dialect, prev_value):
+                    add_complexity()
+            elif value == '=>' and dialect == 'rust':
+                add_complexity()
+            elif value == '<':
+                generic_owner = prev_value if prev_kind == 'ident' and \
+                    content[start - 1:start] not in (' ', '\t') else None
+
+            if value == arrow_op and not in_case:
+                arrow = (assign_name or '<anonymous>', line)
+            elif value != '{':
+                arrow = None
+
+        prev_kind, prev2_value, prev_value = kind, prev_value, value
+
+    metrics.comment_lines = len(comment_lines)
+    return metrics
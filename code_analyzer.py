@@ -12,286 +12,1023 @@ All rights reserved.
 원본 출처: https://github.com/Gaon/portfolio-code-analyzer
 """
 import os
+import sys
 import ast
-import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import IO, TYPE_CHECKING, Dict, Iterator, List, Tuple, Optional
 from collections import defaultdict
 import subprocess
 import json
+import hashlib
+
+from clike_lexer import CLIKE_DIALECTS, CLikeMetrics, scan_clike
+from dedup import VendoredDirectoryIndex, find_identical_files
+from duplicates import DuplicateIndex, fingerprint
+from file_walker import FileWalker, LANGUAGE_EXTENSIONS
+from line_scanner import LineStats, LONG_LINE_LENGTH, count_lines, scan_text
+from git_support import GitError, GitRepository, GitTreeSource
+from hotspots import DEFAULT_TOP_K, HotspotIndex
+from result_cache import ResultCache, DEFAULT_MAX_BYTES
+from issues import ISSUE_SEVERITY, Issue, IssueType
+from memory_monitor import MemoryMonitor, SpillingList
+from metrics import MetricTable
+from profiling import NULL_FILE_TIMER, NULL_PROFILER, Profiler
+
+if TYPE_CHECKING:
+    from archive_source import ArchiveMember, ArchiveSource
+
+
+# 분석 로직이 바뀌면 올려서 캐시된 결과를 무효화
+ANALYZER_VERSION = '1.9'
+
+# 핫스팟의 변경 빈도를 셀 최근 커밋 수
+CHURN_MAX_COMMITS = 1000
+
+
+class _PythonMetricsVisitor(ast.NodeVisitor):
+    """Python AST를 한 번 순회하며 복잡도와 구조 정보를 함께 수집"""
+    
+    def __init__(self):
+        self.complexity = 1  # 파일 전체 복잡도
+        self.functions = []  # 함수별 이름, 위치, 길이, 복잡도
+        self.class_count = 0
+        self.global_count = 0
+        self._function_stack = []
+    
+    def _add_complexity(self, amount: int = 1):
+        # 분기는 파일 전체와 가장 안쪽 함수에 함께 반영
+        self.complexity += amount
+        if self._function_stack:
+            self._function_stack[-1]['complexity'] += amount
+    
+    def _visit_branch(self, node: ast.AST):
+        self._add_complexity()
+        self.generic_visit(node)
+    
+    visit_If = visit_IfExp = visit_While = visit_For = visit_AsyncFor = _visit_branch
+    visit_Try = visit_TryStar = visit_With = visit_AsyncWith = _visit_branch
+    visit_match_case = _visit_branch
+    
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self._add_complexity(len(node.values) - 1)
+        self.generic_visit(node)
+    
+    def visit_comprehension(self, node: ast.comprehension):
+        # for 절과 각 if 조건이 분기
+        self._add_complexity(1 + len(node.ifs))
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        function = {
+            'name': node.name,
+            'line': node.lineno,
+            'length': (node.end_lineno or node.lineno) - node.lineno,
+            'complexity': 1
+        }
+        self.functions.append(function)
+        self._function_stack.append(function)
+        self.generic_visit(node)
+        self._function_stack.pop()
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.class_count += 1
+        self.generic_visit(node)
+    
+    def visit_Global(self, node: ast.Global):
+        self.global_count += 1
+
+
+# 기본 파일 크기 제한 (이보다 큰 파일은 줄 수만 셈)
+DEFAULT_MAX_FILE_SIZE = 1024 * 1024
+
+# 건너뛸 파일인지 판단할 때 읽는 앞부분 크기
+SNIFF_BYTES = 8192
+
+# 분석을 건너뛴 이유
+SKIP_REASONS = {
+    'binary': '바이너리 파일',
+    'minified': '압축(minified) 파일',
+    'generated': '자동 생성 파일',
+    'too_large': '크기 제한 초과'
+}
+
+# 앞부분에 있으면 자동 생성 파일로 판단하는 표식 (소문자)
+_GENERATED_MARKERS = (
+    b'@generated',
+    b'do not edit',
+    b'code generated by',
+    b'generated by the protocol buffer compiler',
+    b'autogenerated',
+    b'auto-generated'
+)
+
+
+# 프로세스 풀 작업자마다 하나씩 생성되는 분석기
+_worker_analyzer = None
+
+
+def _init_worker(options: Dict):
+    """작업자 프로세스 초기화"""
+    global _worker_analyzer
+    _worker_analyzer = CodeAnalyzer(**options)
+
+
+def _analyze_in_worker(file_path: Path) -> Dict:
+    """작업자 프로세스에서 파일 하나를 분석"""
+    return _worker_analyzer._analyze_file(file_path)
+
+
+def _analyze_data_in_worker(file_path: Path, data: bytes, cache_key: Optional[str] = None) -> Dict:
+    """작업자 프로세스에서 이미 읽은 내용(압축 파일 멤버, git blob)을 분석"""
+    return _worker_analyzer._analyze_data(file_path, data, cache_key)
+
+
+def create_process_pool(workers: int, options: Dict):
+    """분석 작업자 프로세스 풀 생성
+    
+    options는 CodeAnalyzer._worker_options() 형식입니다. 파일 분석은 대상 경로와
+    무관하므로 같은 설정(캐시, 파일 크기 제한)을 쓰는 여러 분석기가 풀 하나를
+    공유할 수 있습니다.
+    """
+    # 순차 실행에서는 multiprocessing을 불러오지 않음
+    from concurrent.futures import ProcessPoolExecutor
+    
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(options,))
 
 
 class CodeAnalyzer:
     """코드 품질을 분석하는 메인 클래스"""
     
-    def __init__(self, target_path: str):
+    def __init__(self, target_path: str, ignore_patterns: Optional[List[str]] = None,
+                 use_gitignore: bool = True, jobs: int = 1,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 since: Optional[str] = None, max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 profiler: Optional[Profiler] = None, executor=None,
+                 low_memory: bool = False, memory_limit: Optional[int] = None,
+                 trace_allocations: int = 0, revision: Optional[str] = None,
+                 hotspots: int = DEFAULT_TOP_K):
         self.target_path = Path(target_path)
+        self.ignore_patterns = list(ignore_patterns or [])
+        self.use_gitignore = use_gitignore
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.since = since
+        # 작업 트리 대신 분석할 커밋 (체크아웃 없이 git 객체 데이터베이스에서 읽음)
+        self.revision = revision
+        self.max_file_size = max_file_size
+        self.profiler = profiler or NULL_PROFILER
+        # 저메모리 모드: 이슈를 임시 파일로 내보내고 작업자 결과를 조금씩만 받음
+        # memory_limit(바이트)를 지정하면 항상 저메모리 모드
+        self.low_memory = low_memory or memory_limit is not None
+        self._memory = MemoryMonitor(memory_limit, trace_allocations)
+        # 외부에서 받은 작업자 풀 (일괄 분석 등에서 여러 분석기가 공유, 종료는 호출자가 담당)
+        self.executor = executor
+        self._cache = None
+        self._timer = NULL_FILE_TIMER
+        # 압축 파일이나 커밋 대상일 때 열린 소스와 경로별 멤버
+        self._archive = None
+        self._archive_members = {}
+        # 순위별로 보관할 핫스팟 수 (0이면 만들지 않음)와 파일별 최근 커밋 수
+        self.hotspots = hotspots
+        self._churn: Dict[str, int] = {}
+        self._reset_results()
+    
+    def _reset_results(self):
+        """전체 결과와 파일 사이에 쌓이는 상태를 비움"""
+        # 파일 사이의 중복 코드 (파일 순서대로 병합할 때 찾음)
+        self._duplicates = DuplicateIndex()
+        # 거의 같은 디렉토리 (벤더링한 라이브러리 등)
+        self._vendored = VendoredDirectoryIndex()
+        # 파일별/함수별 지표 (분포는 마지막에 한 번 계산)
+        self._metrics = MetricTable()
+        # 순위별 상위 파일과 함수
+        self._hotspots = HotspotIndex(self.hotspots)
         self.analysis_results = {
             'files_analyzed': 0,
             'total_lines': 0,
             'languages': defaultdict(int),
-            'complexity': {'avg': 0, 'max': 0, 'high_complexity_files': []},
-            'readability': {'score': 0, 'issues': []},
-            'structure': {'score': 0, 'issues': []},
-            'issues': [],
-            'metrics': {}
+            'complexity': {'avg': 0, 'max': 0, 'high_complexity_count': 0,
+                           'high_complexity_files': []},
+            'readability': {'score': 0, 'issues': self._new_issue_list()},
+            'structure': {'score': 0, 'issues': self._new_issue_list()},
+            'duplicates': {'issues': self._new_issue_list(), **self._duplicates.summary()},
+            'issues': self._new_issue_list(),
+            'skipped_files': [],
+            'identical_files': 0,
+            'vendored': [],
+            'issue_counts': {'high': 0, 'medium': 0, 'low': 0},
+            'metrics': {},
+            'hotspots': {}
         }
+        # (분류, 심각도)별 이슈 수 - 종합 점수 계산용
+        self._issue_counts = defaultdict(int)
     
     def analyze(self) -> Dict:
         """전체 코드베이스 분석"""
+        for _ in self.analyze_iter():
+            pass
+        return self.analysis_results
+    
+    def analyze_iter(self, retain_issues: bool = True) -> Iterator[Tuple[str, Dict]]:
+        """파일 분석이 끝날 때마다 ('file', 파일별 결과)를, 마지막에 ('summary', 전체 결과)를 생성
+        
+        retain_issues가 False이면 이슈 목록을 쌓지 않고 개수만 집계하므로
+        저장소 크기와 관계없이 메모리 사용량이 일정합니다. 저메모리 모드에서는
+        쌓는 이슈도 일정 개수마다 임시 파일로 내보냅니다.
+        """
         if not self.target_path.exists():
             raise ValueError(f"경로를 찾을 수 없습니다: {self.target_path}")
         
+        profiler = self.profiler
+        memory = self._memory
+        memory.start()
+        
         # 파일 수집
-        code_files = self._collect_code_files()
+        with profiler.phase('collect'):
+            code_files = self._collect_code_files()
         self.analysis_results['files_analyzed'] = len(code_files)
         
         if not code_files:
-            return self.analysis_results
+            self._close_archive()
+            self._record_memory()
+            yield 'summary', self.analysis_results
+            return
         
-        # 각 파일 분석
-        for file_path in code_files:
-            self._analyze_file(file_path)
+        try:
+            # 핫스팟 점수에 쓸 파일별 최근 커밋 수
+            with profiler.phase('churn'):
+                self._churn = self._load_churn()
+            
+            # 기준 커밋 이후 바뀌지 않은 파일은 저장된 결과 재사용 (압축 파일과 커밋 대상은 항상 전체 분석)
+            with profiler.phase('incremental'):
+                use_git = self.cache_dir and self._archive is None
+                repo = GitRepository.discover(self.target_path) if use_git else None
+                reused = self._load_incremental_base(repo, code_files)
+                # 스냅샷은 모든 파일별 결과를 모아 저장하므로 저메모리 모드에서는 저장하지 않음
+                # (파일별 결과에는 이슈가 들어 있으므로 retain_issues와는 관계없음)
+                save_snapshot = not self.low_memory
+                snapshot_key = self._current_snapshot_key(repo) if save_snapshot else None
+            file_results = [] if snapshot_key else None
+            
+            # 내용이 앞선 파일과 같은 파일은 분석하지 않고 그 결과를 공유
+            # (커밋 대상은 blob ID로 비교, 압축 파일은 멤버를 한 번만 순서대로 읽으므로 제외)
+            with profiler.phase('dedup'):
+                pending = [p for p in code_files if p not in reused]
+                if self._archive is None:
+                    identical = find_identical_files(pending)
+                else:
+                    identical = self._identical_members(pending)
+                copies_left = defaultdict(int)
+                for original in identical.values():
+                    copies_left[original] += 1
+                shared = {}
+            self.analysis_results['identical_files'] = len(identical)
+            
+            # 각 파일 분석 (파일 순서대로 병합하므로 병렬 실행도 결과가 동일)
+            # 'files' 단계에는 호출자가 파일별 결과를 처리하는 시간도 포함됨
+            with profiler.phase('files'):
+                fresh = self._iter_file_results([p for p in pending if p not in identical])
+                for file_path in code_files:
+                    original = identical.get(file_path)
+                    if original is not None:
+                        file_result = {**shared[original], 'file': str(file_path)}
+                        copies_left[original] -= 1
+                        if not copies_left[original]:
+                            del shared[original]
+                    else:
+                        file_result = reused.get(file_path) or next(fresh)
+                        if file_path in copies_left:
+                            shared[file_path] = file_result
+                    profiler.record_file(file_result)
+                    self._merge_file_result(file_result, retain_issues)
+                    if file_results is not None:
+                        file_results.append(file_result)
+                    if memory.over_limit():
+                        self._relieve_memory()
+                    yield 'file', file_result
+                # 작업자 풀을 바로 정리 (자식 프로세스 최대 메모리에도 반영됨)
+                fresh.close()
+            
+            if snapshot_key:
+                with profiler.phase('snapshot'):
+                    self._save_snapshot(snapshot_key, file_results)
+            
+            with profiler.phase('vendored'):
+                self.analysis_results['vendored'] = self._vendored.find()
+        finally:
+            self._close_cache()
+            self._close_archive()
+        
+        # 지표 분포, 핫스팟과 종합 점수 계산
+        with profiler.phase('score'):
+            self._summarize_metrics()
+            self._summarize_hotspots()
+            self._calculate_overall_score()
         
-        # 종합 점수 계산
+        self._record_memory()
+        yield 'summary', self.analysis_results
+    
+    def rebuild(self, file_results: List[Dict], retain_issues: bool = True) -> Dict:
+        """이미 분석한 파일별 결과(파일 순서)로 전체 결과를 다시 계산
+        
+        감시 모드에서 바뀐 파일만 다시 분석한 뒤 사용합니다. 중복 코드와 복사된
+        디렉토리는 파일 순서에 따라 달라지므로 보관된 지문으로 처음부터 다시 찾습니다.
+        """
+        self._reset_results()
+        results = self.analysis_results
+        results['files_analyzed'] = len(file_results)
+        results['identical_files'] = len(find_identical_files(
+            Path(file_result['file']) for file_result in file_results))
+        for file_result in file_results:
+            self._merge_file_result(file_result, retain_issues)
+        results['vendored'] = self._vendored.find()
+        self._summarize_metrics()
+        self._summarize_hotspots()
         self._calculate_overall_score()
+        self._close_cache()
+        self._record_memory()
+        return results
+    
+    def _new_issue_list(self):
+        return SpillingList() if self.low_memory else []
+    
+    def _issue_lists(self) -> List:
+        results = self.analysis_results
+        return [results['issues'], results['readability']['issues'],
+                results['structure']['issues'], results['duplicates']['issues']]
+    
+    def _relieve_memory(self):
+        """메모리 상한을 넘었을 때 모은 이슈를 모두 임시 파일로 내보내고 중복 색인을 줄임
         
-        return self.analysis_results
+        더 줄일 것이 없는데도 상한을 넘으면 MemoryError를 발생시킵니다.
+        """
+        spilled = 0
+        for issues in self._issue_lists():
+            if isinstance(issues, SpillingList):
+                spilled -= issues.spilled
+                issues.spill()
+                spilled += issues.spilled
+        reduced = self._duplicates.reduce()
+        self.analysis_results['duplicates'].update(self._duplicates.summary())
+        if not spilled and not reduced:
+            limit_mb = self._memory.limit / (1024 * 1024)
+            raise MemoryError(f"메모리 사용량이 상한({limit_mb:.0f}MB)을 넘었고 더 줄일 수 있는 "
+                              f"데이터가 없습니다. --max-memory를 늘려 주세요.")
+        self._memory.relieved()
     
-    def _collect_code_files(self) -> List[Path]:
-        """분석할 코드 파일 수집"""
-        code_files = []
-        extensions = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.java': 'Java',
-            '.kt': 'Kotlin',
-            '.kts': 'Kotlin',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.rb': 'Ruby',
-            '.php': 'PHP'
+    def _record_memory(self):
+        """최대 메모리 사용량과 임시 파일로 내보낸 이슈 수를 결과에 기록"""
+        memory = self._memory.summary()
+        memory['spilled_issues'] = sum(issues.spilled for issues in self._issue_lists()
+                                       if isinstance(issues, SpillingList))
+        self.analysis_results['memory'] = memory
+    
+    def _worker_options(self) -> Dict:
+        """작업자 프로세스에서 분석기를 재구성하기 위한 설정"""
+        return {
+            'target_path': str(self.target_path),
+            'ignore_patterns': self.ignore_patterns,
+            'use_gitignore': self.use_gitignore,
+            'cache_dir': self.cache_dir,
+            'cache_max_bytes': self.cache_max_bytes,
+            'max_file_size': self.max_file_size,
+            'profiler': Profiler(self.profiler.top_files) if self.profiler.enabled else None,
         }
+    
+    def _get_cache(self) -> Optional[ResultCache]:
+        """결과 캐시 (프로세스마다 처음 사용할 때 연결)"""
+        if self._cache is None and self.cache_dir:
+            self._cache = ResultCache(self.cache_dir, ANALYZER_VERSION, self.cache_max_bytes)
+        return self._cache
+    
+    def _close_cache(self):
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
+    def _close_archive(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+            self._archive_members = {}
+    
+    def _snapshot_key(self, repo: GitRepository, commit: str) -> str:
+        """커밋과 분석 설정으로 저장소 스냅샷 키 생성"""
+        identity = json.dumps([ANALYZER_VERSION, commit, repo.relative_path(self.target_path),
+                               self.ignore_patterns, self.use_gitignore])
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+    
+    def _relative_name(self, file_path: Path) -> str:
+        """분석 대상 기준 상대 경로 (POSIX 형식)"""
+        if file_path == self.target_path:
+            return file_path.name
+        return file_path.relative_to(self.target_path).as_posix()
+    
+    def _current_snapshot_key(self, repo: Optional[GitRepository]) -> Optional[str]:
+        """작업 트리가 커밋과 일치할 때만 HEAD 스냅샷 키 반환"""
+        if repo is None:
+            return None
+        try:
+            if not repo.is_clean(self.target_path):
+                return None
+            return self._snapshot_key(repo, repo.rev_parse('HEAD'))
+        except GitError:
+            # 커밋이 없는 저장소 등
+            return None
+    
+    def _save_snapshot(self, key: str, file_results: List[Dict]):
+        """이후 --since 분석의 기준이 되도록 파일별 결과 저장"""
+        entries = [{**result, 'file': self._relative_name(Path(result['file']))}
+                   for result in file_results]
+        self._get_cache().put_snapshot(key, entries)
+    
+    def _load_incremental_base(self, repo: Optional[GitRepository],
+                               code_files: List[Path]) -> Dict[Path, Dict]:
+        """since 커밋의 스냅샷에서 바뀌지 않은 파일의 결과를 가져옴"""
+        if not self.since:
+            return {}
+        if self._archive is not None:
+            raise ValueError('압축 파일 분석에는 증분 분석(--since)을 사용할 수 없습니다.')
+        if not self.cache_dir:
+            raise ValueError('증분 분석(--since)에는 결과 캐시가 필요합니다.')
+        if repo is None:
+            raise ValueError(f'git 저장소가 아닙니다: {self.target_path}')
         
+        base = repo.rev_parse(self.since)
+        snapshot = self._get_cache().get_snapshot(self._snapshot_key(repo, base))
+        incremental = {'base': base, 'base_found': snapshot is not None,
+                       'reanalyzed': len(code_files), 'reused': 0}
+        self.analysis_results['incremental'] = incremental
+        if snapshot is None:
+            return {}
+        
+        stored = {entry['file']: entry for entry in snapshot}
+        prefix = repo.relative_path(self.target_path)
         if self.target_path.is_file():
-            if self.target_path.suffix in extensions:
+            prefix = prefix.rsplit('/', 1)[0] if '/' in prefix else ''
+        prefix = f'{prefix}/' if prefix else ''
+        # .gitignore를 적용하지 않으면 무시된 파일도 분석하므로 항상 다시 분석
+        changed = repo.changed_paths(base, include_ignored=not self.use_gitignore)
+        
+        reused = {}
+        for file_path in code_files:
+            name = self._relative_name(file_path)
+            if name in stored and prefix + name not in changed:
+                reused[file_path] = {**stored[name], 'file': str(file_path)}
+        
+        incremental['reused'] = len(reused)
+        incremental['reanalyzed'] = len(code_files) - len(reused)
+        return reused
+    
+    def _iter_file_results(self, code_files: List[Path]) -> Iterator[Dict]:
+        """파일별 분석 결과를 입력 순서대로 생성 (외부 작업자 풀이 있으면 항상 사용)"""
+        if self._archive is not None:
+            yield from self._iter_archive_results(code_files)
+            return
+        
+        if self.executor is None and (self.jobs <= 1 or len(code_files) < 2):
+            for file_path in code_files:
+                yield self._analyze_file(file_path)
+            return
+        
+        workers = max(1, min(self.jobs, len(code_files)))
+        if self.low_memory:
+            yield from self._iter_bounded_results(code_files, workers)
+            return
+        
+        chunksize = max(1, min(64, len(code_files) // (workers * 4)))
+        if self.executor is not None:
+            yield from self.executor.map(_analyze_in_worker, code_files, chunksize=chunksize)
+            return
+        
+        with create_process_pool(workers, self._worker_options()) as executor:
+            yield from executor.map(_analyze_in_worker, code_files, chunksize=chunksize)
+    
+    def _iter_bounded_results(self, code_files: List[Path], workers: int) -> Iterator[Dict]:
+        """작업자 수의 몇 배까지만 미리 보내며 분석 (저메모리 모드)
+        
+        executor.map은 모든 작업을 한꺼번에 보내므로 병합이 느리면 끝난 결과가
+        메인 프로세스에 쌓입니다.
+        """
+        from collections import deque
+        
+        window = workers * 4
+        executor = self.executor or create_process_pool(workers, self._worker_options())
+        try:
+            pending = deque()
+            for file_path in code_files:
+                pending.append(executor.submit(_analyze_in_worker, file_path))
+                if len(pending) > window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            if executor is not self.executor:
+                executor.shutdown(cancel_futures=True)
+    
+    def _iter_archive_results(self, code_files: List[Path]) -> Iterator[Dict]:
+        """압축 파일 멤버를 저장된 순서대로 읽으며 분석
+        
+        멤버는 메인 프로세스에서 차례로 읽고 분석만 작업자에 맡깁니다. 읽은 내용이
+        한꺼번에 메모리에 쌓이지 않도록 작업자 수의 몇 배까지만 미리 보냅니다.
+        """
+        members = self._archive_members
+        if self.executor is None and (self.jobs <= 1 or len(code_files) < 2):
+            for file_path in code_files:
+                yield self._analyze_file(file_path, members[file_path])
+            return
+        
+        from collections import deque
+        
+        workers = max(1, min(self.jobs, len(code_files)))
+        window = workers * 4
+        executor = self.executor or create_process_pool(workers, self._worker_options())
+        try:
+            pending = deque()
+            for file_path in code_files:
+                file_result = self._new_file_result(file_path)
+                cache_key = None
+                try:
+                    member = members[file_path]
+                    cache_key = self._member_cache_key(file_path, member)
+                    cached = self._cached_member_result(file_path, member, cache_key)
+                    if cached is not None:
+                        file_result, data = cached, None
+                    else:
+                        with member.open() as f:
+                            data = self._read_source(file_path, f, member.size, file_result)
+                except Exception as e:
+                    file_result['issues'].append((IssueType.ERROR, (str(e),)))
+                    data = None
+                if data is None:
+                    pending.append(file_result)
+                else:
+                    pending.append(executor.submit(_analyze_data_in_worker, file_path, data,
+                                                   cache_key))
+                del data
+                
+                while len(pending) > window:
+                    item = pending.popleft()
+                    yield item if isinstance(item, dict) else item.result()
+            while pending:
+                item = pending.popleft()
+                yield item if isinstance(item, dict) else item.result()
+        finally:
+            if executor is not self.executor:
+                executor.shutdown(cancel_futures=True)
+    
+    def _collect_code_files(self) -> List[Path]:
+        """분석할 코드 파일 수집 (압축 파일이면 멤버를 '압축 파일 경로/멤버 경로'로 표시)
+        
+        revision이 있으면 그 커밋의 대상 디렉토리 아래 파일을 작업 트리와 같은 경로로 표시합니다.
+        """
+        from archive_source import is_archive
+        
+        code_files = []
+        
+        if self.revision or is_archive(self.target_path):
+            # 디스크에 풀거나 체크아웃하지 않고 멤버 목록만 읽음
+            self._archive = self._open_source()
+            for member, _ in self._archive.walk(self.ignore_patterns, self.use_gitignore):
+                file_path = self.target_path / member.name
+                self._archive_members[file_path] = member
+                code_files.append(file_path)
+        elif self.target_path.is_file():
+            if self.target_path.suffix in LANGUAGE_EXTENSIONS:
                 code_files.append(self.target_path)
-                self.analysis_results['languages'][extensions[self.target_path.suffix]] += 1
         else:
-            for ext, lang in extensions.items():
-                for file_path in self.target_path.rglob(f'*{ext}'):
-                    # 숨김 파일 및 특정 디렉토리 제외
-                    if not any(part.startswith('.') for part in file_path.parts):
-                        if 'node_modules' not in file_path.parts and 'venv' not in file_path.parts:
-                            code_files.append(file_path)
-                            self.analysis_results['languages'][lang] += 1
+            # 숨김/제외 디렉토리는 진입 전에 건너뛰는 단일 패스 순회
+            walker = FileWalker(self.target_path, self.ignore_patterns, self.use_gitignore)
+            code_files.extend(file_path for file_path, _ in walker.walk())
         
         return code_files
     
-    def _analyze_file(self, file_path: Path):
-        """개별 파일 분석"""
+    def _load_churn(self) -> Dict[str, int]:
+        """파일 경로(결과의 'file')별로 최근 커밋에서 바뀐 횟수
+        
+        git 저장소가 아니거나 압축 파일이면 빈 사전입니다. 커밋 대상이면 그 커밋까지의 기록을 셉니다.
+        """
+        if not self.hotspots or (self._archive is not None and not self.revision):
+            return {}
+        repo = GitRepository.discover(self.target_path)
+        if repo is None:
+            return {}
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
-                self.analysis_results['total_lines'] += len(lines)
-            
-            # 언어별 분석
-            if file_path.suffix == '.py':
-                self._analyze_python(file_path, content)
-            elif file_path.suffix in ['.js', '.ts']:
-                self._analyze_javascript(file_path, content)
-            elif file_path.suffix == '.java':
-                self._analyze_java(file_path, content)
+            prefix = repo.relative_path(self.target_path)
+            counts = repo.commit_counts(self.revision or 'HEAD', prefix, CHURN_MAX_COMMITS)
+        except GitError:
+            # 커밋이 없는 저장소 등
+            return {}
+        churn = {}
+        for path, count in counts.items():
+            if path == prefix:
+                file_path = self.target_path
             else:
-                self._analyze_generic(file_path, content)
-                
-        except Exception as e:
-            self.analysis_results['issues'].append({
-                'file': str(file_path),
-                'type': 'error',
-                'message': f'파일 분석 중 오류: {str(e)}'
+                file_path = self.target_path / (path[len(prefix) + 1:] if prefix else path)
+            churn[str(file_path)] = count
+        return churn
+    
+    def _open_source(self) -> 'ArchiveSource':
+        """압축 파일 또는 커밋 분석 소스"""
+        from archive_source import ArchiveSource
+        
+        if not self.revision:
+            return ArchiveSource(self.target_path)
+        repo = GitRepository.discover(self.target_path)
+        if repo is None:
+            raise ValueError(f"git 저장소가 아닙니다: {self.target_path}")
+        return GitTreeSource(repo, self.revision, repo.relative_path(self.target_path))
+    
+    def _identical_members(self, code_files: List[Path]) -> Dict[Path, Path]:
+        """내용 ID와 확장자가 앞서 나온 멤버와 같은 멤버 → 그 멤버의 경로
+        
+        분석 결과는 언어와 이름(.min. 여부)에 따라 다르므로 캐시 키처럼 함께 비교합니다.
+        """
+        first_seen = {}
+        identical = {}
+        for file_path in code_files:
+            content_id = self._archive_members[file_path].content_id
+            if content_id is None:
+                continue
+            key = (content_id, file_path.suffix, '.min.' in file_path.name)
+            original = first_seen.setdefault(key, file_path)
+            if original != file_path:
+                identical[file_path] = original
+        return identical
+    
+    def _member_cache_key(self, file_path: Path, member: 'ArchiveMember') -> Optional[str]:
+        """내용을 읽지 않고 계산한 캐시 키 (git blob ID가 있을 때만)
+        
+        이름과 크기로 정해지는 건너뛰기 조건은 blob ID로 알 수 없으므로 해당하면 사용하지 않습니다.
+        """
+        content_id = member.content_id
+        cache = self._get_cache()
+        if content_id is None or cache is None:
+            return None
+        if '.min.' in file_path.name or (self.max_file_size and member.size > self.max_file_size):
+            return None
+        return cache.blob_key(content_id, file_path.suffix)
+    
+    def _cached_member_result(self, file_path: Path, member: 'ArchiveMember',
+                              cache_key: Optional[str]) -> Optional[Dict]:
+        """blob ID로 캐시된 결과 (없으면 None)"""
+        if not cache_key:
+            return None
+        cached = self._get_cache().get(cache_key)
+        if cached is None:
+            return None
+        file_result = self._new_file_result(file_path)
+        file_result.update(cached)
+        return file_result
+    
+    def _new_file_result(self, file_path: Path) -> Dict:
+        """파일 하나의 분석 결과 (다른 파일과 공유하는 상태 없음)"""
+        return {
+            'file': str(file_path),
+            'language': LANGUAGE_EXTENSIONS.get(file_path.suffix, 'Unknown'),
+            'lines': 0,
+            'complexity': None,
+            'functions': [],
+            'skipped': None,
+            'comment_lines': 0,
+            'issues': [],
+            'readability_issues': [],
+            'structure_issues': [],
+            'duplicate_issues': [],
+            'fingerprints': []
+        }
+    
+    def _merge_file_result(self, file_result: Dict, retain_issues: bool = True):
+        """파일별 결과를 전체 분석 결과에 병합"""
+        results = self.analysis_results
+        file_name = sys.intern(file_result['file'])
+        results['total_lines'] += file_result['lines']
+        results['languages'][file_result['language']] += 1
+        
+        if file_result.get('skipped'):
+            results['skipped_files'].append({
+                'file': file_name,
+                'reason': file_result['skipped'],
+                'description': SKIP_REASONS[file_result['skipped']],
+                'lines': file_result['lines']
             })
+        else:
+            self._metrics.add_file(file_result['language'], file_result['lines'],
+                                   file_result['complexity'], file_result['comment_lines'],
+                                   file_result['functions'])
+        
+        complexity = file_result['complexity']
+        if complexity is not None:
+            if complexity > results['complexity']['max']:
+                results['complexity']['max'] = complexity
+            if complexity > 10:
+                results['complexity']['high_complexity_count'] += 1
+        
+        # 앞서 병합한 파일과의 중복 (저장된 결과를 재사용한 파일도 다시 계산)
+        file_result['duplicate_issues'] = self._duplicates.add(file_name,
+                                                               file_result['fingerprints'])
+        results['duplicates'].update(self._duplicates.summary())
+        self._vendored.add(self._relative_name(Path(file_name)), file_result['fingerprints'],
+                           file_result['lines'])
+        
+        # 점수 계산은 개수만 사용하므로 이슈 목록 보관 여부와 관계없이 집계
+        issue_counts = results['issue_counts']
+        for key, category, target in (('issues', 'issues', results['issues']),
+                                      ('readability_issues', 'readability',
+                                       results['readability']['issues']),
+                                      ('structure_issues', 'structure',
+                                       results['structure']['issues']),
+                                      ('duplicate_issues', 'duplicates',
+                                       results['duplicates']['issues'])):
+            for code, args in file_result[key]:
+                severity = ISSUE_SEVERITY[code]
+                label = severity.label if severity is not None else None
+                self._issue_counts[category, label] += 1
+                if label:
+                    issue_counts[label] += 1
+                if retain_issues:
+                    target.append(Issue(file_name, code, args))
+        
+        if not file_result.get('skipped'):
+            issue_count = sum(len(file_result[key]) for key in
+                              ('issues', 'readability_issues', 'structure_issues',
+                               'duplicate_issues'))
+            self._hotspots.add_file(file_name, file_result['lines'], complexity, issue_count,
+                                    self._churn.get(file_name, 0), file_result['functions'])
+    
+    def _analyze_file(self, file_path: Path, member: Optional['ArchiveMember'] = None) -> Dict:
+        """개별 파일 분석 (member가 있으면 디스크 대신 압축 파일 멤버에서 읽음)"""
+        file_result = self._new_file_result(file_path)
+        timer = self._timer = self.profiler.file_timer(file_result)
+        cache_key = None
+        try:
+            if member is None:
+                with open(file_path, 'rb') as f:
+                    data = self._read_source(file_path, f, os.fstat(f.fileno()).st_size,
+                                             file_result)
+            else:
+                cache_key = self._member_cache_key(file_path, member)
+                cached = self._cached_member_result(file_path, member, cache_key)
+                if cached is not None:
+                    timer.lap('cache')
+                    return cached
+                with member.open() as f:
+                    data = self._read_source(file_path, f, member.size, file_result)
+            if data is None:
+                timer.lap('skip')
+                return file_result
+            timer.lap('read')
+            self._analyze_content(file_path, data, file_result, cache_key)
+        except Exception as e:
+            file_result['issues'].append((IssueType.ERROR, (str(e),)))
+        
+        return file_result
     
-    def _analyze_python(self, file_path: Path, content: str):
+    def _analyze_data(self, file_path: Path, data: bytes, cache_key: Optional[str] = None) -> Dict:
+        """이미 읽은 내용 분석 (건너뛸 파일인지는 읽을 때 판별됨)"""
+        file_result = self._new_file_result(file_path)
+        self._timer = self.profiler.file_timer(file_result)
+        try:
+            self._analyze_content(file_path, data, file_result, cache_key)
+        except Exception as e:
+            file_result['issues'].append((IssueType.ERROR, (str(e),)))
+        return file_result
+    
+    def _read_source(self, file_path: Path, stream: IO[bytes], size: int,
+                     file_result: Dict) -> Optional[bytes]:
+        """스트림의 전체 내용 반환
+        
+        앞부분만 보고 품질 평가에 의미 없는 파일이면 되감지 않고 줄 수만 센 뒤
+        file_result에 건너뛴 이유를 기록하고 None을 반환합니다.
+        """
+        head = stream.read(SNIFF_BYTES)
+        skip_reason = self._detect_skip_reason(file_path, head, size)
+        if skip_reason:
+            file_result['skipped'] = skip_reason
+            if skip_reason != 'binary':
+                file_result['lines'] = head.count(b'\n') + count_lines(stream)
+            return None
+        return head + stream.read()
+    
+    def _analyze_content(self, file_path: Path, data: bytes, file_result: Dict,
+                         cache_key: Optional[str] = None):
+        """파일 내용 분석 (결과는 file_result에 기록, cache_key가 없으면 내용으로 계산)"""
+        timer = self._timer
+        # 내용이 같은 파일은 이전 분석 결과를 그대로 사용
+        cache = self._get_cache()
+        if cache and not cache_key:
+            cache_key = cache.key(data, file_path.suffix)
+        if cache_key:
+            cached = cache.get(cache_key)
+            timer.lap('cache')
+            if cached is not None:
+                file_result.update(cached)
+                return
+        
+        # 한 번만 디코딩해 줄 단위 지표, 언어별 분석, 중복 코드 지문이 모두 공유
+        content = data.decode('utf-8', errors='ignore')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        stats = scan_text(content)
+        file_result['lines'] = stats.line_count
+        timer.lap('decode')
+        
+        # 언어별 분석
+        if file_path.suffix == '.py':
+            self._analyze_python(file_path, content, stats, file_result)
+            timer.lap('python')
+        elif file_path.suffix in CLIKE_DIALECTS:
+            self._analyze_clike(file_path, content, stats, file_result)
+        else:
+            self._analyze_generic(file_path, stats, file_result)
+            timer.lap('generic')
+        
+        file_result['comment_lines'] = stats.comment_lines
+        
+        # 중복 코드 탐지용 지문 (색인은 메인 프로세스에서 파일 순서대로 만듦)
+        file_result['fingerprints'] = fingerprint(content, file_result['language'])
+        timer.lap('fingerprint')
+        
+        if cache_key:
+            cache.put(cache_key, {k: v for k, v in file_result.items()
+                                  if k not in ('file', 'language', 'timings', 'duplicate_issues')})
+            timer.lap('cache')
+    
+    def _detect_skip_reason(self, file_path: Path, head: bytes, size: int) -> Optional[str]:
+        """바이너리, 압축, 자동 생성, 크기 초과 파일 판별 (해당 없으면 None)"""
+        if b'\0' in head:
+            return 'binary'
+        if self.max_file_size and size > self.max_file_size:
+            return 'too_large'
+        
+        name = file_path.name
+        if '.min.' in name:
+            return 'minified'
+        # 앞부분의 평균 줄 길이가 지나치게 길면 압축된 코드
+        # (줄 끝이 CR뿐인 옛 Mac 형식도 한 줄로 보지 않도록 CR도 셈)
+        newlines = max(head.count(b'\n'), head.count(b'\r'))
+        if len(head) >= 1024 and len(head) / (newlines + 1) > 300:
+            return 'minified'
+        
+        prologue = head[:1024].lower()
+        if any(marker in prologue for marker in _GENERATED_MARKERS):
+            return 'generated'
+        return None
+    
+    def _analyze_python(self, file_path: Path, content: str, stats: LineStats,
+                        file_result: Dict):
         """Python 코드 분석"""
         try:
             tree = ast.parse(content)
+            self._timer.lap('parse')
             
-            # 복잡도 분석
-            complexity = self._calculate_complexity_python(tree)
-            files_count = self.analysis_results['files_analyzed']
-            if files_count > 0:
-                self.analysis_results['complexity']['avg'] = (
-                    self.analysis_results['complexity']['avg'] * 
-                    (files_count - 1) + complexity
-                ) / files_count
-            else:
-                self.analysis_results['complexity']['avg'] = complexity
-            
-            if complexity > self.analysis_results['complexity']['max']:
-                self.analysis_results['complexity']['max'] = complexity
-                if complexity > 10:
-                    self.analysis_results['complexity']['high_complexity_files'].append({
-                        'file': str(file_path),
-                        'complexity': complexity
-                    })
+            # 복잡도와 구조 정보를 한 번의 순회로 수집
+            metrics = _PythonMetricsVisitor()
+            metrics.visit(tree)
+            del tree
+            file_result['complexity'] = metrics.complexity
+            file_result['functions'] = metrics.functions
             
             # 가독성 체크
-            self._check_readability(file_path, content, 'Python')
+            self._check_readability(file_path, stats, 'Python', file_result)
             
             # 구조 체크
-            self._check_structure_python(tree, file_path)
+            self._check_structure_python(metrics, file_path, file_result)
             
         except SyntaxError as e:
-            self.analysis_results['issues'].append({
-                'file': str(file_path),
-                'type': 'syntax_error',
-                'message': f'구문 오류: {str(e)}',
-                'severity': 'high'
-            })
+            file_result['issues'].append((IssueType.SYNTAX_ERROR, (str(e),)))
     
-    def _analyze_javascript(self, file_path: Path, content: str):
-        """JavaScript/TypeScript 코드 분석"""
-        lines = content.split('\n')
+    def _analyze_clike(self, file_path: Path, content: str, stats: LineStats,
+                       file_result: Dict):
+        """C 계열 코드 분석 (한 번의 토큰화로 얻은 지표를 언어별 검사가 공유)"""
+        metrics = scan_clike(content, CLIKE_DIALECTS[file_path.suffix])
+        self._timer.lap('lexer')
         
-        # 기본 메트릭
-        function_count = len(re.findall(r'\bfunction\s+\w+|const\s+\w+\s*=\s*\(|=>', content))
-        class_count = len(re.findall(r'\bclass\s+\w+', content))
+        # 문자열 안의 '//' 등은 주석으로 세지 않음
+        stats.comment_lines = metrics.comment_lines
+        file_result['complexity'] = metrics.complexity
+        file_result['functions'] = metrics.functions
         
+        if file_path.suffix in ('.js', '.ts'):
+            self._analyze_javascript(file_path, metrics, stats, file_result)
+            self._timer.lap('javascript')
+        elif file_path.suffix == '.java':
+            self._analyze_java(file_path, metrics, stats, file_result)
+            self._timer.lap('java')
+        else:
+            self._check_readability(file_path, stats, file_result['language'], file_result)
+            self._check_function_length(metrics.functions, file_result)
+            self._timer.lap('generic')
+    
+    def _analyze_javascript(self, file_path: Path, metrics: CLikeMetrics, stats: LineStats,
+                            file_result: Dict):
+        """JavaScript/TypeScript 코드 분석"""
         # 가독성 체크
-        self._check_readability(file_path, content, 'JavaScript')
+        self._check_readability(file_path, stats, 'JavaScript', file_result)
         
         # 긴 함수 체크
-        if len(lines) > 200:
-            self.analysis_results['issues'].append({
-                'file': str(file_path),
-                'type': 'long_file',
-                'message': f'파일이 너무 깁니다 ({len(lines)}줄). 모듈화를 고려하세요.',
-                'severity': 'medium'
-            })
+        if stats.line_count > 200:
+            file_result['issues'].append((IssueType.LONG_FILE, (stats.line_count,)))
+        
+        self._check_function_length(metrics.functions, file_result)
     
-    def _analyze_java(self, file_path: Path, content: str):
+    def _analyze_java(self, file_path: Path, metrics: CLikeMetrics, stats: LineStats,
+                      file_result: Dict):
         """Java 코드 분석"""
-        self._check_readability(file_path, content, 'Java')
-        
-        # 클래스 구조 체크
-        class_count = len(re.findall(r'\bpublic\s+class\s+\w+', content))
-        if class_count == 0:
-            self.analysis_results['issues'].append({
-                'file': str(file_path),
-                'type': 'structure',
-                'message': '클래스 정의가 없습니다.',
-                'severity': 'low'
-            })
-    
-    def _analyze_generic(self, file_path: Path, content: str):
-        """일반적인 코드 분석 (언어 무관)"""
-        self._check_readability(file_path, content, 'Generic')
-    
-    def _calculate_complexity_python(self, tree: ast.AST) -> int:
-        """Python 코드의 복잡도 계산 (간단한 버전)"""
-        complexity = 1  # 기본 복잡도
+        self._check_readability(file_path, stats, 'Java', file_result)
         
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.Try, ast.With)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
+        # 클래스 구조 체크 (주석과 문자열 안의 선언은 제외됨)
+        if metrics.class_count == 0:
+            file_result['issues'].append((IssueType.STRUCTURE, ()))
         
-        return complexity
+        self._check_function_length(metrics.functions, file_result)
     
-    def _check_readability(self, file_path: Path, content: str, language: str):
-        """가독성 체크"""
-        lines = content.split('\n')
-        
+    def _analyze_generic(self, file_path: Path, stats: LineStats, file_result: Dict):
+        """일반적인 코드 분석 (언어 무관)"""
+        self._check_readability(file_path, stats, 'Generic', file_result)
+    
+    def _check_readability(self, file_path: Path, stats: LineStats, language: str,
+                           file_result: Dict):
+        """가독성 체크 (줄 단위 지표는 LineStats에서 한 번에 계산됨)"""
         # 주석 비율
-        comment_lines = sum(1 for line in lines if line.strip().startswith('#') or 
-                           '//' in line or '/*' in line or '*/' in line)
-        comment_ratio = comment_lines / len(lines) if lines else 0
-        
-        if comment_ratio < 0.1 and len(lines) > 50:
-            self.analysis_results['readability']['issues'].append({
-                'file': str(file_path),
-                'type': 'low_comments',
-                'message': '주석이 부족합니다. 코드 이해를 위해 주석을 추가하세요.',
-                'severity': 'medium'
-            })
+        comment_ratio = stats.comment_ratio
+        
+        if comment_ratio < 0.1 and stats.line_count > 50:
+            file_result['readability_issues'].append((IssueType.LOW_COMMENTS, ()))
         
         # 긴 줄 체크
-        long_lines = [i+1 for i, line in enumerate(lines) if len(line) > 120]
-        if long_lines:
-            self.analysis_results['readability']['issues'].append({
-                'file': str(file_path),
-                'type': 'long_lines',
-                'message': f'120자를 초과하는 긴 줄이 {len(long_lines)}개 있습니다.',
-                'severity': 'low'
-            })
+        if stats.long_lines:
+            file_result['readability_issues'].append(
+                (IssueType.LONG_LINES, (LONG_LINE_LENGTH, stats.long_lines)))
         
         # 빈 줄 비율 (구조적 가독성)
-        empty_lines = sum(1 for line in lines if not line.strip())
-        empty_ratio = empty_lines / len(lines) if lines else 0
-        if empty_ratio < 0.05:
-            self.analysis_results['readability']['issues'].append({
-                'file': str(file_path),
-                'type': 'dense_code',
-                'message': '코드가 너무 밀집되어 있습니다. 가독성을 위해 빈 줄을 추가하세요.',
-                'severity': 'low'
-            })
+        if stats.empty_ratio < 0.05:
+            file_result['readability_issues'].append((IssueType.DENSE_CODE, ()))
     
-    def _check_structure_python(self, tree: ast.AST, file_path: Path):
+    def _check_structure_python(self, metrics: _PythonMetricsVisitor, file_path: Path,
+                                file_result: Dict):
         """Python 구조 체크"""
-        functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-        classes = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-        
-        # 긴 함수 체크
-        for func in functions:
-            if func.end_lineno and func.lineno:
-                func_length = func.end_lineno - func.lineno
-                if func_length > 50:
-                    self.analysis_results['structure']['issues'].append({
-                        'file': str(file_path),
-                        'type': 'long_function',
-                        'message': f'함수 "{func.name}"이 너무 깁니다 ({func_length}줄). 분리하는 것을 고려하세요.',
-                        'severity': 'medium'
-                    })
+        self._check_function_length(metrics.functions, file_result)
         
         # 전역 변수 남용 체크
-        global_vars = [node for node in ast.walk(tree) if isinstance(node, ast.Global)]
-        if len(global_vars) > 5:
-            self.analysis_results['structure']['issues'].append({
-                'file': str(file_path),
-                'type': 'too_many_globals',
-                'message': '전역 변수가 너무 많습니다. 구조를 개선하세요.',
-                'severity': 'medium'
-            })
+        if metrics.global_count > 5:
+            file_result['structure_issues'].append((IssueType.TOO_MANY_GLOBALS, ()))
+    
+    def _check_function_length(self, functions: List[Dict], file_result: Dict):
+        """긴 함수 체크"""
+        for func in functions:
+            if func['length'] > 50:
+                file_result['structure_issues'].append(
+                    (IssueType.LONG_FUNCTION, (func['name'], func['length'], func['line'])))
+    
+    def _count_issues(self, category: str) -> int:
+        """분류별 전체 이슈 수"""
+        return sum(count for (issue_category, _), count in self._issue_counts.items()
+                   if issue_category == category)
+    
+    def _summarize_metrics(self):
+        """파일별/함수별 지표의 분포를 계산하고 평균 복잡도를 갱신"""
+        metrics = self._metrics.summary()
+        self.analysis_results['metrics'] = metrics
+        self.analysis_results['complexity']['avg'] = metrics['complexity'].get('mean', 0)
+    
+    def _summarize_hotspots(self):
+        """순위별 상위 파일과 함수를 기록하고 복잡도가 높은 파일 목록을 복잡도 순으로 채움"""
+        hotspots = self._hotspots.summary()
+        self.analysis_results['hotspots'] = hotspots
+        self.analysis_results['complexity']['high_complexity_files'] = [
+            {'file': item['file'], 'complexity': item['complexity']}
+            for item in hotspots['files']['complexity'] if item['complexity'] > 10
+        ]
     
     def _calculate_overall_score(self):
         """종합 점수 계산 (0-100)"""
         score = 100
+        metrics = self.analysis_results['metrics']
         
-        # 복잡도 감점
+        # 복잡도 감점 (파일 평균, 함수 상위 10% 복잡도)
         if self.analysis_results['complexity']['avg'] > 10:
             score -= 20
         elif self.analysis_results['complexity']['avg'] > 5:
             score -= 10
+        if metrics.get('function_complexity', {}).get('p90', 0) > 10:
+            score -= 5
         
         # 이슈 감점
-        high_severity = sum(1 for issue in self.analysis_results['issues'] 
-                          if issue.get('severity') == 'high')
-        medium_severity = sum(1 for issue in self.analysis_results['issues'] 
-                            if issue.get('severity') == 'medium')
+        high_severity = self._issue_counts['issues', 'high']
+        medium_severity = self._issue_counts['issues', 'medium']
         
         score -= high_severity * 5
         score -= medium_severity * 2
         
         # 가독성 감점
-        score -= len(self.analysis_results['readability']['issues']) * 1
-        score -= len(self.analysis_results['structure']['issues']) * 2
+        score -= self._count_issues('readability') * 1
+        score -= self._count_issues('structure') * 2
+        score -= self._count_issues('duplicates') * 2
         
         # 최소 0점 보장
         score = max(0, min(100, score))
@@ -0,0 +1,22 @@
+"""
+콘솔 출력 설정
+명령줄 진입점(analyzer, batch_analyzer, server)이 공유하는 터미널 설정입니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import io
+import sys
+
+
+def configure_console_encoding():
+    """Windows 콘솔에서도 한글이 깨지지 않도록 표준 출력/오류를 UTF-8로 설정"""
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
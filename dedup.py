@@ -0,0 +1,204 @@
+"""
+동일 파일과 복사된 디렉토리 탐지
+내용이 같은 파일은 한 번만 분석하도록 묶고, MinHash/LSH로 거의 같은
+디렉토리(벤더링한 라이브러리, 복사한 템플릿 등)를 찾습니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import hashlib
+import os
+import posixpath
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# 크기가 같은 파일은 먼저 이만큼의 앞부분 해시로 나눈 뒤 전체를 비교
+_HEAD_BYTES = 4096
+_CHUNK_BYTES = 1024 * 1024
+
+# MinHash 서명 길이 (해시 공간을 이만큼의 구간으로 나눠 구간별 최솟값을 보관)
+SIGNATURE_SIZE = 64
+
+# LSH 밴드 수 (밴드마다 8개 값) - 유사도가 약 0.77 이상인 디렉토리 쌍이 후보가 됨
+LSH_BANDS = 8
+
+# 이 이상 비슷하면 복사된 디렉토리로 판단
+VENDORED_SIMILARITY = 0.8
+
+# 이보다 작은 디렉토리는 비교하지 않음
+VENDORED_MIN_FILES = 2
+VENDORED_MIN_LINES = 200
+
+_BUCKET_BITS = 6
+_EMPTY = (1 << 64) - 1
+
+
+def _digest(path: Path, limit: Optional[int] = None) -> Optional[bytes]:
+    """파일 내용(limit가 있으면 앞부분)의 해시 (읽을 수 없으면 None)"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            if limit:
+                digest.update(f.read(limit))
+            else:
+                for chunk in iter(lambda: f.read(_CHUNK_BYTES), b''):
+                    digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def _split_by_digest(paths: List[Path], limit: Optional[int] = None) -> List[List[Path]]:
+    """해시가 같은 파일끼리 묶은 목록 (두 개 이상인 묶음만, 입력 순서 유지)"""
+    groups = defaultdict(list)
+    for path in paths:
+        digest = _digest(path, limit)
+        if digest is not None:
+            groups[digest].append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def find_identical_files(paths: Iterable[Path]) -> Dict[Path, Path]:
+    """앞서 나온 파일과 내용이 같은 파일 → 그 파일 (처음 나온 파일은 포함하지 않음)
+
+    확장자와 크기가 같은 파일끼리만 앞부분, 전체 순서로 해시를 비교하므로
+    크기가 겹치지 않는 대부분의 파일은 읽지 않습니다. 분석 결과는 언어에 따라
+    다르므로 내용이 같아도 확장자나 압축(minified) 파일 이름(.min.) 여부가 다르면 묶지 않습니다.
+    """
+    by_size = defaultdict(list)
+    for path in paths:
+        try:
+            by_size[path.suffix, '.min.' in path.name, os.stat(path).st_size].append(path)
+        except OSError:
+            continue
+
+    identical = {}
+    for (_, _, size), group in by_size.items():
+        if len(group) < 2:
+            continue
+        for head_group in _split_by_digest(group, _HEAD_BYTES):
+            same_groups = [head_group] if size <= _HEAD_BYTES else _split_by_digest(head_group)
+            for same in same_groups:
+                for path in same[1:]:
+                    identical[path] = same[0]
+    return identical
+
+
+def _signature(fingerprints: List[int]) -> array:
+    """파일 지문 해시 집합의 MinHash 서명 (해시의 하위 비트로 구간을 나누는 단일 순열 방식)"""
+    signature = [_EMPTY] * SIGNATURE_SIZE
+    mask = SIGNATURE_SIZE - 1
+    for i in range(0, len(fingerprints), 3):
+        h = fingerprints[i]
+        bucket = h & mask
+        value = h >> _BUCKET_BITS
+        if value < signature[bucket]:
+            signature[bucket] = value
+    return array('Q', signature)
+
+
+def _similarity(a: array, b: array) -> float:
+    """두 서명으로 추정한 Jaccard 유사도 (둘 다 빈 구간은 제외)"""
+    same = used = 0
+    for x, y in zip(a, b):
+        if x == _EMPTY and y == _EMPTY:
+            continue
+        used += 1
+        same += x == y
+    return same / used if used else 0.0
+
+
+class VendoredDirectoryIndex:
+    """디렉토리별 MinHash 서명을 모아 거의 같은 디렉토리 쌍을 찾음
+
+    디렉토리 서명은 하위 모든 파일의 중복 탐지 지문을 합친 집합의 서명이므로
+    파일마다 상위 디렉토리 서명에 원소별 최솟값으로 합칩니다. 디렉토리마다
+    고정 크기 서명만 보관하므로 메모리는 디렉토리 수에 비례합니다.
+    """
+
+    def __init__(self, similarity: float = VENDORED_SIMILARITY,
+                 min_files: int = VENDORED_MIN_FILES, min_lines: int = VENDORED_MIN_LINES):
+        self.similarity = similarity
+        self.min_files = min_files
+        self.min_lines = min_lines
+        # 디렉토리 → [서명, 파일 수, 줄 수] (처음 나온 순서 유지)
+        self._directories = {}
+
+    def add(self, file_name: str, fingerprints: List[int], lines: int):
+        """분석 대상 기준 상대 경로의 파일 하나를 상위 디렉토리에 반영"""
+        signature = _signature(fingerprints) if fingerprints else None
+        directory = posixpath.dirname(file_name)
+        while directory:
+            entry = self._directories.get(directory)
+            if entry is None:
+                entry = self._directories[directory] = [
+                    signature if signature is not None else array('Q', [_EMPTY] * SIGNATURE_SIZE),
+                    0, 0]
+            elif signature is not None:
+                entry[0] = array('Q', map(min, entry[0], signature))
+            entry[1] += 1
+            entry[2] += lines
+            directory = posixpath.dirname(directory)
+
+    def find(self) -> List[Dict]:
+        """먼저 나온 디렉토리와 거의 같은 디렉토리 목록
+
+        상위 디렉토리끼리도 같으면 상위 디렉토리 쌍만 보고합니다.
+        """
+        directories = self._directories
+        # 모든 파일이 하위 디렉토리 하나에 있는 디렉토리는 그 하위 디렉토리와 서명이 같으므로 제외
+        wrappers = {posixpath.dirname(directory) for directory, entry in directories.items()
+                    if directories.get(posixpath.dirname(directory), entry)[1] == entry[1]}
+        eligible = [(directory, entry) for directory, entry in directories.items()
+                    if directory not in wrappers and entry[1] >= self.min_files
+                    and entry[2] >= self.min_lines]
+        order = {directory: index for index, (directory, _) in enumerate(eligible)}
+
+        # LSH: 밴드 값이 같은 디렉토리를 그 밴드에서 처음 나온 디렉토리와 후보로 묶음
+        rows = SIGNATURE_SIZE // LSH_BANDS
+        empty_band = (_EMPTY,) * rows
+        candidates = set()
+        for band in range(LSH_BANDS):
+            first_seen = {}
+            for directory, entry in eligible:
+                key = tuple(entry[0][band * rows:(band + 1) * rows])
+                if key == empty_band:
+                    continue
+                original = first_seen.setdefault(key, directory)
+                if original != directory:
+                    candidates.add((original, directory))
+
+        pairs = {}
+        for original, copy in sorted(candidates, key=lambda pair: (order[pair[1]], order[pair[0]])):
+            if copy in pairs or copy.startswith(original + '/') or original.startswith(copy + '/'):
+                continue
+            similarity = _similarity(directories[original][0], directories[copy][0])
+            if similarity >= self.similarity:
+                pairs[copy] = (original, similarity)
+
+        vendored = []
+        for copy, (original, similarity) in pairs.items():
+            if self._inside_reported_pair(copy, original, pairs):
+                continue
+            _, files, lines = directories[copy]
+            vendored.append({'directory': copy, 'original': original,
+                             'similarity': round(similarity, 2), 'files': files, 'lines': lines})
+        return vendored
+
+    @staticmethod
+    def _inside_reported_pair(copy: str, original: str, pairs: Dict) -> bool:
+        """상위 디렉토리 쌍이 이미 이 쌍을 포함하는지 확인"""
+        parent = posixpath.dirname(copy)
+        while parent:
+            if parent in pairs and original.startswith(pairs[parent][0] + '/'):
+                return True
+            parent = posixpath.dirname(parent)
+        return False
@@ -0,0 +1,244 @@
+"""
+중복 코드 탐지
+정규화한 토큰열에서 winnowing 지문을 뽑고, 모든 파일의 지문을 하나의
+색인에 모아 파일 사이(또는 한 파일 안)의 복사-붙여넣기 블록을 찾습니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import re
+import zlib
+from typing import Dict, List, Pattern, Tuple
+
+from issues import IssueType
+
+
+# 지문 하나가 덮는 토큰 수 (k-gram)
+DUPLICATE_TOKENS = 50
+
+# winnowing 창 크기 - DUPLICATE_TOKENS + WINNOW_WINDOW - 1개 이상 같은 토큰열은 반드시 찾음
+WINNOW_WINDOW = 30
+
+# 이보다 짧은 중복 블록(줄)은 보고하지 않음
+DUPLICATE_MIN_LINES = 6
+
+# 색인에 보관할 최대 지문 수 (넘으면 표본 비율을 절반으로 줄임)
+DEFAULT_MAX_FINGERPRINTS = 500_000
+
+_HASH_BASE = 1_000_003
+_HASH_MODULUS = (1 << 61) - 1
+
+# 색인 값에 시작 줄과 줄 수를 함께 담기 위한 비트 수
+_LINE_BITS = 21
+_LINE_MASK = (1 << _LINE_BITS) - 1
+
+# '#' 주석을 쓰는 언어 (PHP는 '//'와 '#' 모두 사용)
+_HASH_COMMENT_LANGUAGES = frozenset({'Python', 'Ruby'})
+
+_literal_patterns: Dict[str, Pattern] = {}
+
+# 정규화한 내용의 토큰 (식별자/키워드, 숫자, 그 밖의 한 글자)
+_find_tokens = re.compile(r'[^\W\d]\w*|\d[\w.]*|\S').findall
+
+
+def _literal_pattern(language: str) -> Pattern:
+    """언어별 주석/문자열 리터럴 정규식 (처음 사용할 때 컴파일)"""
+    pattern = _literal_patterns.get(language)
+    if pattern is None:
+        comments = []
+        if language not in _HASH_COMMENT_LANGUAGES:
+            comments += [r'//[^\n]*', r'/\*[\s\S]*?(?:\*/|\Z)']
+        if language in _HASH_COMMENT_LANGUAGES or language == 'PHP':
+            comments.append(r'#[^\n]*')
+        strings = [r'"(?:[^"\\\n]|\\.)*"', r"'(?:[^'\\\n]|\\.)*'"]
+        if language == 'Python':
+            strings[:0] = [r'"""[\s\S]*?(?:"""|\Z)', r"'''[\s\S]*?(?:'''|\Z)"]
+        elif language in ('JavaScript', 'TypeScript', 'Go'):
+            strings.insert(0, r'`(?:[^`\\]|\\[\s\S])*`')
+        pattern = _literal_patterns[language] = re.compile(
+            f"(?P<comment>{'|'.join(comments)})|(?P<string>{'|'.join(strings)})")
+    return pattern
+
+
+def _replace_literal(match) -> str:
+    """주석은 지우고 문자열은 '"' 하나로 바꾸되 줄 번호가 유지되도록 줄바꿈은 남김"""
+    newlines = '\n' * match.group().count('\n')
+    return newlines if match.lastgroup == 'comment' else '"' + newlines
+
+
+class _TokenIds(dict):
+    """토큰 → 정수 ID (처음 나온 토큰만 crc32 계산, 숫자 리터럴은 모두 같은 ID)"""
+
+    def __missing__(self, token: str) -> int:
+        text = '0' if token[0].isdigit() else token
+        token_id = self[token] = zlib.crc32(text.encode('utf-8')) + 1
+        return token_id
+
+
+def fingerprint(content: str, language: str) -> List[int]:
+    """정규화한 토큰열의 winnowing 지문 (해시, 시작 줄, 끝 줄을 이어 붙인 목록)
+
+    공백과 주석은 버리고 문자열과 숫자 리터럴은 값과 관계없이 같은 토큰으로
+    바꾸므로 들여쓰기나 주석, 리터럴만 다른 복사본도 찾습니다. 해시는 작업자
+    프로세스와 캐시 사이에서 같아야 하므로 hash() 대신 crc32와 Rabin-Karp를 씁니다.
+    """
+    normalized = _literal_pattern(language).sub(_replace_literal, content)
+    token_id = _TokenIds().__getitem__
+    ids = []
+    lines = []
+    for number, line in enumerate(normalized.split('\n'), 1):
+        tokens = _find_tokens(line)
+        if tokens:
+            ids += map(token_id, tokens)
+            lines += [number] * len(tokens)
+    del normalized
+
+    k = DUPLICATE_TOKENS
+    if len(ids) < k:
+        return []
+
+    # k-gram 해시 (Rabin-Karp)
+    base, modulus = _HASH_BASE, _HASH_MODULUS
+    leading = pow(base, k - 1, modulus)
+    h = 0
+    for value in ids[:k]:
+        h = (h * base + value) % modulus
+    hashes = [h]
+    append = hashes.append
+    for old, new in zip(ids, ids[k:]):
+        h = ((h - old * leading) * base + new) % modulus
+        append(h)
+
+    # 창마다 가장 작은 해시(같으면 가장 오른쪽)를 선택
+    # 선택된 값이 창을 벗어날 때만 창 전체를 다시 봄 (평균적으로 선형 시간)
+    window = min(WINNOW_WINDOW, len(hashes))
+    fingerprints = []
+    selected = -1
+    for end in range(window - 1, len(hashes)):
+        start = end - window + 1
+        if selected < start:
+            segment = hashes[start:end + 1]
+            smallest = min(segment)
+            selected = end - segment[::-1].index(smallest)
+        elif hashes[end] <= hashes[selected]:
+            selected = end
+        else:
+            continue
+        fingerprints += (hashes[selected], lines[selected], lines[selected + k - 1])
+    return fingerprints
+
+
+class DuplicateIndex:
+    """모든 파일의 지문 색인
+
+    지문마다 처음 나온 위치만 보관하고, 나중에 같은 지문이 나오면 처음 위치와의
+    중복으로 봅니다. 항목 수가 max_entries를 넘으면 해시의 하위 비트가 0인 지문만
+    남기도록 표본 비율을 절반씩 줄이므로 저장소 크기와 관계없이 메모리가 제한됩니다.
+    표본을 줄여도 긴 중복 블록은 대부분 찾지만 짧은 블록은 놓칠 수 있습니다.
+    """
+
+    def __init__(self, min_lines: int = DUPLICATE_MIN_LINES,
+                 max_entries: int = DEFAULT_MAX_FINGERPRINTS):
+        self.min_lines = min_lines
+        self.max_entries = max_entries
+        self.blocks = 0
+        self.duplicated_lines = 0
+        self._files = []
+        self._entries = {}
+        self._sample_bits = 0
+
+    @property
+    def sampling(self) -> int:
+        """지문 표본 비율의 역수 (1이면 모든 지문 사용)"""
+        return 1 << self._sample_bits
+
+    def summary(self) -> Dict:
+        return {
+            'blocks': self.blocks,
+            'duplicated_lines': self.duplicated_lines,
+            'sampling': self.sampling
+        }
+
+    def add(self, file_name: str, fingerprints: List[int]) -> List[Tuple[IssueType, tuple]]:
+        """파일의 지문을 색인에 추가하고 앞서 나온 코드와 중복된 블록을 이슈로 반환"""
+        file_id = len(self._files)
+        self._files.append(file_name)
+        entries = self._entries
+        mask = self.sampling - 1
+
+        matches = []
+        for i in range(0, len(fingerprints), 3):
+            h = fingerprints[i]
+            if h & mask:
+                continue
+            start, end = fingerprints[i + 1], fingerprints[i + 2]
+            packed = entries.get(h)
+            if packed is None:
+                entries[h] = ((file_id << _LINE_BITS | min(start, _LINE_MASK)) << _LINE_BITS
+                              | min(end - start, _LINE_MASK))
+                continue
+            other_id = packed >> (2 * _LINE_BITS)
+            other_start = (packed >> _LINE_BITS) & _LINE_MASK
+            other_end = other_start + (packed & _LINE_MASK)
+            if other_id == file_id and other_end >= start:
+                # 한 파일 안에서 겹치는 반복 (같은 토큰이 이어지는 표 등)
+                continue
+            matches.append((other_id, start, end, other_start, other_end))
+
+        if len(entries) > self.max_entries:
+            self._shrink()
+        return self._report(matches)
+
+    def reduce(self) -> bool:
+        """메모리가 부족할 때 표본 비율을 절반으로 줄이고 한도도 줄어든 항목 수로 낮춤
+
+        줄일 항목이 없으면 거짓을 반환합니다.
+        """
+        if not self._entries:
+            return False
+        self._halve_sample()
+        self.max_entries = max(1, len(self._entries))
+        return True
+
+    def _shrink(self):
+        """항목 수가 한도 아래로 내려갈 때까지 표본 비율을 절반으로 줄임"""
+        while len(self._entries) > self.max_entries:
+            self._halve_sample()
+
+    def _halve_sample(self):
+        self._sample_bits += 1
+        mask = self.sampling - 1
+        self._entries = {h: packed for h, packed in self._entries.items() if not h & mask}
+
+    def _report(self, matches: List[Tuple[int, ...]]) -> List[Tuple[IssueType, tuple]]:
+        """이어진 일치를 블록으로 합쳐 최소 길이 이상인 것만 이슈로 변환"""
+        blocks = []
+        for other_id, start, end, other_start, other_end in sorted(matches):
+            if blocks:
+                block = blocks[-1]
+                if block[0] == other_id and start <= block[2] + 1 and \
+                        block[3] <= other_start <= block[4] + 1:
+                    block[2] = max(block[2], end)
+                    block[4] = max(block[4], other_end)
+                    continue
+            blocks.append([other_id, start, end, other_start, other_end])
+
+        issues = []
+        covered_until = 0
+        for other_id, start, end, other_start, _ in sorted(blocks, key=lambda b: b[1]):
+            length = end - start + 1
+            if length < self.min_lines:
+                continue
+            issues.append((IssueType.DUPLICATE_CODE,
+                           (start, length, self._files[other_id], other_start)))
+            self.blocks += 1
+            # 여러 원본과 겹치는 줄은 한 번만 셈
+            self.duplicated_lines += max(0, end - max(start, covered_until + 1) + 1)
+            covered_until = max(covered_until, end)
+        return issues
@@ -0,0 +1,203 @@
+"""
+코드 파일 수집기
+디렉토리를 한 번만 순회하며 분석 대상 코드 파일을 찾습니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Pattern, Tuple
+
+
+# 확장자 → 언어 매핑
+LANGUAGE_EXTENSIONS = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.java': 'Java',
+    '.kt': 'Kotlin',
+    '.kts': 'Kotlin',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.rb': 'Ruby',
+    '.php': 'PHP'
+}
+
+# 진입하지 않는 디렉토리 (숨김 디렉토리는 별도로 제외)
+EXCLUDED_DIRS = frozenset({'node_modules', 'venv', '__pycache__'})
+
+
+def _translate_pattern(pattern: str) -> str:
+    """.gitignore 글롭 패턴을 정규식 문자열로 변환"""
+    result = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern[i:i + 3] == '**/':
+                result.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i:i + 2] == '**':
+                result.append('.*')
+                i += 2
+                continue
+            result.append('[^/]*')
+        elif c == '?':
+            result.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                result.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                result.append(f'[{body}]')
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(c))
+        i += 1
+    return ''.join(result)
+
+
+class IgnoreRules:
+    """.gitignore 문법의 제외 규칙 모음
+
+    모든 규칙은 분석 루트 기준의 상대 경로(POSIX 형식)에 대해 매칭되며,
+    git과 마찬가지로 마지막으로 일치한 규칙이 결과를 결정합니다.
+    """
+
+    def __init__(self, rules: Optional[List[Tuple[Pattern, bool, bool]]] = None):
+        # (정규식, 부정 여부, 디렉토리 전용 여부)
+        self.rules = rules or []
+
+    def extend(self, patterns: Iterable[str], base: str = '') -> 'IgnoreRules':
+        """base 디렉토리 기준 패턴을 추가한 새 규칙 모음 반환"""
+        rules = list(self.rules)
+        for raw in patterns:
+            line = raw.rstrip('\n').rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+
+            # '/'가 포함되면 base 기준으로 고정, 없으면 모든 깊이에서 이름 매칭
+            anchored = '/' in line
+            line = line.lstrip('/')
+            if not line:
+                continue
+            prefix = re.escape(base + '/') if base else ''
+            if not anchored:
+                prefix += '(?:.*/)?'
+            regex = re.compile(f'^{prefix}{_translate_pattern(line)}$')
+            rules.append((regex, negated, dir_only))
+        return IgnoreRules(rules)
+
+    def extend_from_file(self, gitignore_path: str, base: str = '') -> 'IgnoreRules':
+        """.gitignore 파일의 규칙을 추가한 새 규칙 모음 반환"""
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return self.extend(f.readlines(), base)
+        except OSError:
+            return self
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """상대 경로가 제외 대상인지 확인"""
+        ignored = False
+        for regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                ignored = not negated
+        return ignored
+
+
+def is_excluded_name(name: str) -> bool:
+    """이름만으로 제외되는 파일/디렉토리인지 확인 (숨김 파일, 의존성 디렉토리)"""
+    return name.startswith('.') or name in EXCLUDED_DIRS
+
+
+def walk_order(rel_path: str) -> List[Tuple[int, str]]:
+    """FileWalker가 파일을 돌려주는 순서의 정렬 키 (POSIX 상대 경로 기준)
+
+    디렉토리마다 파일을 먼저, 그 다음 하위 디렉토리를 이름순으로 순회합니다.
+    """
+    *directories, file_name = rel_path.split('/')
+    return [(1, directory) for directory in directories] + [(0, file_name)]
+
+
+class FileWalker:
+    """os.scandir 기반 단일 패스 디렉토리 순회기
+
+    제외 디렉토리와 숨김 디렉토리는 진입하기 전에 가지치기하고,
+    확장자는 딕셔너리 조회로 한 번에 판별합니다.
+    """
+
+    def __init__(self, root: Path, ignore_patterns: Optional[Iterable[str]] = None,
+                 use_gitignore: bool = True):
+        self.root = Path(root)
+        self.use_gitignore = use_gitignore
+        self.base_rules = IgnoreRules().extend(ignore_patterns or [])
+
+    def walk(self) -> Iterator[Tuple[Path, str]]:
+        """(파일 경로, 언어) 쌍을 경로 순서대로 생성"""
+        root_rules = self.base_rules
+        if self.use_gitignore:
+            root_rules = root_rules.extend_from_file(os.path.join(self.root, '.gitignore'))
+
+        # (디렉토리 경로, 루트 기준 상대 경로, 적용 규칙)
+        stack = [(self.root, '', root_rules)]
+        while stack:
+            dir_path, rel_dir, rules = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                if is_excluded_name(name):
+                    continue
+                rel_path = f'{rel_dir}/{name}' if rel_dir else name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not rules.is_ignored(rel_path, is_dir=True):
+                            subdirs.append((entry, rel_path))
+                        continue
+                    language = LANGUAGE_EXTENSIONS.get(os.path.splitext(name)[1])
+                    if not language or not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                if not rules.is_ignored(rel_path):
+                    yield dir_path / name, language
+
+            for entry, rel_path in reversed(subdirs):
+                sub_rules = rules
+                if self.use_gitignore:
+                    gitignore = os.path.join(entry.path, '.gitignore')
+                    if os.path.isfile(gitignore):
+                        sub_rules = rules.extend_from_file(gitignore, rel_path)
+                stack.append((dir_path / entry.name, rel_path, sub_rules))
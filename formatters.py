@@ -0,0 +1,235 @@
+"""
+기계 판독용 출력 형식
+분석 결과를 NDJSON, JSON, SARIF 형식으로 파일마다 바로 기록합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import json
+from pathlib import Path
+from typing import Dict, IO, Iterator
+
+from issues import ISSUE_MESSAGES, ISSUE_SEVERITY, IssueType
+
+
+TOOL_NAME = 'portfolio-code-analyzer'
+TOOL_URI = 'https://github.com/Gaon/portfolio-code-analyzer'
+
+# 파일별 결과의 이슈 목록 키 → 분류
+_ISSUE_CATEGORIES = (
+    ('issues', 'issues'),
+    ('readability_issues', 'readability'),
+    ('structure_issues', 'structure'),
+    ('duplicate_issues', 'duplicates')
+)
+
+# 이슈 인자 중 시작 줄 번호의 위치 (줄을 알 수 있는 이슈만)
+_ISSUE_LINE_ARGS = {
+    IssueType.LONG_FUNCTION: 2,
+    IssueType.DUPLICATE_CODE: 0
+}
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def iter_file_issues(file_result: Dict) -> Iterator[Dict]:
+    """파일별 결과의 이슈를 딕셔너리로 변환하며 생성"""
+    for key, category in _ISSUE_CATEGORIES:
+        for code, args in file_result[key]:
+            code = IssueType(code)
+            severity = ISSUE_SEVERITY[code]
+            issue = {
+                'category': category,
+                'type': code.key,
+                'severity': severity.label if severity is not None else None,
+                'message': ISSUE_MESSAGES[code].format(*args)
+            }
+            line_arg = _ISSUE_LINE_ARGS.get(code)
+            # 이전 버전 캐시의 긴 함수 이슈에는 줄 번호가 없음
+            if line_arg is not None and line_arg < len(args):
+                issue['line'] = args[line_arg]
+            yield issue
+
+
+def summarize(results: Dict) -> Dict:
+    """이슈 목록을 제외한 전체 결과 요약"""
+    summary = {
+        'files_analyzed': results['files_analyzed'],
+        'total_lines': results['total_lines'],
+        'languages': dict(results['languages']),
+        'complexity': results['complexity'],
+        'metrics': results['metrics'],
+        'hotspots': results['hotspots'],
+        'issue_counts': results['issue_counts'],
+        'duplicates': {key: value for key, value in results['duplicates'].items()
+                       if key != 'issues'},
+        'skipped_files': results['skipped_files'],
+        'identical_files': results['identical_files'],
+        'vendored': results['vendored'],
+        'overall_score': results.get('overall_score', 0),
+        'grade': results.get('grade', 'F')
+    }
+    if 'incremental' in results:
+        summary['incremental'] = results['incremental']
+    if 'memory' in results:
+        summary['memory'] = results['memory']
+    return summary
+
+
+class StreamWriter:
+    """파일별 결과를 받는 즉시 기록하는 출력기 기본 클래스"""
+
+    extension = ''
+
+    def __init__(self, stream: IO[str], version: str = ''):
+        self.stream = stream
+        self.version = version
+
+    def begin(self):
+        """출력 시작"""
+
+    def write_file(self, file_result: Dict):
+        """파일 하나의 결과 기록"""
+        raise NotImplementedError
+
+    def end(self, results: Dict):
+        """전체 결과 기록 후 출력 종료"""
+        raise NotImplementedError
+
+    def _file_record(self, file_result: Dict) -> Dict:
+        return {
+            'file': file_result['file'],
+            'language': file_result['language'],
+            'lines': file_result['lines'],
+            'complexity': file_result['complexity'],
+            'skipped': file_result.get('skipped'),
+            'issues': list(iter_file_issues(file_result))
+        }
+
+
+class NDJSONWriter(StreamWriter):
+    """한 줄에 JSON 객체 하나 (파일별 결과 후 마지막 줄에 요약)"""
+
+    extension = '.ndjson'
+
+    def write_file(self, file_result: Dict):
+        self.stream.write(_dumps({'kind': 'file', **self._file_record(file_result)}))
+        self.stream.write('\n')
+
+    def end(self, results: Dict):
+        self.stream.write(_dumps({'kind': 'summary', **summarize(results)}))
+        self.stream.write('\n')
+
+
+class JSONWriter(StreamWriter):
+    """{"files": [...], "summary": {...}} 형식의 단일 JSON 문서"""
+
+    extension = '.json'
+
+    def __init__(self, stream: IO[str], version: str = ''):
+        super().__init__(stream, version)
+        self._first = True
+
+    def begin(self):
+        self.stream.write('{"files":[')
+
+    def write_file(self, file_result: Dict):
+        if not self._first:
+            self.stream.write(',')
+        self._first = False
+        self.stream.write('\n')
+        self.stream.write(_dumps(self._file_record(file_result)))
+
+    def end(self, results: Dict):
+        self.stream.write('\n],"summary":')
+        self.stream.write(_dumps(summarize(results)))
+        self.stream.write('}\n')
+
+
+class SARIFWriter(StreamWriter):
+    """SARIF 2.1.0 (코드 스캐닝 도구 연동용)"""
+
+    extension = '.sarif'
+
+    _LEVELS = {'high': 'error', 'medium': 'warning', 'low': 'note', None: 'error'}
+
+    # 규칙 설명 (이슈 메시지는 파일마다 값이 채워지므로 따로 둠)
+    _RULE_DESCRIPTIONS = {
+        IssueType.ERROR: '파일 분석 중 오류',
+        IssueType.SYNTAX_ERROR: '구문 오류',
+        IssueType.LONG_FILE: '파일이 너무 깁니다',
+        IssueType.STRUCTURE: '클래스 정의가 없습니다',
+        IssueType.LOW_COMMENTS: '주석이 부족합니다',
+        IssueType.LONG_LINES: '긴 줄이 많습니다',
+        IssueType.DENSE_CODE: '코드가 너무 밀집되어 있습니다',
+        IssueType.LONG_FUNCTION: '함수가 너무 깁니다',
+        IssueType.TOO_MANY_GLOBALS: '전역 변수가 너무 많습니다',
+        IssueType.DUPLICATE_CODE: '중복 코드',
+    }
+
+    def __init__(self, stream: IO[str], version: str = ''):
+        super().__init__(stream, version)
+        self._first = True
+
+    def begin(self):
+        rules = []
+        for code in IssueType:
+            severity = ISSUE_SEVERITY[code]
+            rules.append({
+                'id': code.key,
+                'shortDescription': {'text': self._RULE_DESCRIPTIONS[code]},
+                'defaultConfiguration': {
+                    'level': self._LEVELS[severity.label if severity is not None else None]
+                }
+            })
+        driver = {'name': TOOL_NAME, 'informationUri': TOOL_URI, 'rules': rules}
+        if self.version:
+            driver['version'] = self.version
+        header = _dumps({
+            '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+            'version': '2.1.0'
+        })
+        # runs[0].results 배열을 열어 두고 결과를 이어서 기록
+        self.stream.write(header[:-1])
+        self.stream.write(',"runs":[{"tool":{"driver":')
+        self.stream.write(_dumps(driver))
+        self.stream.write('},"results":[')
+
+    def write_file(self, file_result: Dict):
+        path = Path(file_result['file'])
+        uri = path.as_uri() if path.is_absolute() else path.as_posix()
+        for issue in iter_file_issues(file_result):
+            if not self._first:
+                self.stream.write(',')
+            self._first = False
+            self.stream.write('\n')
+            location = {'artifactLocation': {'uri': uri}}
+            if 'line' in issue:
+                location['region'] = {'startLine': issue['line']}
+            self.stream.write(_dumps({
+                'ruleId': issue['type'],
+                'level': self._LEVELS[issue['severity']],
+                'message': {'text': issue['message']},
+                'locations': [{'physicalLocation': location}],
+                'properties': {'category': issue['category']}
+            }))
+
+    def end(self, results: Dict):
+        self.stream.write('\n],"properties":')
+        self.stream.write(_dumps(summarize(results)))
+        self.stream.write('}]}\n')
+
+
+WRITERS = {
+    'ndjson': NDJSONWriter,
+    'json': JSONWriter,
+    'sarif': SARIFWriter
+}
@@ -0,0 +1,244 @@
+"""
+Git 연동
+변경 파일 조회 등 git 명령을 감싼 유틸리티와, 체크아웃 없이 커밋의 파일을
+객체 데이터베이스에서 바로 읽는 분석 소스입니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import io
+import subprocess
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Set, Tuple
+
+from archive_source import ArchiveSource
+from file_walker import walk_order
+
+# ls-tree에서 분석하지 않는 모드 (심볼릭 링크, 하위 모듈)
+_SKIPPED_MODES = (b'120000', b'160000')
+
+_DRAIN_BYTES = 64 * 1024
+
+
+class GitError(Exception):
+    """git 명령 실행 실패"""
+
+
+class GitRepository:
+    """로컬 git 저장소"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @classmethod
+    def discover(cls, path: Path) -> Optional['GitRepository']:
+        """path를 포함하는 저장소를 찾음 (저장소가 아니면 None)"""
+        path = Path(path).resolve()
+        start = path if path.is_dir() else path.parent
+        try:
+            root = cls._run_git(start, 'rev-parse', '--show-toplevel').strip()
+        except GitError:
+            return None
+        return cls(Path(root))
+
+    def rev_parse(self, ref: str) -> str:
+        """참조를 커밋 해시로 변환"""
+        try:
+            return self._git('rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}').strip()
+        except GitError as e:
+            raise GitError(f'커밋을 찾을 수 없습니다: {ref}') from e
+
+    def changed_paths(self, since: str, include_ignored: bool = False) -> Set[str]:
+        """since 커밋 이후 바뀐 파일 (작업 트리 변경과 추적되지 않은 파일 포함, 루트 기준 상대 경로)
+
+        include_ignored가 참이면 .gitignore에 해당하는 파일도 모두 포함합니다
+        (커밋에 없으므로 바뀌었는지 알 수 없음).
+        """
+        changed = self._git('diff', '--name-only', '--no-renames', '-z', since, '--')
+        untracked = self._git('ls-files', '--others', '--exclude-standard', '-z')
+        if include_ignored:
+            untracked += self._git('ls-files', '--others', '--ignored', '--exclude-standard',
+                                   '-z')
+        return {p for p in (changed + untracked).split('\0') if p}
+
+    def is_clean(self, path: Optional[Path] = None) -> bool:
+        """path 아래에 커밋되지 않은 변경이 없는지 확인"""
+        args = ['status', '--porcelain', '-z', '--untracked-files=normal']
+        if path is not None:
+            args += ['--', str(Path(path).resolve())]
+        return not self._git(*args)
+
+    def relative_path(self, path: Path) -> str:
+        """저장소 루트 기준 상대 경로 (POSIX 형식)"""
+        rel = Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+        return '' if rel == '.' else rel
+
+    def resolve_tree(self, revision: str, prefix: str = '') -> str:
+        """revision 커밋에서 prefix 디렉토리의 트리 ID"""
+        commit = self.rev_parse(revision)
+        try:
+            tree = self._git('rev-parse', '--verify', '--quiet', f'{commit}:{prefix}').strip()
+            is_tree = self._git('cat-file', '-t', tree).strip() == 'tree'
+        except GitError:
+            is_tree = False
+        if not is_tree:
+            raise GitError(f'{revision}에 디렉토리가 없습니다: {prefix}')
+        return tree
+
+    def list_blobs(self, tree: str) -> List[Tuple[str, int, str]]:
+        """트리 아래 모든 파일의 (트리 기준 상대 경로, 크기, blob ID) - git 경로 순서"""
+        output = self._git_bytes('ls-tree', '-r', '-l', '-z', '--full-tree', tree)
+        blobs = []
+        for entry in output.split(b'\0'):
+            if not entry:
+                continue
+            meta, _, path = entry.partition(b'\t')
+            mode, kind, blob_id, size = meta.split()
+            if kind != b'blob' or mode in _SKIPPED_MODES:
+                continue
+            blobs.append((path.decode('utf-8', errors='surrogateescape'), int(size),
+                          blob_id.decode('ascii')))
+        return blobs
+
+    def commit_counts(self, revision: str = 'HEAD', prefix: str = '',
+                      max_commits: int = 1000) -> Dict[str, int]:
+        """revision까지의 최근 max_commits개 커밋(병합 제외)에서 파일별로 바뀐 횟수
+
+        prefix 아래 파일만 세며 경로는 저장소 루트 기준 상대 경로입니다.
+        """
+        output = self._git('log', '--no-merges', '--no-renames', '--format=', '--name-only', '-z',
+                           f'--max-count={max_commits}', revision, '--', prefix or '.')
+        counts = {}
+        # 커밋마다 경로 앞에 줄바꿈이 붙음 (--name-only는 커밋 안에서 경로를 한 번만 출력)
+        for path in output.split('\0'):
+            path = path.strip('\n')
+            if path:
+                counts[path] = counts.get(path, 0) + 1
+        return counts
+
+    def _git(self, *args: str) -> str:
+        return self._run_git(self.root, *args)
+
+    def _git_bytes(self, *args: str) -> bytes:
+        return self._run_git_bytes(self.root, *args)
+
+    @classmethod
+    def _run_git(cls, cwd: Path, *args: str) -> str:
+        return cls._run_git_bytes(cwd, *args).decode('utf-8', errors='surrogateescape')
+
+    @staticmethod
+    def _run_git_bytes(cwd: Path, *args: str) -> bytes:
+        try:
+            completed = subprocess.run(['git', *args], cwd=str(cwd), capture_output=True,
+                                       check=True)
+        except FileNotFoundError as e:
+            raise GitError('git 명령을 찾을 수 없습니다.') from e
+        except subprocess.CalledProcessError as e:
+            message = e.stderr.decode('utf-8', errors='replace').strip()
+            raise GitError(f"git {' '.join(args)} 실패: {message}") from e
+        return completed.stdout
+
+
+class _BlobStream(io.RawIOBase):
+    """cat-file --batch 출력에서 blob 하나만큼만 읽는 스트림
+
+    닫을 때 읽지 않은 나머지와 끝의 줄바꿈을 버려 다음 blob을 읽을 수 있게 합니다.
+    """
+
+    def __init__(self, stdout: IO[bytes], size: int):
+        self._stdout = stdout
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._remaining:
+            return 0
+        count = self._stdout.readinto(memoryview(buffer)[:min(len(buffer), self._remaining)])
+        if not count:
+            raise GitError('git cat-file 출력이 예기치 않게 끝났습니다.')
+        self._remaining -= count
+        return count
+
+    def close(self):
+        if not self.closed:
+            while self._remaining:
+                self._remaining -= len(self._stdout.read(min(self._remaining, _DRAIN_BYTES)))
+            self._stdout.read(1)
+        super().close()
+
+
+class GitTreeSource(ArchiveSource):
+    """git 커밋의 파일을 체크아웃 없이 읽는 분석 소스
+
+    파일 목록은 ls-tree로 한 번에 가져오고, 내용은 하나의 `git cat-file --batch`
+    프로세스에 blob ID를 차례로 보내 스트림으로 읽습니다. 압축 파일과 같은
+    기준(확장자, 제외 디렉토리, --ignore, 트리에 있는 .gitignore)으로 파일을
+    고르며, 멤버의 content_id는 blob ID입니다.
+    """
+
+    def __init__(self, repo: GitRepository, revision: str, prefix: str = ''):
+        self.repo = repo
+        self.revision = revision
+        self.path = repo.root / prefix
+        self._tree = repo.resolve_tree(revision, prefix)
+        self._process = None
+        self._stream = None
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.stdout.close()
+            self._process.wait()
+            self._process = None
+
+    def _cat_file(self) -> subprocess.Popen:
+        if self._process is None:
+            try:
+                self._process = subprocess.Popen(['git', 'cat-file', '--batch'],
+                                                 cwd=str(self.repo.root),
+                                                 stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            except FileNotFoundError as e:
+                raise GitError('git 명령을 찾을 수 없습니다.') from e
+        return self._process
+
+    def _open_member(self, blob_id: str) -> IO[bytes]:
+        """blob 내용 스트림 (cat-file 출력을 공유하므로 한 번에 하나만 열 수 있음)"""
+        if self._stream is not None:
+            self._stream.close()
+        process = self._cat_file()
+        process.stdin.write(f'{blob_id}\n'.encode('ascii'))
+        process.stdin.flush()
+        header = process.stdout.readline().split()
+        if len(header) != 3 or header[1] != b'blob':
+            raise GitError(f'blob을 읽을 수 없습니다: {blob_id}')
+        self._stream = io.BufferedReader(_BlobStream(process.stdout, int(header[2])))
+        return self._stream
+
+    def _content_id(self, blob_id: str) -> Optional[str]:
+        return blob_id
+
+    def _scan(self) -> Tuple[List[Tuple[str, int, str]], Dict[str, List[str]]]:
+        """(이름, 크기, blob ID) 목록과 디렉토리별 .gitignore 내용 수집"""
+        files = []
+        gitignores = {}
+        for name, size, blob_id in self.repo.list_blobs(self._tree):
+            if name.rsplit('/', 1)[-1] == '.gitignore':
+                with self._open_member(blob_id) as f:
+                    content = f.read().decode('utf-8', errors='ignore')
+                gitignores[name.rpartition('/')[0]] = content.splitlines()
+            else:
+                files.append((name, size, blob_id))
+        # 작업 트리를 분석한 결과와 파일 순서(중복 코드의 원본 위치 등)가 같도록 정렬
+        files.sort(key=lambda item: walk_order(item[0]))
+        return files, gitignores
@@ -0,0 +1,126 @@
+"""
+핫스팟 색인
+파일과 함수를 복잡도, 길이, 이슈 밀도, 변경 빈도 가중 점수별로 상위 K개만
+크기가 제한된 힙에 보관합니다. 전체를 모으거나 정렬하지 않으므로 저장소
+크기와 관계없이 메모리는 K에 비례합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+# 순위별로 보관할 기본 항목 수
+DEFAULT_TOP_K = 10
+
+# 이슈 밀도(100줄당 이슈 수)를 계산할 때 이보다 짧은 파일은 이 줄 수로 봄
+# (몇 줄짜리 파일이 이슈 하나로 상위를 차지하지 않도록)
+DENSITY_MIN_LINES = 20
+
+# 파일 순위: complexity, lines, issue_density, churn (복잡도 × 최근 커밋 수)
+FILE_RANKINGS = ('complexity', 'lines', 'issue_density', 'churn')
+
+# 함수 순위: complexity, length
+FUNCTION_RANKINGS = ('complexity', 'length')
+
+# 파일 항목 (파일, 줄 수, 복잡도, 이슈 수, 커밋 수)
+_FILE_FIELDS = ('file', 'lines', 'complexity', 'issues', 'commits')
+
+# 함수 항목 (파일, 이름, 시작 줄, 길이, 복잡도)
+_FUNCTION_FIELDS = ('file', 'name', 'line', 'length', 'complexity')
+
+
+class TopK:
+    """점수가 가장 큰 항목 k개를 보관하는 최소 힙
+
+    점수가 같으면 먼저 들어온 항목이 남으므로 파일 순서대로 넣으면 결과가
+    항상 같습니다. 힙이 찬 뒤에는 가장 작은 점수보다 큰 항목만 힙에 넣습니다.
+    """
+
+    __slots__ = ('k', '_heap', '_order')
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, tuple]] = []
+        self._order = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def accepts(self, score: float) -> bool:
+        """score인 항목이 힙에 들어가는지 (들어갈 때만 항목을 만들도록)"""
+        heap = self._heap
+        return len(heap) < self.k or (bool(heap) and score > heap[0][0])
+
+    def push(self, score: float, item: tuple):
+        if not self.accepts(score):
+            return
+        heap = self._heap
+        self._order -= 1
+        entry = (score, self._order, item)
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heapreplace(heap, entry)
+
+    def items(self) -> List[Tuple[float, tuple]]:
+        """점수가 큰 순서의 (점수, 항목)"""
+        return [(score, item) for score, _, item in sorted(self._heap, reverse=True)]
+
+
+class HotspotIndex:
+    """파일별 결과를 병합할 때 함께 채우는 상위 K개 색인"""
+
+    def __init__(self, k: int = DEFAULT_TOP_K):
+        self.k = k
+        self._files = {name: TopK(k) for name in FILE_RANKINGS}
+        self._functions = {name: TopK(k) for name in FUNCTION_RANKINGS}
+
+    def add_file(self, file_name: str, lines: int, complexity: Optional[int], issues: int,
+                 commits: int, functions: List[Dict]):
+        """분석한 파일 하나 추가 (commits는 최근 커밋 중 이 파일을 바꾼 커밋 수)"""
+        if not self.k:
+            return
+        files = self._files
+        item = (file_name, lines, complexity, issues, commits)
+        files['lines'].push(lines, item)
+        if complexity is not None:
+            files['complexity'].push(complexity, item)
+            if commits:
+                files['churn'].push(complexity * commits, item)
+        if issues:
+            files['issue_density'].push(
+                round(issues * 100 / max(lines, DENSITY_MIN_LINES), 2), item)
+
+        by_complexity = self._functions['complexity']
+        by_length = self._functions['length']
+        for function in functions:
+            complexity, length = function['complexity'], function['length']
+            if by_complexity.accepts(complexity) or by_length.accepts(length):
+                item = (file_name, function['name'], function['line'], length, complexity)
+                by_complexity.push(complexity, item)
+                by_length.push(length, item)
+
+    def top_files(self, ranking: str) -> List[Dict]:
+        """ranking 순위의 파일 (점수가 큰 순서)"""
+        return [{**dict(zip(_FILE_FIELDS, item)), 'score': score}
+                for score, item in self._files[ranking].items()]
+
+    def top_functions(self, ranking: str) -> List[Dict]:
+        """ranking 순위의 함수 (점수가 큰 순서)"""
+        return [{**dict(zip(_FUNCTION_FIELDS, item)), 'score': score}
+                for score, item in self._functions[ranking].items()]
+
+    def summary(self) -> Dict:
+        """{'top': K, 'files': {순위: [...]}, 'functions': {순위: [...]}}"""
+        return {
+            'top': self.k,
+            'files': {name: self.top_files(name) for name in FILE_RANKINGS},
+            'functions': {name: self.top_functions(name) for name in FUNCTION_RANKINGS}
+        }
@@ -0,0 +1,143 @@
+"""
+이슈 레코드
+분석 중 발견된 이슈를 적은 메모리로 보관합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import sys
+from enum import IntEnum
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+
+class Severity(IntEnum):
+    """이슈 심각도 (값이 작을수록 심각)"""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class IssueType(IntEnum):
+    """이슈 종류 (캐시에 숫자로 저장되므로 값을 바꾸지 말 것)"""
+    ERROR = 0
+    SYNTAX_ERROR = 1
+    LONG_FILE = 2
+    STRUCTURE = 3
+    LOW_COMMENTS = 4
+    LONG_LINES = 5
+    DENSE_CODE = 6
+    LONG_FUNCTION = 7
+    TOO_MANY_GLOBALS = 8
+    DUPLICATE_CODE = 9
+
+    @property
+    def key(self) -> str:
+        return self.name.lower()
+
+
+# 종류별 심각도 (None은 심각도 없음)
+ISSUE_SEVERITY = {
+    IssueType.ERROR: None,
+    IssueType.SYNTAX_ERROR: Severity.HIGH,
+    IssueType.LONG_FILE: Severity.MEDIUM,
+    IssueType.STRUCTURE: Severity.LOW,
+    IssueType.LOW_COMMENTS: Severity.MEDIUM,
+    IssueType.LONG_LINES: Severity.LOW,
+    IssueType.DENSE_CODE: Severity.LOW,
+    IssueType.LONG_FUNCTION: Severity.MEDIUM,
+    IssueType.TOO_MANY_GLOBALS: Severity.MEDIUM,
+    IssueType.DUPLICATE_CODE: Severity.MEDIUM,
+}
+
+# 종류별 메시지 템플릿 (리포트를 만들 때 인자로 채움)
+ISSUE_MESSAGES = {
+    IssueType.ERROR: '파일 분석 중 오류: {0}',
+    IssueType.SYNTAX_ERROR: '구문 오류: {0}',
+    IssueType.LONG_FILE: '파일이 너무 깁니다 ({0}줄). 모듈화를 고려하세요.',
+    IssueType.STRUCTURE: '클래스 정의가 없습니다.',
+    IssueType.LOW_COMMENTS: '주석이 부족합니다. 코드 이해를 위해 주석을 추가하세요.',
+    IssueType.LONG_LINES: '{0}자를 초과하는 긴 줄이 {1}개 있습니다.',
+    IssueType.DENSE_CODE: '코드가 너무 밀집되어 있습니다. 가독성을 위해 빈 줄을 추가하세요.',
+    IssueType.LONG_FUNCTION: '함수 "{0}"이 너무 깁니다 ({1}줄). 분리하는 것을 고려하세요.',
+    IssueType.TOO_MANY_GLOBALS: '전역 변수가 너무 많습니다. 구조를 개선하세요.',
+    IssueType.DUPLICATE_CODE: '{0}번째 줄부터 {1}줄이 {2}의 {3}번째 줄부터와 중복됩니다. 공통 코드로 추출하세요.',
+}
+
+
+class Issue:
+    """이슈 한 건
+
+    파일 경로는 intern된 문자열을 공유하고, 종류는 열거형 코드로, 메시지는
+    인자만 보관했다가 읽을 때 만듭니다. 기존 딕셔너리 형식과 호환되도록
+    issue['message'], issue.get('severity') 같은 조회와 to_dict()를 지원합니다.
+    """
+
+    __slots__ = ('file', 'code', 'args')
+
+    _FIELDS = ('file', 'type', 'message', 'severity')
+
+    def __init__(self, file: str, code: IssueType, args: Sequence[Any] = ()):
+        self.file = sys.intern(file)
+        self.code = IssueType(code)
+        self.args = args
+
+    @property
+    def type(self) -> str:
+        return self.code.key
+
+    @property
+    def severity_level(self) -> Optional[Severity]:
+        return ISSUE_SEVERITY[self.code]
+
+    @property
+    def severity(self) -> Optional[str]:
+        level = ISSUE_SEVERITY[self.code]
+        return level.label if level is not None else None
+
+    @property
+    def message(self) -> str:
+        return ISSUE_MESSAGES[self.code].format(*self.args)
+
+    def keys(self) -> Iterator[str]:
+        """딕셔너리 형식의 키 (심각도가 없으면 'severity' 제외)"""
+        for field in self._FIELDS:
+            if field != 'severity' or ISSUE_SEVERITY[self.code] is not None:
+                yield field
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 형식의 딕셔너리로 변환"""
+        return {key: self[key] for key in self.keys()}
+
+    def __reduce__(self):
+        # 임시 파일로 내보낼 때 열거형 대신 숫자 코드만 저장 (불러올 때 경로를 다시 intern)
+        return Issue, (self.file, int(self.code), self.args)
+
+    def __repr__(self) -> str:
+        return f'Issue({self.file!r}, {self.code.name}, {tuple(self.args)!r})'
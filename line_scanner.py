@@ -0,0 +1,88 @@
+"""
+줄 단위 지표 스캐너
+파일을 한 번만 훑어 줄 수, 주석 줄, 긴 줄, 빈 줄을 계산합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import io
+from typing import IO, Iterable
+
+
+# 이 길이를 넘는 줄은 긴 줄로 판단
+LONG_LINE_LENGTH = 120
+
+
+class LineStats:
+    """줄 단위 지표 (모든 분석기가 공유)"""
+
+    __slots__ = ('line_count', 'comment_lines', 'long_lines', 'empty_lines')
+
+    def __init__(self):
+        self.line_count = 0
+        self.comment_lines = 0
+        self.long_lines = 0
+        self.empty_lines = 0
+
+    @property
+    def comment_ratio(self) -> float:
+        return self.comment_lines / self.line_count if self.line_count else 0
+
+    @property
+    def empty_ratio(self) -> float:
+        return self.empty_lines / self.line_count if self.line_count else 0
+
+
+def scan_lines(lines: Iterable[str]) -> LineStats:
+    """줄 반복자를 한 번 순회하며 지표 계산
+
+    줄바꿈으로 끝나는 내용은 마지막에 빈 줄이 하나 더 있는 것으로 셉니다
+    (content.split('\\n')과 같은 기준).
+    """
+    stats = LineStats()
+    line_count = comment_lines = long_lines = empty_lines = 0
+    ends_with_newline = True
+    for line in lines:
+        ends_with_newline = line.endswith('\n')
+        if ends_with_newline:
+            line = line[:-1]
+        line_count += 1
+
+        stripped = line.strip()
+        if not stripped:
+            empty_lines += 1
+        elif stripped.startswith('#') or '//' in line or '/*' in line or '*/' in line:
+            comment_lines += 1
+        if len(line) > LONG_LINE_LENGTH:
+            long_lines += 1
+
+    if ends_with_newline:
+        line_count += 1
+        empty_lines += 1
+
+    stats.line_count = line_count
+    stats.comment_lines = comment_lines
+    stats.long_lines = long_lines
+    stats.empty_lines = empty_lines
+    return stats
+
+
+def scan_text(content: str) -> LineStats:
+    """문자열 내용 스캔 (줄 목록을 만들지 않음)"""
+    return scan_lines(io.StringIO(content))
+
+
+def count_lines(stream: IO[bytes], chunk_size: int = 1024 * 1024) -> int:
+    """내용을 해석하지 않고 줄 수만 계산 (분석을 건너뛰는 파일용)"""
+    newlines = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return newlines + 1
+        newlines += chunk.count(b'\n')
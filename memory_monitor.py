@@ -0,0 +1,179 @@
+"""
+메모리 사용량 감시
+분석 중 프로세스 메모리(RSS)를 확인해 상한을 넘었는지 알려주고, 실행이
+끝나면 최대 메모리와 (요청하면) tracemalloc 기준 할당 위치 상위 목록을
+요약합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# RSS를 확인하는 주기 (병합한 파일 수)
+CHECK_INTERVAL = 64
+
+# 저메모리 모드에서 이슈를 이만큼 모을 때마다 임시 파일로 내보냄
+SPILL_THRESHOLD = 10_000
+
+# 한도를 넘어 메모리를 줄인 뒤 다시 줄이기까지 더 늘어날 수 있는 양 (한도 대비 비율)
+_RELIEF_MARGIN = 0.1
+
+
+def current_rss() -> Optional[int]:
+    """현재 프로세스의 RSS (바이트, 알 수 없으면 None)"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        # /proc이 없는 환경은 최대 RSS로 대신함
+        return peak_rss()
+
+
+def _rusage_peak(who: int) -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # macOS는 바이트, 그 외는 KB 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def peak_rss() -> Optional[int]:
+    """현재 프로세스의 최대 RSS (바이트, 알 수 없으면 None)"""
+    return _rusage_peak(resource.RUSAGE_SELF) if resource else None
+
+
+def children_peak_rss() -> Optional[int]:
+    """종료된 자식 프로세스(작업자, git 등) 중 가장 큰 최대 RSS"""
+    peak = _rusage_peak(resource.RUSAGE_CHILDREN) if resource else None
+    return peak or None
+
+
+class MemoryMonitor:
+    """RSS 상한 감시와 최대 메모리 요약
+
+    상한은 메인 프로세스에만 적용됩니다 (작업자는 한 번에 파일 하나만 다룸).
+    Python은 해제한 메모리를 운영체제에 바로 돌려주지 않으므로 한도를 넘어
+    메모리를 줄인 뒤에는 그때의 RSS에서 한도의 10%만큼 더 늘어날 때까지
+    다시 알리지 않습니다.
+    """
+
+    def __init__(self, limit: Optional[int] = None, trace_top: int = 0):
+        self.limit = limit
+        self.trace_top = trace_top
+        self._threshold = limit
+        self._counter = 0
+
+    def start(self):
+        if self.trace_top:
+            import tracemalloc
+            tracemalloc.start()
+
+    def over_limit(self) -> bool:
+        """CHECK_INTERVAL번에 한 번 RSS를 확인해 상한을 넘었으면 참"""
+        if not self.limit:
+            return False
+        self._counter += 1
+        if self._counter < CHECK_INTERVAL:
+            return False
+        self._counter = 0
+        rss = current_rss()
+        return rss is not None and rss > self._threshold
+
+    def relieved(self):
+        """메모리를 줄인 뒤 호출 (다음 알림 기준을 현재 RSS 위로 올림)"""
+        rss = current_rss() or 0
+        self._threshold = max(self.limit, rss + int(self.limit * _RELIEF_MARGIN))
+
+    def summary(self) -> Dict:
+        """최대 메모리와 할당 위치 상위 목록 (tracemalloc은 여기서 종료)"""
+        summary = {
+            'peak_rss': peak_rss(),
+            'children_peak_rss': children_peak_rss(),
+            'limit': self.limit
+        }
+        if self.trace_top:
+            summary['top_allocations'] = self._top_allocations()
+        return summary
+
+    def _top_allocations(self) -> List[Dict]:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        tracemalloc.stop()
+        top = []
+        for stat in snapshot.statistics('lineno')[:self.trace_top]:
+            frame = stat.traceback[0]
+            top.append({'location': f'{frame.filename}:{frame.lineno}',
+                        'size': stat.size, 'count': stat.count})
+        return top
+
+
+class SpillingList:
+    """항목이 threshold개 쌓이면 임시 파일로 내보내는 추가 전용 목록
+
+    내보낸 항목은 덩어리 단위로 pickle해 두고 순회할 때 덩어리마다 다시 읽으므로
+    메모리에는 덩어리 하나와 아직 내보내지 않은 항목만 남습니다. 순회마다 읽을
+    위치를 따로 찾으므로 여러 번, 또는 동시에 순회해도 됩니다.
+    """
+
+    def __init__(self, threshold: int = SPILL_THRESHOLD):
+        self.threshold = threshold
+        self.spilled = 0
+        self._buffer = []
+        self._file = None
+        self._offsets = []
+
+    def append(self, item: Any):
+        self._buffer.append(item)
+        if len(self._buffer) >= self.threshold:
+            self.spill()
+
+    def spill(self):
+        """메모리에 남은 항목을 모두 임시 파일로 내보냄"""
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix='code-analyzer-')
+        self._file.seek(0, os.SEEK_END)
+        self._offsets.append(self._file.tell())
+        pickle.dump(self._buffer, self._file, pickle.HIGHEST_PROTOCOL)
+        self.spilled += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._offsets = []
+        self._buffer = []
+        self.spilled = 0
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._buffer)
+
+    def __iter__(self) -> Iterator[Any]:
+        for offset in list(self._offsets):
+            self._file.seek(offset)
+            yield from pickle.load(self._file)
+        yield from self._buffer
@@ -0,0 +1,240 @@
+"""
+지표 분포
+파일별/함수별 지표(줄 수, 복잡도, 주석 비율, 함수 길이)를 열 단위 배열에
+모아 평균, 백분위수, 히스토그램과 언어별 요약을 계산합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import math
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence
+
+# 계산할 백분위수
+PERCENTILES = (50, 90, 99)
+
+# 지표별 히스토그램 구간의 하한 (마지막 구간은 상한 없음)
+HISTOGRAM_BINS = {
+    'lines': (0, 50, 100, 200, 500, 1000),
+    'complexity': (1, 2, 5, 10, 20, 50),
+    'comment_ratio': (0, 0.05, 0.1, 0.2, 0.4),
+    'function_length': (0, 10, 25, 50, 100),
+    'function_complexity': (1, 2, 5, 10, 20),
+}
+
+# 이보다 행이 많을 때만 NumPy를 불러옴 (불러오는 데만 0.1초 정도 걸림)
+NUMPY_MIN_ROWS = 50_000
+
+# 복잡도가 없는 파일 (분석하지 않는 언어, 건너뛴 파일)
+_NO_COMPLEXITY = -1
+
+
+def _load_numpy():
+    """설치되어 있으면 numpy 모듈 (없으면 None)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _distribution(counts: Dict[float, int], bins: Sequence[float]) -> Dict:
+    """값별 개수로 계산한 평균, 백분위수, 최댓값, 히스토그램 (순수 Python)
+
+    정렬된 전체 값 대신 서로 다른 값과 누적 개수만 쓰므로 값의 종류가 적은
+    정수 지표는 행 수와 관계없이 빠릅니다. 백분위수는 NumPy 기본값과 같은
+    선형 보간입니다.
+    """
+    total = sum(counts.values())
+    if not total:
+        return {'count': 0}
+    values = sorted(counts)
+    cumulative = list(accumulate(counts[value] for value in values))
+
+    def nth(index: int) -> float:
+        return values[bisect_right(cumulative, index)]
+
+    summary = {
+        'count': total,
+        'mean': round(math.fsum(value * count for value, count in counts.items()) / total, 2)
+    }
+    for q in PERCENTILES:
+        position = (total - 1) * q / 100
+        lower = math.floor(position)
+        low, high = nth(lower), nth(min(lower + 1, total - 1))
+        summary[f'p{q}'] = round(low + (high - low) * (position - lower), 2)
+    summary['max'] = round(float(values[-1]), 2)
+
+    # 첫 구간은 하한보다 작은 값도 포함
+    histogram = [0] * len(bins)
+    for value, count in counts.items():
+        histogram[max(0, bisect_right(bins, value) - 1)] += count
+    summary['histogram'] = {'bins': list(bins), 'counts': histogram}
+    return summary
+
+
+def _distribution_numpy(np, values, bins: Sequence[float]) -> Dict:
+    """_distribution과 같은 결과를 벡터 연산으로 계산"""
+    if not len(values):
+        return {'count': 0}
+    values = values.astype(np.float64)
+    summary = {'count': int(values.size), 'mean': round(float(values.mean()), 2)}
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f'p{q}'] = round(float(value), 2)
+    summary['max'] = round(float(values.max()), 2)
+    # 첫 구간은 하한보다 작은 값도 포함
+    indexes = np.searchsorted(np.asarray(bins, dtype=np.float64), values, side='right') - 1
+    counts = np.bincount(np.clip(indexes, 0, None), minlength=len(bins))
+    summary['histogram'] = {'bins': list(bins), 'counts': [int(c) for c in counts]}
+    return summary
+
+
+def _merge(counts: List[Counter], ids: Sequence[int]) -> Counter:
+    if len(ids) == 1:
+        return counts[ids[0]]
+    merged = Counter()
+    for i in ids:
+        merged.update(counts[i])
+    return merged
+
+
+class MetricTable:
+    """파일별/함수별 지표를 열마다 하나의 배열로 보관
+
+    행마다 딕셔너리를 만들지 않으므로 파일 100만 개도 수십 MB로 충분하고,
+    NumPy가 있으면 배열을 복사 없이 넘겨 분포를 벡터 연산으로 계산합니다.
+    """
+
+    def __init__(self):
+        self._languages: List[str] = []
+        self._language_ids: Dict[str, int] = {}
+        # 파일별 열 (언어, 줄 수, 복잡도, 주석 줄 수)
+        self.file_language = array('H')
+        self.file_lines = array('q')
+        self.file_complexity = array('q')
+        self.file_comments = array('q')
+        # 함수별 열 (언어, 길이, 복잡도)
+        self.function_language = array('H')
+        self.function_length = array('q')
+        self.function_complexity = array('q')
+
+    def __len__(self) -> int:
+        return len(self.file_lines)
+
+    def add_file(self, language: str, lines: int, complexity: Optional[int],
+                 comment_lines: int, functions: List[Dict]):
+        """분석한 파일 하나의 지표 추가 (건너뛴 파일은 추가하지 않음)"""
+        language_id = self._language_ids.get(language)
+        if language_id is None:
+            language_id = self._language_ids[language] = len(self._languages)
+            self._languages.append(language)
+        self.file_language.append(language_id)
+        self.file_lines.append(lines)
+        self.file_complexity.append(_NO_COMPLEXITY if complexity is None else complexity)
+        self.file_comments.append(comment_lines)
+        for function in functions:
+            self.function_language.append(language_id)
+            self.function_length.append(function['length'])
+            self.function_complexity.append(function['complexity'])
+
+    def summary(self) -> Dict:
+        """전체와 언어별 분포
+
+        {'files': 파일 수, 'functions': 함수 수, 'lines': {...}, 'complexity': {...},
+         'comment_ratio': {...}, 'function_length': {...}, 'function_complexity': {...},
+         'by_language': {언어: {...}}}
+        """
+        rows = len(self.file_lines) + len(self.function_length)
+        np = _load_numpy() if rows >= NUMPY_MIN_ROWS else None
+        if np is not None:
+            return self._summary_numpy(np)
+
+        # 언어별 값 개수 (Counter는 C로 구현되어 행마다 Python 코드를 실행하지 않음)
+        languages = range(len(self._languages))
+        lines = self._counts_by_language(self.file_language, self.file_lines)
+        complexity = self._counts_by_language(self.file_language, self.file_complexity)
+        for counts in complexity:
+            counts.pop(_NO_COMPLEXITY, None)
+        comment_ratio = [Counter() for _ in languages]
+        for (language_id, comments, total), count in Counter(
+                zip(self.file_language, self.file_comments, self.file_lines)).items():
+            if total:
+                comment_ratio[language_id][comments / total] += count
+        function_length = self._counts_by_language(self.function_language, self.function_length)
+        function_complexity = self._counts_by_language(self.function_language,
+                                                       self.function_complexity)
+
+        def columns_summary(ids) -> Dict:
+            return {
+                'files': sum(sum(lines[i].values()) for i in ids),
+                'functions': sum(sum(function_length[i].values()) for i in ids),
+                'lines': _distribution(_merge(lines, ids), HISTOGRAM_BINS['lines']),
+                'complexity': _distribution(_merge(complexity, ids),
+                                            HISTOGRAM_BINS['complexity']),
+                'comment_ratio': _distribution(_merge(comment_ratio, ids),
+                                               HISTOGRAM_BINS['comment_ratio']),
+                'function_length': _distribution(_merge(function_length, ids),
+                                                 HISTOGRAM_BINS['function_length']),
+                'function_complexity': _distribution(_merge(function_complexity, ids),
+                                                     HISTOGRAM_BINS['function_complexity']),
+            }
+
+        summary = columns_summary(languages)
+        summary['by_language'] = {language: columns_summary((language_id,))
+                                  for language_id, language in enumerate(self._languages)}
+        return summary
+
+    def _counts_by_language(self, languages: array, values: array) -> List[Counter]:
+        """언어별 {값: 개수}"""
+        if len(self._languages) == 1:
+            # 언어가 하나면 (언어, 값) 튜플을 만들지 않고 값만 셈
+            return [Counter(values)]
+        counts = [Counter() for _ in self._languages]
+        for (language_id, value), count in Counter(zip(languages, values)).items():
+            counts[language_id][value] = count
+        return counts
+
+    def _summary_numpy(self, np) -> Dict:
+        columns = {name: np.frombuffer(getattr(self, name), dtype=np.int64)
+                   for name in ('file_lines', 'file_complexity', 'file_comments',
+                                'function_length', 'function_complexity')}
+        file_language = np.frombuffer(self.file_language, dtype=np.uint16)
+        function_language = np.frombuffer(self.function_language, dtype=np.uint16)
+
+        def columns_summary(file_mask, function_mask) -> Dict:
+            lines = columns['file_lines'][file_mask]
+            complexity = columns['file_complexity'][file_mask]
+            comments = columns['file_comments'][file_mask]
+            nonempty = lines > 0
+            return {
+                'files': int(lines.size),
+                'functions': int(np.count_nonzero(function_mask)),
+                'lines': _distribution_numpy(np, lines, HISTOGRAM_BINS['lines']),
+                'complexity': _distribution_numpy(np, complexity[complexity != _NO_COMPLEXITY],
+                                                  HISTOGRAM_BINS['complexity']),
+                'comment_ratio': _distribution_numpy(np, comments[nonempty] / lines[nonempty],
+                                                     HISTOGRAM_BINS['comment_ratio']),
+                'function_length': _distribution_numpy(
+                    np, columns['function_length'][function_mask],
+                    HISTOGRAM_BINS['function_length']),
+                'function_complexity': _distribution_numpy(
+                    np, columns['function_complexity'][function_mask],
+                    HISTOGRAM_BINS['function_complexity']),
+            }
+
+        summary = columns_summary(slice(None), np.ones(function_language.size, dtype=bool))
+        summary['by_language'] = {
+            language: columns_summary(file_language == language_id,
+                                      function_language == language_id)
+            for language_id, language in enumerate(self._languages)
+        }
+        return summary
@@ -0,0 +1,164 @@
+"""
+분석 프로파일러
+분석 단계별 시간과 파일별 처리 시간을 측정합니다 (--profile).
+프로파일링을 끄면 아무것도 하지 않는 NULL_PROFILER를 사용하므로
+측정 비용이 거의 없습니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import heapq
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+
+class _NullFileTimer:
+    """프로파일링을 끈 상태의 파일 타이머"""
+
+    __slots__ = ()
+
+    def lap(self, stage: str):
+        pass
+
+
+class FileTimer:
+    """파일 하나의 처리 단계별 시간을 file_result['timings']에 기록"""
+
+    __slots__ = ('timings', '_last')
+
+    def __init__(self, file_result: Dict):
+        self.timings = file_result['timings'] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str):
+        """직전 lap 이후 걸린 시간을 stage에 더함"""
+        now = time.perf_counter()
+        self.timings[stage] = self.timings.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+
+NULL_FILE_TIMER = _NullFileTimer()
+_NULL_CONTEXT = nullcontext()
+
+
+class NullProfiler:
+    """아무것도 측정하지 않는 프로파일러 (기본값)"""
+
+    enabled = False
+
+    def phase(self, name: str):
+        return _NULL_CONTEXT
+
+    def file_timer(self, file_result: Dict):
+        return NULL_FILE_TIMER
+
+    def record_file(self, file_result: Dict):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler(NullProfiler):
+    """단계별, 파일별 시간 측정 (선택적으로 cProfile 덤프 저장)
+
+    파일별 시간은 분석한 프로세스에서 측정해 결과에 담겨 오므로 병렬 분석
+    (--jobs)에서도 집계됩니다. cProfile은 메인 프로세스만 측정합니다.
+    """
+
+    enabled = True
+
+    def __init__(self, top_files: int = 10, cprofile_path: Optional[str] = None):
+        self.top_files = top_files
+        self.cprofile_path = cprofile_path
+        self.phases = defaultdict(float)
+        self.file_stages = defaultdict(float)
+        self.files_timed = 0
+        # (총 시간, 순번, 파일, 단계별 시간)의 최소 힙 - 가장 느린 top_files개만 유지
+        self._slowest = []
+        self._cprofile = None
+
+    def __getstate__(self):
+        # 작업자 프로세스에는 설정만 전달
+        return {'top_files': self.top_files}
+
+    def __setstate__(self, state):
+        self.__init__(state['top_files'])
+
+    @contextmanager
+    def phase(self, name: str):
+        """with 블록의 실행 시간을 name 단계에 더함"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def file_timer(self, file_result: Dict) -> FileTimer:
+        return FileTimer(file_result)
+
+    def record_file(self, file_result: Dict):
+        """파일별 결과의 측정값을 꺼내 집계 (결과에는 남기지 않음)"""
+        timings = file_result.pop('timings', None)
+        if not timings:
+            return
+        total = 0.0
+        for stage, seconds in timings.items():
+            self.file_stages[stage] += seconds
+            total += seconds
+        self.files_timed += 1
+
+        entry = (total, self.files_timed, file_result['file'], timings)
+        if len(self._slowest) < self.top_files:
+            heapq.heappush(self._slowest, entry)
+        elif total > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def start(self):
+        if self.cprofile_path and self._cprofile is None:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+            self._cprofile = None
+
+    def slowest_files(self) -> List[Dict]:
+        """처리 시간이 긴 순서의 파일 목록"""
+        return [{'file': file, 'seconds': total, 'stages': timings}
+                for total, _, file, timings in sorted(self._slowest, reverse=True)]
+
+    def report_lines(self) -> List[str]:
+        """터미널 출력용 요약"""
+        lines = ['단계별 시간 (벽시계):']
+        for name, seconds in self.phases.items():
+            lines.append(f'  {name:<14}{seconds * 1000:>10.1f}ms')
+
+        if self.files_timed:
+            lines.append(f'파일 처리 단계 합계 ({self.files_timed}개 파일, 작업자 시간 합산):')
+            for stage, seconds in sorted(self.file_stages.items(), key=lambda item: -item[1]):
+                lines.append(f'  {stage:<14}{seconds * 1000:>10.1f}ms')
+
+            lines.append(f'가장 느린 파일 {len(self._slowest)}개:')
+            for entry in self.slowest_files():
+                stages = ', '.join(f'{stage} {seconds * 1000:.1f}'
+                                   for stage, seconds in entry['stages'].items())
+                lines.append(f"  {entry['seconds'] * 1000:>8.1f}ms  {entry['file']}  ({stages})")
+        return lines
@@ -11,22 +11,38 @@ All rights reserved.
 
 원본 출처: https://github.com/Gaon/portfolio-code-analyzer
 """
-from typing import Dict
+from typing import Dict, Iterator, List
 from pathlib import Path
-from jinja2 import Template
+from collections import defaultdict
 from datetime import datetime
 
 
+# 이슈 정렬 순서
+_SEVERITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+
+def _file_detail(item: Dict) -> Dict:
+    """핫스팟 파일 표의 위치와 세부 내용"""
+    detail = [f"{item['lines']:,}줄"]
+    if item['complexity'] is not None:
+        detail.append(f"복잡도 {item['complexity']}")
+    if item['issues']:
+        detail.append(f"이슈 {item['issues']}개")
+    if item['commits']:
+        detail.append(f"커밋 {item['commits']}회")
+    return {'location': item['file'], 'detail': ', '.join(detail)}
+
+
+def _function_detail(item: Dict) -> Dict:
+    """핫스팟 함수 표의 위치와 세부 내용"""
+    return {'location': f"{item['name']} ({item['file']}:{item['line']})",
+            'detail': f"{item['length']}줄, 복잡도 {item['complexity']}"}
+
+
 class ReportGenerator:
     """HTML 리포트 생성 클래스"""
     
-    HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>코드 품질 분석 리포트</title>
+    STYLE_TEMPLATE = """
     <style>
         * {
             margin: 0;
@@ -153,6 +169,25 @@ class ReportGenerator:
             border-radius: 20px;
             font-size: 14px;
         }
+        .hotspot-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 10px 0 25px;
+            font-size: 14px;
+        }
+        .hotspot-table th, .hotspot-table td {
+            padding: 8px 12px;
+            border-bottom: 1px solid #eee;
+            text-align: left;
+        }
+        .hotspot-table th {
+            background: #f8f9fa;
+            color: #2c3e50;
+        }
+        .hotspot-table td.score {
+            font-weight: bold;
+            text-align: right;
+        }
         .recommendations {
             background: #e8f5e9;
             padding: 20px;
@@ -170,6 +205,15 @@ class ReportGenerator:
             margin: 8px 0;
             color: #1b5e20;
         }
+        .page-list {
+            list-style: none;
+        }
+        .page-list li {
+            margin: 8px 0;
+        }
+        .page-list a, .back-link {
+            color: #3498db;
+        }
         .footer {
             text-align: center;
             margin-top: 40px;
@@ -179,6 +223,16 @@ class ReportGenerator:
             font-size: 14px;
         }
     </style>
+"""
+    
+    HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>코드 품질 분석 리포트</title>
+    {% include 'style.html' %}
 </head>
 <body>
     <div class="container">
@@ -217,18 +271,67 @@ class ReportGenerator:
             </div>
         </div>
         
+        {% if hotspot_tables %}
         <div class="section">
-            <h2>⚠️ 발견된 이슈</h2>
+            <h2>🔥 핫스팟</h2>
+            {% for table in hotspot_tables %}
+            <h3>{{ table.title }}</h3>
+            <table class="hotspot-table">
+                <tr><th>순위</th><th>위치</th><th>{{ table.score_label }}</th><th>세부</th></tr>
+                {% for row in table.rows %}
+                <tr>
+                    <td>{{ loop.index }}</td>
+                    <td>{{ row.location }}</td>
+                    <td class="score">{{ row.score }}</td>
+                    <td>{{ row.detail }}</td>
+                </tr>
+                {% endfor %}
+            </table>
+            {% endfor %}
+        </div>
+        {% endif %}
+        
+        {% if skipped_files %}
+        <div class="section">
+            <h2>⏭️ 분석에서 제외된 파일</h2>
             <ul class="issue-list">
-                {% for issue in all_issues %}
-                <li class="issue-item {{ issue.severity }}">
-                    <span class="severity {{ issue.severity }}">{{ issue.severity.upper() }}</span>
-                    <strong>{{ issue.file }}</strong><br>
-                    {{ issue.message }}
+                {% for skipped in skipped_files %}
+                <li class="issue-item low">
+                    <strong>{{ skipped.file }}</strong><br>
+                    {{ skipped.description }} ({{ skipped.lines }}줄)
+                </li>
+                {% endfor %}
+            </ul>
+        </div>
+        {% endif %}
+        
+        {% if vendored %}
+        <div class="section">
+            <h2>📦 복사된 것으로 보이는 디렉토리</h2>
+            <ul class="issue-list">
+                {% for item in vendored %}
+                <li class="issue-item low">
+                    <strong>{{ item.directory }}/</strong><br>
+                    {{ item.original }}/ 와 유사도 {{ (item.similarity * 100)|round|int }}%
+                    ({{ item.files }}개 파일, {{ item.lines }}줄)
                 </li>
                 {% endfor %}
             </ul>
         </div>
+        {% endif %}
+        
+        <div class="section">
+            <h2>⚠️ 발견된 이슈</h2>
+            {% if issue_pages %}
+            <ul class="page-list">
+                {% for page in issue_pages %}
+                <li><a href="{{ page.href }}">{{ page.title }}</a> ({{ page.count }}개)</li>
+                {% endfor %}
+            </ul>
+            {% else %}
+            {% include 'issue_list.html' %}
+            {% endif %}
+        </div>
         
         <div class="section">
             <h2>💡 개선 권장 사항</h2>
@@ -257,44 +360,191 @@ class ReportGenerator:
 </html>
 """
     
+    ISSUE_LIST_TEMPLATE = """
+            <ul class="issue-list">
+                {% for issue in all_issues %}
+                <li class="issue-item {{ issue.severity }}">
+                    <span class="severity {{ issue.severity }}">{{ issue.severity.upper() }}</span>
+                    <strong>{{ issue.file }}</strong><br>
+                    {{ issue.message }}
+                </li>
+                {% endfor %}
+            </ul>
+"""
+    
+    PAGE_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }} - 코드 품질 분석 리포트</title>
+    {% include 'style.html' %}
+</head>
+<body>
+    <div class="container">
+        <p><a class="back-link" href="{{ index_href }}">← 리포트 요약으로</a></p>
+        <h1>⚠️ {{ title }}</h1>
+        {% include 'issue_list.html' %}
+    </div>
+</body>
+</html>
+"""
+    
+    # 모든 인스턴스가 공유하는 컴파일된 템플릿 환경
+    _environment = None
+    
     def __init__(self, analysis_results: Dict):
         self.results = analysis_results
     
-    def generate_html(self, output_path: str = "report.html"):
-        """HTML 리포트 생성"""
-        template = Template(self.HTML_TEMPLATE)
+    @classmethod
+    def _get_template(cls, name: str):
+        """컴파일된 템플릿 (처음 한 번만 컴파일하고 이후에는 재사용)"""
+        if cls._environment is None:
+            # Jinja는 HTML 리포트를 만들 때만 불러옴
+            from jinja2 import DictLoader, Environment
+            
+            cls._environment = Environment(loader=DictLoader({
+                'report.html': cls.HTML_TEMPLATE,
+                'page.html': cls.PAGE_TEMPLATE,
+                'issue_list.html': cls.ISSUE_LIST_TEMPLATE,
+                'style.html': cls.STYLE_TEMPLATE
+            }))
+        return cls._environment.get_template(name)
+    
+    @staticmethod
+    def _write_template(template, output_file: Path, **context):
+        """렌더링 결과를 메모리에 모으지 않고 조각 단위로 파일에 기록"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for chunk in template.generate(**context):
+                f.write(chunk)
+    
+    def _issue_lists(self) -> List[list]:
+        return [
+            self.results.get('issues', []),
+            self.results.get('readability', {}).get('issues', []),
+            self.results.get('structure', {}).get('issues', []),
+            self.results.get('duplicates', {}).get('issues', [])
+        ]
+    
+    @staticmethod
+    def _iter_by_severity(issue_lists: List[list]) -> Iterator:
+        """심각도 순서(high, medium, 그 외)로 이슈 생성 (목록을 복사해 정렬하지 않음)"""
+        for rank in range(3):
+            for issues in issue_lists:
+                for issue in issues:
+                    if _SEVERITY_ORDER.get(issue.get('severity', 'low'), 2) == rank:
+                        yield issue
+    
+    def generate_html(self, output_path: str = "report.html", page_size: int = 0,
+                      split_by_directory: bool = False):
+        """HTML 리포트 생성
         
-        # 데이터 준비
-        all_issues = []
-        all_issues.extend(self.results.get('issues', []))
-        all_issues.extend(self.results.get('readability', {}).get('issues', []))
-        all_issues.extend(self.results.get('structure', {}).get('issues', []))
+        page_size가 있으면 이슈를 그 개수씩 나눈 페이지로, split_by_directory가 참이면
+        디렉토리별 페이지로 저장하고 요약 페이지에는 목차만 남깁니다.
+        """
+        output_file = Path(output_path)
+        issue_lists = self._issue_lists()
+        total_issues = sum(len(issues) for issues in issue_lists)
         
-        # 심각도별 정렬
-        severity_order = {'high': 0, 'medium': 1, 'low': 2}
-        all_issues.sort(key=lambda x: severity_order.get(x.get('severity', 'low'), 2))
+        issue_pages = None
+        if split_by_directory:
+            issue_pages = self._write_directory_pages(output_file, issue_lists)
+        elif page_size and total_issues > page_size:
+            issue_pages = self._write_numbered_pages(output_file, issue_lists, page_size)
         
         # 권장 사항 생성
         recommendations = self._generate_recommendations()
         
-        html_content = template.render(
+        self._write_template(
+            self._get_template('report.html'),
+            output_file,
             overall_score=self.results.get('overall_score', 0),
             grade=self.results.get('grade', 'F'),
             files_analyzed=self.results.get('files_analyzed', 0),
             total_lines=self.results.get('total_lines', 0),
-            total_issues=len(all_issues),
+            total_issues=total_issues,
             avg_complexity=round(self.results.get('complexity', {}).get('avg', 0), 1),
             languages=self.results.get('languages', {}),
-            all_issues=all_issues,
+            skipped_files=self.results.get('skipped_files', []),
+            vendored=self.results.get('vendored', []),
+            hotspot_tables=self._hotspot_tables(),
+            all_issues=self._iter_by_severity(issue_lists),
+            issue_pages=issue_pages,
             recommendations=recommendations,
             timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         )
         
-        output_file = Path(output_path)
-        output_file.write_text(html_content, encoding='utf-8')
-        
         return str(output_file.absolute())
     
+    def _hotspot_tables(self) -> List[Dict]:
+        """순위별 핫스팟 표 (항목이 없는 순위는 생략)"""
+        hotspots = self.results.get('hotspots', {})
+        files = hotspots.get('files', {})
+        functions = hotspots.get('functions', {})
+        tables = [
+            ('변경이 잦은 복잡한 파일', '복잡도 × 커밋 수', files.get('churn', []), _file_detail),
+            ('복잡도가 높은 파일', '복잡도', files.get('complexity', []), _file_detail),
+            ('이슈 밀도가 높은 파일', '100줄당 이슈', files.get('issue_density', []), _file_detail),
+            ('긴 파일', '줄 수', files.get('lines', []), _file_detail),
+            ('복잡도가 높은 함수', '복잡도', functions.get('complexity', []), _function_detail),
+            ('긴 함수', '줄 수', functions.get('length', []), _function_detail),
+        ]
+        return [
+            {'title': title, 'score_label': score_label,
+             'rows': [{'score': item['score'], **detail(item)} for item in items]}
+            for title, score_label, items, detail in tables if items
+        ]
+    
+    def _pages_dir(self, output_file: Path) -> Path:
+        pages_dir = output_file.with_name(f'{output_file.stem}_files')
+        pages_dir.mkdir(parents=True, exist_ok=True)
+        return pages_dir
+    
+    def _write_page(self, output_file: Path, pages_dir: Path, file_name: str,
+                    title: str, issues) -> Dict:
+        """이슈 페이지 하나를 기록하고 목차 항목 반환"""
+        self._write_template(
+            self._get_template('page.html'),
+            pages_dir / file_name,
+            title=title,
+            index_href=f'../{output_file.name}',
+            all_issues=issues
+        )
+        return {'href': f'{pages_dir.name}/{file_name}', 'title': title, 'count': len(issues)}
+    
+    def _write_numbered_pages(self, output_file: Path, issue_lists: List[list],
+                              page_size: int) -> List[Dict]:
+        """심각도 순으로 page_size개씩 페이지 기록"""
+        pages_dir = self._pages_dir(output_file)
+        pages = []
+        page = []
+        for issue in self._iter_by_severity(issue_lists):
+            page.append(issue)
+            if len(page) == page_size:
+                number = len(pages) + 1
+                pages.append(self._write_page(output_file, pages_dir, f'issues-{number:04d}.html',
+                                              f'이슈 {number}페이지', page))
+                page = []
+        if page:
+            number = len(pages) + 1
+            pages.append(self._write_page(output_file, pages_dir, f'issues-{number:04d}.html',
+                                          f'이슈 {number}페이지', page))
+        return pages
+    
+    def _write_directory_pages(self, output_file: Path, issue_lists: List[list]) -> List[Dict]:
+        """디렉토리별로 이슈 페이지 기록"""
+        by_directory = defaultdict(list)
+        for issue in self._iter_by_severity(issue_lists):
+            by_directory[str(Path(issue.get('file', '')).parent)].append(issue)
+        
+        pages_dir = self._pages_dir(output_file)
+        return [
+            self._write_page(output_file, pages_dir, f'dir-{number:04d}.html', directory,
+                             by_directory[directory])
+            for number, directory in enumerate(sorted(by_directory), start=1)
+        ]
+    
     def _generate_recommendations(self) -> list:
         """분석 결과 기반 권장 사항 생성"""
         recommendations = []
@@ -324,6 +574,12 @@ class ReportGenerator:
         if structure_issues > 3:
             recommendations.append("코드 구조를 개선하세요. 모듈화와 관심사 분리를 적용하세요.")
         
+        # 중복 관련
+        duplicate_blocks = self.results.get('duplicates', {}).get('blocks', 0)
+        if duplicate_blocks:
+            recommendations.append(f"중복된 코드 블록 {duplicate_blocks}개가 있습니다. "
+                                   f"공통 함수나 모듈로 추출하세요.")
+        
         if not recommendations:
             recommendations.append("전반적으로 양호한 코드 품질을 보이고 있습니다. 계속 유지하세요!")
         
@@ -0,0 +1,147 @@
+"""
+분석 결과 캐시
+파일 내용 해시를 키로 파일별 분석 결과를 디스크에 저장합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 보관할 저장소 스냅샷 수
+MAX_SNAPSHOTS = 20
+
+# 접근 시각 갱신 주기 (초) - 적중할 때마다 쓰기가 발생하지 않도록 함
+_TOUCH_INTERVAL = 3600
+
+
+def default_cache_dir() -> Path:
+    """기본 캐시 디렉토리 (XDG_CACHE_HOME 우선)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'portfolio-code-analyzer'
+
+
+class ResultCache:
+    """SQLite 기반 내용 주소 지정(content-addressed) 결과 캐시
+
+    키는 파일 내용, 확장자, 분석기 버전의 해시이므로 경로가 바뀌어도 재사용되고
+    분석 로직이 바뀌면 자동으로 무효화됩니다. 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, cache_dir: Path, version: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # 병렬 작업자가 같은 파일을 공유하므로 WAL 모드와 자동 커밋 사용
+        self._conn = sqlite3.connect(str(self.cache_dir / 'results.sqlite3'),
+                                     timeout=30, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, data BLOB NOT NULL, '
+            'size INTEGER NOT NULL, accessed REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS snapshots ('
+            'key TEXT PRIMARY KEY, data BLOB NOT NULL, created REAL NOT NULL)'
+        )
+        self._size = self._total_size()
+
+    def key(self, data: bytes, suffix: str) -> str:
+        """파일 내용과 확장자로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        digest.update(f'{self.version}\0{suffix}\0'.encode('utf-8'))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def blob_key(self, blob_id: str, suffix: str) -> str:
+        """git blob ID와 확장자로 캐시 키 생성 (내용을 읽지 않고 조회할 때 사용)"""
+        digest = hashlib.sha256()
+        digest.update(f'{self.version}\0{suffix}\0blob\0{blob_id}'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시된 결과 조회 (없으면 None)"""
+        row = self._conn.execute(
+            'SELECT data, accessed FROM results WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        if now - row[1] > _TOUCH_INTERVAL:
+            self._conn.execute('UPDATE results SET accessed = ? WHERE key = ?', (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict):
+        """결과 저장 후 필요하면 오래된 항목 삭제"""
+        data = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._conn.execute(
+            'INSERT OR REPLACE INTO results (key, data, size, accessed) VALUES (?, ?, ?, ?)',
+            (key, data, len(data), time.time())
+        )
+        self._size += len(data)
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def get_snapshot(self, key: str) -> Optional[List[Dict]]:
+        """커밋 단위로 저장된 파일별 결과 목록 조회"""
+        row = self._conn.execute('SELECT data FROM snapshots WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_snapshot(self, key: str, file_results: List[Dict]):
+        """파일별 결과 목록 저장 (최근 MAX_SNAPSHOTS개만 유지)"""
+        data = json.dumps(file_results, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._conn.execute(
+            'INSERT OR REPLACE INTO snapshots (key, data, created) VALUES (?, ?, ?)',
+            (key, data, time.time())
+        )
+        self._conn.execute(
+            'DELETE FROM snapshots WHERE key NOT IN '
+            '(SELECT key FROM snapshots ORDER BY created DESC LIMIT ?)', (MAX_SNAPSHOTS,)
+        )
+
+    def close(self):
+        """연결 종료"""
+        self._conn.close()
+
+    def _total_size(self) -> int:
+        return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def _evict(self):
+        """전체 크기가 한도의 90% 이하가 될 때까지 LRU 순으로 삭제"""
+        # 다른 프로세스도 기록하므로 실제 크기를 다시 계산
+        self._size = self._total_size()
+        target = int(self.max_bytes * 0.9)
+        if self._size <= target:
+            return
+
+        excess = self._size - target
+        freed = 0
+        keys = []
+        for key, size in self._conn.execute('SELECT key, size FROM results ORDER BY accessed'):
+            keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany('DELETE FROM results WHERE key = ?', keys)
+        self._size -= freed
@@ -0,0 +1,409 @@
+"""
+포트폴리오 코드 품질 검증기 - 로컬 분석 서버
+CodeAnalyzer와 ReportGenerator를 HTTP/JSON 서비스로 제공합니다. 작업자
+프로세스 풀과 결과 캐시를 계속 유지하므로 요청마다 CLI를 실행할 때보다
+응답이 빠릅니다.
+
+    python server.py --port 8765 --allow-root /srv/candidates
+
+    POST /analyze            {"path": "/srv/candidates/kim", "report": "html"}
+    POST /analyze/archive    (본문: zip 또는 tar 파일, ?report=issues)
+    GET  /health
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import asyncio
+import io
+import json
+import os
+import tempfile
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from cli_options import CACHE_OPTIONS, apply_options
+from code_analyzer import ANALYZER_VERSION, DEFAULT_MAX_FILE_SIZE, CodeAnalyzer, create_process_pool
+from console import configure_console_encoding
+from formatters import summarize
+from issues import Issue, IssueType
+from result_cache import DEFAULT_MAX_BYTES, default_cache_dir
+
+# Windows에서 인코딩 초기화
+configure_console_encoding()
+
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_UPLOAD = 64 * 1024 * 1024
+
+# 요청 헤더를 기다리는 최대 시간 (초)
+HEADER_TIMEOUT = 10
+
+# 요청 헤더의 최대 개수와 전체 크기 (바이트) - 넘으면 431로 응답
+MAX_HEADERS = 100
+MAX_HEADER_BYTES = 64 * 1024
+
+# 요청 본문을 모두 받기까지 기다리는 최대 시간 (초) - 느린 클라이언트가 연결을 붙잡지 못하도록
+BODY_TIMEOUT = 60
+
+# report 필드에 지정할 수 있는 값
+REPORT_KINDS = ('html', 'issues')
+
+_STATUS_TEXT = {
+    200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found',
+    405: 'Method Not Allowed', 411: 'Length Required', 413: 'Payload Too Large',
+    429: 'Too Many Requests', 431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error', 503: 'Service Unavailable'
+}
+
+
+class RequestError(Exception):
+    """클라이언트에 오류 응답으로 돌려줄 예외"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _relative_path(path: str, root: Path) -> str:
+    """root 아래 경로면 root 기준 상대 경로 (POSIX 형식), 아니면 그대로"""
+    try:
+        return Path(path).relative_to(root).as_posix()
+    except ValueError:
+        return path
+
+
+def _relativize_results(value, root: Path):
+    """분석 결과의 파일 경로('file' 값, 이슈의 파일과 중복 원본)를 root 기준으로 바꿈
+
+    요약과 리포트가 같은 결과에서 만들어지도록 제자리에서 바꿉니다.
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == 'file' and isinstance(item, str):
+                value[key] = _relative_path(item, root)
+            else:
+                _relativize_results(item, root)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, Issue):
+                args = item.args
+                if item.code == IssueType.DUPLICATE_CODE:
+                    args = (*args[:2], _relative_path(args[2], root), *args[3:])
+                value[index] = Issue(_relative_path(item.file, root), item.code, args)
+            else:
+                _relativize_results(item, root)
+
+
+class AnalysisServer:
+    """asyncio 기반 로컬 분석 서버
+
+    요청은 크기가 정해진 대기열에 들어가고, concurrency개의 실행기가 하나씩
+    꺼내 분석합니다. 파일 분석은 서버 시작 시 띄운 작업자 프로세스 풀이
+    모든 요청에 대해 나눠 처리하며, 결과 캐시도 모든 작업자가 공유합니다.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, jobs: int = 0,
+                 concurrency: int = 2, queue_size: int = 16, per_client: int = 2,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 max_upload: int = DEFAULT_MAX_UPLOAD,
+                 allowed_roots: Optional[List[str]] = None):
+        self.host = host
+        self.port = port
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.per_client = per_client
+        self.max_upload = max_upload
+        # 지정하지 않으면 서버를 실행한 디렉토리 아래만 허용
+        self.allowed_roots = [Path(root).resolve() for root in allowed_roots or [os.getcwd()]]
+        self.analyzer_options = {
+            'cache_dir': cache_dir,
+            'cache_max_bytes': cache_max_bytes,
+            'max_file_size': max_file_size
+        }
+        self._queue = None
+        self._pool = None
+        self._threads = None
+        self._active = 0
+        # 클라이언트별 대기 중이거나 실행 중인 요청 수
+        self._client_requests = defaultdict(int)
+
+    async def serve_forever(self):
+        """작업자를 미리 띄운 뒤 요청 처리 시작"""
+        options = CodeAnalyzer('.', **self.analyzer_options)._worker_options()
+        self._pool = create_process_pool(self.jobs, options)
+        self._threads = ThreadPoolExecutor(max_workers=self.concurrency)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        loop = asyncio.get_running_loop()
+        try:
+            # 첫 요청이 프로세스 생성 비용을 치르지 않도록 작업자를 미리 띄움
+            await asyncio.gather(*(loop.run_in_executor(self._pool, os.getpid)
+                                   for _ in range(self.jobs)))
+            runners = [asyncio.create_task(self._runner()) for _ in range(self.concurrency)]
+            server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+            print(f"분석 서버 시작: http://{self.host}:{self.port} "
+                  f"(작업자 {self.jobs}개, 동시 분석 {self.concurrency}개)")
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                for runner in runners:
+                    runner.cancel()
+        finally:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _runner(self):
+        """대기열에서 요청을 꺼내 스레드에서 분석 (파일 분석은 프로세스 풀이 담당)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            job, future = await self._queue.get()
+            self._active += 1
+            try:
+                result = await loop.run_in_executor(self._threads, job)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._active -= 1
+                self._queue.task_done()
+
+    async def _submit(self, client: str, job) -> Dict:
+        """요청을 대기열에 넣고 결과를 기다림 (대기열이 가득 차거나 클라이언트 한도를 넘으면 거부)"""
+        if self._client_requests.get(client, 0) >= self.per_client:
+            raise RequestError(429, f'동시 요청은 클라이언트당 {self.per_client}개까지입니다.')
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            raise RequestError(503, '분석 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.')
+
+        self._client_requests[client] += 1
+        try:
+            return await future
+        finally:
+            self._client_requests[client] -= 1
+            if not self._client_requests[client]:
+                del self._client_requests[client]
+
+    def _analyze(self, target: Path, report: Optional[str], ignore_patterns: List[str],
+                 use_gitignore: bool, relative_to: Optional[Path] = None) -> Dict:
+        """분석 실행 (스레드에서 호출, relative_to가 있으면 파일 경로를 그 기준으로 표시)"""
+        analyzer = CodeAnalyzer(str(target), ignore_patterns=ignore_patterns,
+                                use_gitignore=use_gitignore, jobs=self.jobs,
+                                executor=self._pool, **self.analyzer_options)
+        if report is None:
+            # 요약만 필요하면 이슈 목록을 쌓지 않음
+            for kind, results in analyzer.analyze_iter(retain_issues=False):
+                pass
+        else:
+            results = analyzer.analyze()
+        if relative_to is not None:
+            _relativize_results(results, relative_to)
+
+        response = {'version': ANALYZER_VERSION, 'summary': summarize(results)}
+        if report == 'issues':
+            response['issues'] = [issue.to_dict() for issues in
+                                  (results['issues'], results['readability']['issues'],
+                                   results['structure']['issues'],
+                                   results['duplicates']['issues'])
+                                  for issue in issues]
+        elif report == 'html':
+            from reporter import ReportGenerator
+
+            with tempfile.TemporaryDirectory() as output_dir:
+                output = Path(output_dir) / 'report.html'
+                ReportGenerator(results).generate_html(str(output))
+                response['report_html'] = output.read_text(encoding='utf-8')
+        return response
+
+    def _analyze_archive(self, data: bytes, report: Optional[str], ignore_patterns: List[str],
+                         use_gitignore: bool) -> Dict:
+        """업로드된 압축 파일을 임시 파일로 저장해 풀지 않고 분석 (스레드에서 호출)"""
+        # 압축 방식은 내용으로 판별하므로 확장자는 zip/tar 구분에만 사용
+        suffix = '.zip' if zipfile.is_zipfile(io.BytesIO(data)) else '.tar'
+        with tempfile.TemporaryDirectory(prefix='analyzer-upload-') as work_dir:
+            archive_path = Path(work_dir) / f'upload{suffix}'
+            archive_path.write_bytes(data)
+            try:
+                # 임시 경로 대신 압축 파일 기준 상대 경로로 표시
+                return self._analyze(archive_path, report, ignore_patterns, use_gitignore,
+                                     relative_to=archive_path)
+            except ValueError as e:
+                raise RequestError(400, str(e).replace(str(archive_path), archive_path.name))
+
+    def _check_target(self, path: str) -> Path:
+        target = Path(path).expanduser().resolve()
+        if not any(target == root or root in target.parents for root in self.allowed_roots):
+            raise RequestError(403, f'분석이 허용되지 않은 경로입니다: {path}')
+        if not target.exists():
+            raise RequestError(404, f'경로를 찾을 수 없습니다: {path}')
+        return target
+
+    @staticmethod
+    def _report_kind(value) -> Optional[str]:
+        if value in (None, ''):
+            return None
+        if value not in REPORT_KINDS:
+            raise RequestError(400, f"report는 {', '.join(REPORT_KINDS)} 중 하나여야 합니다.")
+        return value
+
+    async def _dispatch(self, method: str, target: str, body: bytes, client: str) -> Dict:
+        url = urlsplit(target)
+        if url.path == '/health':
+            if method != 'GET':
+                raise RequestError(405, 'GET만 지원합니다.')
+            return {
+                'status': 'ok',
+                'version': ANALYZER_VERSION,
+                'workers': self.jobs,
+                'active': self._active,
+                'queued': self._queue.qsize(),
+                'queue_size': self.queue_size
+            }
+
+        if url.path not in ('/analyze', '/analyze/archive'):
+            raise RequestError(404, f'알 수 없는 경로입니다: {url.path}')
+        if method != 'POST':
+            raise RequestError(405, 'POST만 지원합니다.')
+
+        if url.path == '/analyze/archive':
+            if not body:
+                raise RequestError(400, '요청 본문에 압축 파일이 없습니다.')
+            query = parse_qs(url.query)
+            report = self._report_kind(query.get('report', [None])[0])
+            ignore_patterns = query.get('ignore', [])
+            use_gitignore = query.get('gitignore', ['1'])[0] not in ('0', 'false')
+            return await self._submit(client, lambda: self._analyze_archive(
+                body, report, ignore_patterns, use_gitignore))
+
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            raise RequestError(400, '요청 본문이 JSON 형식이 아닙니다.')
+        if not isinstance(request, dict) or not isinstance(request.get('path'), str):
+            raise RequestError(400, '분석할 경로(path)가 필요합니다.')
+        target = self._check_target(request['path'])
+        report = self._report_kind(request.get('report'))
+        ignore_patterns = [str(pattern) for pattern in request.get('ignore', [])]
+        use_gitignore = bool(request.get('gitignore', True))
+        return await self._submit(client, lambda: self._analyze(
+            target, report, ignore_patterns, use_gitignore))
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        """요청 줄, 헤더, 본문 읽기 (Content-Length 본문만 지원)"""
+        request_line = await asyncio.wait_for(reader.readline(), HEADER_TIMEOUT)
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise RequestError(400, '잘못된 요청입니다.')
+        method, target, _ = parts
+
+        headers = {}
+        header_count = header_bytes = 0
+        while True:
+            try:
+                line = await asyncio.wait_for(reader.readline(), HEADER_TIMEOUT)
+            except ValueError:
+                # 한 줄이 StreamReader 버퍼 한도를 넘음
+                raise RequestError(431, '요청 헤더가 너무 큽니다.')
+            if line in (b'\r\n', b'\n', b''):
+                break
+            header_count += 1
+            header_bytes += len(line)
+            if header_count > MAX_HEADERS or header_bytes > MAX_HEADER_BYTES:
+                raise RequestError(431, '요청 헤더가 너무 큽니다.')
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raise RequestError(411, 'Content-Length가 필요합니다.')
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise RequestError(400, 'Content-Length가 올바르지 않습니다.')
+        if length > self.max_upload:
+            raise RequestError(413, f'요청 본문이 {self.max_upload // (1024 * 1024)}MB를 넘습니다.')
+        body = await asyncio.wait_for(reader.readexactly(length), BODY_TIMEOUT) if length else b''
+        return method.upper(), target, body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """연결 하나에서 요청 하나를 처리하고 응답 후 종료"""
+        peer = writer.get_extra_info('peername')
+        client = peer[0] if isinstance(peer, tuple) else str(peer)
+        try:
+            try:
+                method, target, body = await self._read_request(reader)
+                status, payload = 200, await self._dispatch(method, target, body, client)
+            except RequestError as e:
+                status, payload = e.status, {'error': str(e)}
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                return
+            except Exception as e:
+                status, payload = 500, {'error': f'분석 중 오류: {e}'}
+
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            writer.write(
+                f'HTTP/1.1 {status} {_STATUS_TEXT[status]}\r\n'
+                f'Content-Type: application/json; charset=utf-8\r\n'
+                f'Content-Length: {len(data)}\r\n'
+                f'Connection: close\r\n\r\n'.encode('latin-1') + data)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='바인드 주소')
+@click.option('--port', default=DEFAULT_PORT, type=int, show_default=True, help='포트')
+@click.option('-j', '--jobs', default=0, type=click.IntRange(min=0), show_default=True,
+              help='작업자 프로세스 수 (0이면 CPU 코어 수)')
+@click.option('--concurrency', default=2, type=click.IntRange(min=1), show_default=True,
+              help='동시에 분석할 요청 수')
+@click.option('--queue-size', default=16, type=click.IntRange(min=1), show_default=True,
+              help='대기열 크기 (가득 차면 503 응답)')
+@click.option('--per-client', default=2, type=click.IntRange(min=1), show_default=True,
+              help='클라이언트(IP)당 동시 요청 수 (넘으면 429 응답)')
+@click.option('--allow-root', 'allowed_roots', multiple=True, type=click.Path(file_okay=False),
+              help='이 디렉토리 아래 경로만 분석 허용 (여러 번 지정 가능, 기본: 현재 디렉토리)')
+@click.option('--max-upload', default=64, type=click.IntRange(min=1), show_default=True,
+              help='업로드 압축 파일 최대 크기 (MB)')
+@apply_options(CACHE_OPTIONS)
+def main(host, port, jobs, concurrency, queue_size, per_client, allowed_roots, max_upload,
+         cache_dir, cache_size, no_cache, max_file_size):
+    """
+    로컬 분석 서버 실행
+    """
+    server = AnalysisServer(host=host, port=port, jobs=jobs, concurrency=concurrency,
+                            queue_size=queue_size, per_client=per_client,
+                            cache_dir=None if no_cache else str(cache_dir or default_cache_dir()),
+                            cache_max_bytes=cache_size * 1024 * 1024,
+                            max_file_size=max_file_size * 1024,
+                            max_upload=max_upload * 1024 * 1024,
+                            allowed_roots=list(allowed_roots))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n분석 서버 종료")
+
+
+if __name__ == '__main__':
+    main()
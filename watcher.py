@@ -0,0 +1,136 @@
+"""
+감시 모드
+파일별 분석 결과를 메모리에 두고, 추가/수정/삭제된 파일만 다시 분석해
+전체 결과와 점수를 새로 계산합니다.
+
+Copyright (c) 2025 Gaon
+All rights reserved.
+
+이 소프트웨어는 저작권법에 의해 보호됩니다.
+무단 복제, 배포, 수정을 금지합니다.
+사용 시 반드시 출처를 명시해야 합니다.
+
+원본 출처: https://github.com/Gaon/portfolio-code-analyzer
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from code_analyzer import CodeAnalyzer
+
+# 파일 상태 (수정 시각 ns, 크기) - 둘 중 하나라도 바뀌면 다시 분석
+FileState = Tuple[int, int]
+
+
+class Watcher:
+    """바뀐 파일만 다시 분석하는 감시기
+
+    기본은 interval초마다 대상 디렉토리를 다시 훑어 파일별 수정 시각과 크기를
+    비교합니다. watchdog 패키지가 있으면 inotify 등 운영체제 알림을 받는 즉시
+    같은 비교를 하므로 저장 직후 바로 반영됩니다 (알림은 깨우는 용도로만 씀).
+    """
+
+    def __init__(self, analyzer: CodeAnalyzer, interval: float = 1.0,
+                 retain_issues: bool = True):
+        self.analyzer = analyzer
+        self.interval = interval
+        self.retain_issues = retain_issues
+        # 분석 전에 상태를 기록해 분석 중에 바뀐 파일도 첫 확인에서 다시 분석
+        self._states = self._scan()
+        self._results: Dict[str, Dict] = {}
+        # 마지막으로 다시 분석하고 전체 결과를 계산하는 데 걸린 시간 (초)
+        self.last_refresh = 0.0
+        self._wake = None
+        self._observer = None
+
+    @property
+    def file_results(self) -> List[Dict]:
+        """파일 순서대로 정렬한 파일별 결과"""
+        return [self._results[str(path)] for path in self._states
+                if str(path) in self._results]
+
+    def track(self, file_results: List[Dict]):
+        """처음 전체 분석한 파일별 결과를 보관"""
+        self._results = {file_result['file']: file_result for file_result in file_results}
+
+    def _scan(self) -> Dict[Path, FileState]:
+        """분석 대상 파일과 상태 (수집 순서 유지)"""
+        states = {}
+        for file_path in self.analyzer._collect_code_files():
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            states[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return states
+
+    def poll(self) -> Tuple[List[Path], List[Path]]:
+        """(추가되거나 바뀐 파일, 삭제된 파일)"""
+        states = self._scan()
+        changed = [path for path, state in states.items() if self._states.get(path) != state]
+        deleted = [path for path in self._states if path not in states]
+        self._states = states
+        return changed, deleted
+
+    def refresh(self, changed: List[Path], deleted: List[Path]) -> Dict:
+        """바뀐 파일만 다시 분석하고 전체 결과를 다시 계산"""
+        analyzer = self.analyzer
+        started = time.perf_counter()
+        for path in deleted:
+            self._results.pop(str(path), None)
+        for file_result in analyzer._iter_file_results(changed):
+            analyzer.profiler.record_file(file_result)
+            self._results[file_result['file']] = file_result
+        results = analyzer.rebuild(self.file_results, self.retain_issues)
+        self.last_refresh = time.perf_counter() - started
+        return results
+
+    def watch(self, on_update: Callable[[Dict, List[Path], List[Path]], None],
+              stop: Optional[threading.Event] = None):
+        """파일이 바뀔 때마다 결과를 다시 계산해 on_update(결과, 바뀐 파일, 삭제된 파일) 호출
+
+        stop이 설정되거나 KeyboardInterrupt가 발생할 때까지 반복합니다.
+        """
+        stop = stop or threading.Event()
+        self._start_observer()
+        try:
+            while not stop.is_set():
+                if self._wake is not None:
+                    self._wake.wait(self.interval)
+                    self._wake.clear()
+                else:
+                    stop.wait(self.interval)
+                changed, deleted = self.poll()
+                if changed or deleted:
+                    on_update(self.refresh(changed, deleted), changed, deleted)
+        finally:
+            self._stop_observer()
+
+    def _start_observer(self):
+        """watchdog이 설치되어 있으면 운영체제 파일 알림 사용"""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return
+        wake = threading.Event()
+
+        class _WakeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+
+        root = self.analyzer.target_path
+        observer = Observer()
+        observer.schedule(_WakeHandler(), str(root if root.is_dir() else root.parent),
+                          recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._wake, self._observer = wake, observer
+
+    def _stop_observer(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._wake = self._observer = None